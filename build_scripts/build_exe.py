@@ -58,6 +58,14 @@ def build():
         '--collect-all', 'PySide6', 
         '--collect-all', 'shiboken6',
 
+        # Async printer client backends (imported inside try blocks)
+        '--hidden-import', 'aiohttp',
+        '--hidden-import', 'asyncssh',
+
+        # src.services / src.controllers import their modules lazily,
+        # which PyInstaller cannot follow
+        '--collect-submodules', 'src',
+
         # Include QSS themes
         # format is "source;dest" for Windows
         '--add-data', f"src/views/themes{os.pathsep}src/views/themes",
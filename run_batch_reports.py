@@ -0,0 +1,127 @@
+"""
+Batch Report Builder - write a report for every step of a capture directory.
+
+Headless counterpart of the Report Builder window (no Qt needed): finds
+every "N. " step prefix in the directory, builds each step's report in a
+pool of worker processes and writes it to "<output>/Step N Report.txt".
+Selections come from a JSON config file and/or flags (flags win):
+
+    {
+        "categories": ["UI", "EWS", "Alerts", "Supplies Public", "Telemetry"],
+        "colors": ["Cyan", "Magenta", "Yellow", "Black"],
+        "strategy": "Dune IIC",
+        "telemetry": "latest",
+        "steps": [1, 2, 3]
+    }
+
+Usage:
+    python run_batch_reports.py DIRECTORY [--config report.json]
+        [--categories UI EWS Alerts ...] [--colors Cyan Black ...]
+        [--strategy "Dune IIC"] [--telemetry latest|first|none]
+        [--steps 1 2 3] [--output DIR] [--workers N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Ensure the project root is in sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from src.controllers.report_controller import ReportBuilder, REPORT_CATEGORIES
+from src.controllers.strategies import DuneIICStrategy, DuneIPHStrategy
+from src.services.directory_index import get_directory_index
+
+STRATEGIES = {
+    "Dune IIC": DuneIICStrategy,
+    "Dune IPH": DuneIPHStrategy,
+}
+
+DEFAULT_OPTIONS = {
+    "categories": list(REPORT_CATEGORIES),
+    "colors": [],
+    "strategy": "Dune IIC",
+    "telemetry": "latest",
+    "steps": None,
+    "output": None,
+    "workers": None,
+}
+
+
+def build_step(directory, step, options):
+    """Build one step's report (runs in a worker process)."""
+    start = time.perf_counter()
+    strategy_class = STRATEGIES.get(options["strategy"])
+    builder = ReportBuilder(directory, step, strategy_class() if strategy_class else None)
+    text = builder.build_step_report(options["categories"], options["colors"], options["telemetry"])
+    return step, text, time.perf_counter() - start
+
+
+def _load_options(args):
+    """Defaults, overridden by the config file, overridden by flags."""
+    options = dict(DEFAULT_OPTIONS)
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            options.update({k: v for k, v in json.load(f).items() if k in DEFAULT_OPTIONS})
+    for key in DEFAULT_OPTIONS:
+        value = getattr(args, key, None)
+        if value is not None:
+            options[key] = value
+    return options
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", help="capture directory with step-prefixed files")
+    parser.add_argument("--config", help="JSON file with selections (see above)")
+    parser.add_argument("--categories", nargs="+", help="category names or keys to include")
+    parser.add_argument("--colors", nargs="+", help="colors to filter supplies, alerts and telemetry by")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), help="printer strategy")
+    parser.add_argument("--telemetry", choices=["latest", "first", "none"],
+                        help="telemetry file to include per color")
+    parser.add_argument("--steps", type=int, nargs="+", help="only these steps (default: all found)")
+    parser.add_argument("--output", help="directory for the reports (default: DIRECTORY/Reports)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    options = _load_options(args)
+    directory = os.path.abspath(args.directory)
+    if not os.path.isdir(directory):
+        parser.error(f"not a directory: {directory}")
+
+    steps = options["steps"] or get_directory_index(directory).steps()
+    if not steps:
+        print(f"No step-prefixed files in {directory}")
+        return 1
+
+    output = options["output"] or os.path.join(directory, "Reports")
+    os.makedirs(output, exist_ok=True)
+
+    print(f"{len(steps)} steps, strategy {options['strategy']}, colors {options['colors'] or 'none'}")
+    print(f"{'step':>6}  {'ms':>8}  file")
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+        futures = {executor.submit(build_step, directory, step, options): step for step in steps}
+        for future in as_completed(futures):
+            step = futures[future]
+            try:
+                step, text, seconds = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"{step:>6}  {'':>8}  failed: {e}")
+                continue
+            filepath = os.path.join(output, f"Step {step} Report.txt")
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(text)
+            print(f"{step:>6}  {seconds * 1000:>8.1f}  {os.path.basename(filepath)}")
+
+    print(f"total {time.perf_counter() - start:.2f} s, {len(steps) - failed} reports in {output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
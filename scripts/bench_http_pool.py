@@ -0,0 +1,113 @@
+"""
+Benchmark: per-request latency with and without the shared HTTP session pool.
+
+Starts a local HTTPS stand-in for a printer's CDM endpoint (self-signed
+certificate generated with the openssl CLI) and times N GETs done the old
+way (module-level requests.get, new TCP + TLS handshake each call) against
+CDMApiService going through the keep-alive session pool.
+
+Usage:
+    python scripts/bench_http_pool.py [--requests 200]
+"""
+import argparse
+import os
+import shutil
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure the project root is in sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from src.services.cdm_api import CDMApiService
+from src.services.http_pool import get_http_pool
+
+PAYLOAD = b'{"alerts": [{"id": 101, "category": "supply", "severity": "warning"}]}'
+
+
+class _CDMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def _make_cert(directory):
+    if not shutil.which("openssl"):
+        sys.exit("openssl CLI is required to generate the test certificate")
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+         "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=localhost"],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def _start_server(cert, key):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CDMHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _time_calls(fn, count):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label, samples):
+    print(f"{label:<28} mean {statistics.mean(samples):7.2f} ms   "
+          f"median {statistics.median(samples):7.2f} ms   "
+          f"p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200, help="GETs per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _make_cert(tmp)
+        server = _start_server(cert, key)
+        host = f"127.0.0.1:{server.server_address[1]}"
+        url = f"https://{host}/cdm/alert/v1/alerts"
+
+        try:
+            unpooled = _time_calls(lambda: requests.get(url, verify=False, timeout=5), args.requests)
+
+            service = CDMApiService(host)
+            service.fetch_alerts()  # warm the pool (first handshake)
+            pooled = _time_calls(service.fetch_alerts, args.requests)
+        finally:
+            get_http_pool().close_all()
+            server.shutdown()
+
+    print(f"{args.requests} requests per mode against {host}")
+    _report("requests.get (no pool)", unpooled)
+    _report("CDMApiService (pooled)", pooled)
+    print(f"speedup (mean): {statistics.mean(unpooled) / statistics.mean(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark: report regeneration with a cold vs warm document cache.
+
+Fills a temp directory with a synthetic test session - several steps of
+CDM supplies, supply assessment, DSR, alert and telemetry files, with
+hundreds of telemetry events in the step being reported - and regenerates
+that step's report the way the Report Builder window does on every
+checkbox or combo change: scan the step's files, label every telemetry
+file by color, then build the text. Timed three ways: with the cache
+dropped before each run (every file re-read and re-parsed, as before the
+cache), re-running with unchanged selections, and toggling one color on
+and off between runs (only the color-filtered sections are recomputed).
+
+Usage:
+    python scripts/bench_report_builder.py [--telemetry 400] [--steps 10] [--runs 20]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Ensure the project root is in sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.controllers.report_controller import ReportBuilder
+from src.controllers.strategies import DuneIICStrategy
+from src.services.document_cache import get_document_cache
+
+COLORS = ["Cyan", "Magenta", "Yellow", "Black"]
+CODES = ["C", "M", "Y", "K"]
+ALERT_IDS = [103, 104, 101, 102]
+
+
+def _cartridge(index, code):
+    return {
+        "publicInformation": {
+            "colors": [code],
+            "supplyColorCode": code,
+            "supplyState": "ok",
+            "estimatedPagesRemaining": 500 - index * 17,
+            "levelPercent": 80 - index,
+            "installDate": "2026-01-01",
+            "warrantyStatus": "inWarranty",
+        },
+        "privateInformation": {"counters": {f"counter{n}": n * index for n in range(40)}},
+    }
+
+
+def _write(directory, name, data):
+    with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+
+
+def _make_session(directory, steps, telemetry):
+    """Write every step's capture files; the last step gets the telemetry events."""
+    for step in range(1, steps + 1):
+        private = {f"inkCartridge{i}": _cartridge(i, code) for i, code in enumerate(CODES)}
+        private["version"] = "1.0"
+        _write(directory, f"{step}. CDM_suppliesPrivate.json", private)
+        _write(directory, f"{step}. CDM_suppliesPublic.json",
+               {"suppliesList": [_cartridge(i, code)["publicInformation"] for i, code in enumerate(CODES)]})
+        _write(directory, f"{step}. CDM_supplyAssessment.json",
+               {"supplyStates": {code: {"colorCode": code, "state": "ok", "reasons": ["none"] * 10}
+                                 for code in CODES}})
+        _write(directory, f"{step}. CDM_dsr.json",
+               {"supplyStatus": {"supplyStates": {code: {"supplyColorCode": code, "level": 50}
+                                                  for code in CODES}}})
+        _write(directory, f"{step}. CDM_alerts.json", {"alerts": [
+            {"id": 1000 + n, "category": "supply", "visibility": "user",
+             "data": [{"value": {"iValue": ALERT_IDS[n % 4]}}] * 3}
+            for n in range(12)
+        ]})
+        for n in range(telemetry if step == steps else 20):
+            _write(directory, f"{step}. Telemetry_{COLORS[n % 4]}_lowOnInk_event{n}.json", {
+                "sequenceNumber": n,
+                "eventDetail": {
+                    "identityInfo": {"supplyColorCode": CODES[n % 4]},
+                    "stateInfo": {"stateReasons": ["lowOnInk"], "counters": list(range(60))},
+                },
+            })
+
+
+def _regenerate(directory, step, strategy, colors):
+    """One window refresh: scan, label telemetry, pick one file per color, build."""
+    builder = ReportBuilder(directory, step, strategy)
+    found = builder.scan_files()
+    by_label = {}
+    for path in found["Telemetry"]:
+        by_label.setdefault(builder.get_telemetry_color_label_from_file(path), []).append(path)
+
+    selected = {key: found[key] for key in
+                ("alerts", "suppliesPrivate", "suppliesPublic", "supplyAssessment", "DSR Packet")}
+    selected["Telemetry"] = [paths[-1] for paths in by_label.values()]
+    return builder.generate_report(selected, colors)
+
+
+def _measure(label, run, runs):
+    run(0)  # warm up (and fill the cache for the cached cases)
+    start = time.perf_counter()
+    for i in range(runs):
+        report = run(i + 1)
+    elapsed = (time.perf_counter() - start) / runs
+    print(f"{label:<16}  {elapsed * 1000:>9.1f}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--telemetry", type=int, default=400, help="telemetry files in the reported step")
+    parser.add_argument("--steps", type=int, default=10, help="steps of captures in the directory")
+    parser.add_argument("--runs", type=int, default=20, help="regenerations per case")
+    args = parser.parse_args()
+
+    strategy = DuneIICStrategy()
+    cache = get_document_cache()
+    with tempfile.TemporaryDirectory() as directory:
+        _make_session(directory, args.steps, args.telemetry)
+        step = args.steps
+        print(f"{len(os.listdir(directory))} files, {args.telemetry} telemetry events in step {step}")
+        print(f"{'case':<16}  {'ms/report':>9}")
+
+        def uncached(_):
+            cache.invalidate()
+            return _regenerate(directory, step, strategy, COLORS)
+
+        def unchanged(_):
+            return _regenerate(directory, step, strategy, COLORS)
+
+        def toggle(i):
+            return _regenerate(directory, step, strategy, COLORS if i % 2 else COLORS[:3])
+
+        baseline = _measure("uncached", uncached, args.runs)
+        cached = _measure("unchanged", unchanged, args.runs)
+        _measure("toggle color", toggle, args.runs)
+
+        assert cached == baseline, "cached report differs from uncached one"
+        print(f"cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
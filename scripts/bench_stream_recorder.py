@@ -0,0 +1,140 @@
+"""
+Benchmark: memory per minute of always-on stream recording.
+
+Feeds StreamRecorder a simulated printer UI session - a busy spinner in
+the corner, a progress bar, and a page change every few seconds - with
+synthetic timestamps, so minutes of stream take seconds to run. Records
+it the VNC way (dirty rects with periodic keyframes) and the Sirius way
+(one PNG per changed frame), then reports buffer memory per minute of
+history, recording CPU per frame, and the time and size of exporting the
+last --export-seconds to an animated PNG. Sirius CPU includes encoding
+the PNGs the printer would have sent.
+
+Usage:
+    python scripts/bench_stream_recorder.py [--minutes 2] [--fps 10]
+                                            [--size 800 480] [--export-seconds 30]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Ensure the project root is in sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from src.services.stream_recorder import StreamRecorder
+from src.services.vnc_service import VNCFrameUpdate, VNCRect
+
+PAGE_SECONDS = 5.0
+SPINNER = 48
+
+
+def _render_page(width, height, page):
+    image = Image.new("RGB", (width, height), (24, 32, 48))
+    draw = ImageDraw.Draw(image)
+    for row in range(0, height - 80, 60):
+        draw.rectangle([20, row + 10, width - 20, row + 50], fill=(60, 80, 110))
+        draw.text((30, row + 22), f"Page {page}  menu item {row // 60}", fill=(230, 230, 230))
+    return image
+
+
+def _session(width, height, fps, seconds):
+    """
+    Yield (timestamp, screen, boxes) for each frame of the session.
+
+    boxes are the (left, top, right, bottom) regions that changed; the
+    screen image is reused and updated in place.
+    """
+    screen = _render_page(width, height, 0)
+    spinner = (width - SPINNER - 20, height - SPINNER - 20, width - 20, height - 20)
+    bar = (20, height - 60, width - SPINNER - 40, height - 40)
+    start = 1000.0
+    yield start, screen, [(0, 0, width, height)]
+
+    for index in range(1, int(seconds * fps)):
+        timestamp = start + index / fps
+        if index % int(PAGE_SECONDS * fps) == 0:
+            screen.paste(_render_page(width, height, index))
+            yield timestamp, screen, [(0, 0, width, height)]
+            continue
+        draw = ImageDraw.Draw(screen)
+        draw.rectangle(spinner, fill=(24, 32, 48))
+        draw.pieslice(spinner, index * 30, index * 30 + 90, fill=(0, 150, 220))
+        boxes = [spinner]
+        if index % fps == 0:
+            done = (index // fps) % 100 / 100
+            draw.rectangle(bar, fill=(40, 40, 40))
+            draw.rectangle((bar[0], bar[1], bar[0] + int((bar[2] - bar[0]) * done), bar[3]),
+                           fill=(80, 200, 120))
+            boxes.append(bar)
+        yield timestamp, screen, boxes
+
+
+def _record_vnc(recorder, session):
+    for timestamp, screen, boxes in session:
+        rects = [VNCRect(l, t, r - l, b - t, screen.crop((l, t, r, b)).tobytes()) for l, t, r, b in boxes]
+        recorder.record_update(VNCFrameUpdate(screen.width, screen.height, rects, timestamp=timestamp))
+        yield timestamp
+
+
+def _record_sirius(recorder, session):
+    for timestamp, screen, _ in session:
+        buffer = io.BytesIO()
+        screen.save(buffer, format="PNG")
+        recorder.record_encoded(buffer.getvalue(), timestamp)
+        yield timestamp
+
+
+def _run(label, record, args):
+    width, height = args.size
+    seconds = args.minutes * 60
+    # Keep everything so the buffer size is the cost of the whole session
+    recorder = StreamRecorder(retention_seconds=seconds + 1, memory_cap_bytes=1 << 40)
+
+    cpu = time.process_time()
+    frames = 0
+    end = 0.0
+    for end in record(recorder, _session(width, height, args.fps, seconds)):
+        frames += 1
+    cpu = time.process_time() - cpu
+    stats = recorder.stats()
+
+    fd, path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        wall = time.perf_counter()
+        written = recorder.export_apng(path, args.export_seconds, end_time=end + 1)
+        wall = time.perf_counter() - wall
+        size = os.path.getsize(path)
+    finally:
+        os.unlink(path)
+
+    per_minute = stats["bytes"] / max(stats["seconds"] / 60, 1e-9)
+    print(f"{label:<8}  {per_minute / 1e6:>9.2f}  {stats['keyframes']:>9}  "
+          f"{cpu / frames * 1000:>12.2f}  {wall:>9.2f}  {size / 1e6:>8.2f} ({written} frames)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=float, default=2, help="simulated session length")
+    parser.add_argument("--fps", type=int, default=10, help="frames per second while the screen changes")
+    parser.add_argument("--size", type=int, nargs=2, default=[800, 480], metavar=("W", "H"),
+                        help="screen size")
+    parser.add_argument("--export-seconds", type=float, default=30, help="history exported to APNG")
+    args = parser.parse_args()
+
+    raw = args.size[0] * args.size[1] * 3 * args.fps * 60
+    print(f"{args.size[0]}x{args.size[1]}, {args.fps} fps, {args.minutes:g} min "
+          f"(raw frames would be {raw / 1e6:.0f} MB/min)")
+    print(f"{'stream':<8}  {'MB/minute':>9}  {'keyframes':>9}  {'cpu ms/frame':>12}  "
+          f"{'export s':>9}  {'apng MB':>8}")
+    _run("vnc", _record_vnc, args)
+    _run("sirius", _record_sirius, args)
+
+
+if __name__ == "__main__":
+    main()
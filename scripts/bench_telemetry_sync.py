@@ -0,0 +1,119 @@
+"""
+Benchmark: full telemetry fetch vs incremental sync as the file count grows.
+
+Stands in for a printer by running SSHService's remote commands in a local
+shell against a temp directory full of event_* files. Each round adds one
+new event (like a soak run would) and times a refresh with the full
+fetch_telemetry() and with sync_telemetry(). Bytes are what the printer
+would send over the SSH channel.
+
+Usage:
+    python scripts/bench_telemetry_sync.py [--sizes 50 200 800 1600] [--rounds 5]
+                                           [--no-compress]
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Ensure the project root is in sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.ssh_service import SSHService
+
+
+class _LocalShellSSH(SSHService):
+    """SSHService whose commands run in a local shell instead of over SSH."""
+
+    def __init__(self, path, compressed=True):
+        super().__init__("127.0.0.1")
+        self.TELEMETRY_PATH = path.rstrip("/") + "/"
+        self.COMPRESSED_TRANSFER = compressed
+        self.bytes_received = 0
+
+    @property
+    def is_connected(self):
+        return True
+
+    def exec_command(self, command, timeout=30):
+        result = subprocess.run(["sh", "-c", command], capture_output=True, timeout=timeout)
+        self.bytes_received += len(result.stdout)
+        return result.stdout.decode("utf-8"), result.stderr.decode("utf-8"), result.returncode
+
+    def _open_command(self, command, timeout=30):
+        result = subprocess.run(["sh", "-c", command], capture_output=True, timeout=timeout)
+        self.bytes_received += len(result.stdout)
+        return io.BytesIO(result.stdout), lambda: result.returncode
+
+
+def _write_event(directory, sequence):
+    event = {
+        "sequenceNumber": sequence,
+        "eventDetail": {
+            "identityInfo": {"supplyColorCode": "CMYK"[sequence % 4]},
+            "stateInfo": {"stateReasons": ["lowOnInk"] if sequence % 3 else []},
+            "notificationTrigger": "stateChange",
+            # roughly the size of a real event file; hex digests so gzip
+            # can't shrink it better than it would real JSON
+            "padding": "".join(hashlib.sha256(f"{sequence}:{i}".encode()).hexdigest()
+                               for i in range(24)),
+        },
+    }
+    with open(os.path.join(directory, f"event_{sequence:06d}"), "w") as f:
+        json.dump(event, f)
+
+
+def _time_refresh(fn, ssh):
+    ssh.bytes_received = 0
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000, ssh.bytes_received
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 800, 1600],
+                        help="event file counts to measure at")
+    parser.add_argument("--rounds", type=int, default=5, help="refreshes per size")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="use the marker (cat) transfer instead of tar+gzip")
+    args = parser.parse_args()
+
+    print(f"transfer: {'markers' if args.no_compress else 'tar+gzip'}")
+    print(f"{'files':>6}  {'full ms':>9}  {'full KB':>8}  {'sync ms':>9}  {'sync KB':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full_ssh = _LocalShellSSH(tmp, compressed=not args.no_compress)
+        sync_ssh = _LocalShellSSH(tmp, compressed=not args.no_compress)
+        sequence = 0
+
+        for size in sorted(args.sizes):
+            while sequence < size:
+                sequence += 1
+                _write_event(tmp, sequence)
+            sync_ssh.sync_telemetry()  # catch up once, like an open session would
+
+            full, sync = [], []
+            for _ in range(args.rounds):
+                sequence += 1
+                _write_event(tmp, sequence)
+                full.append(_time_refresh(full_ssh.fetch_telemetry, full_ssh))
+                sync.append(_time_refresh(sync_ssh.sync_telemetry, sync_ssh))
+
+            print(f"{size:>6}  "
+                  f"{statistics.median(ms for ms, _ in full):>9.1f}  "
+                  f"{statistics.median(b for _, b in full) / 1024:>8.1f}  "
+                  f"{statistics.median(ms for ms, _ in sync):>9.1f}  "
+                  f"{statistics.median(b for _, b in sync) / 1024:>8.1f}")
+
+    print("sync re-lists every file but only downloads new ones; its cost should stay flat.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Benchmark: VNC capture through temp PNG files, full frames and dirty rects.
+
+Runs a minimal RFB 3.8 server in a child process that answers full update
+requests with a whole Raw-encoded frame (a printer-sized UI) and
+incremental ones with just a 48x48 spinner, which only changes on every
+other reply (the repeats should be dropped as duplicates). Then
+captures from it with VNCService three ways: the old way (captureScreen to
+a temp PNG, read it back, decode it), full in-memory frames with
+capture_frame(), and the streaming loop, which only receives the dirty
+rectangles into its mailbox. Reports frames per second and client CPU per
+frame; --consumer-ms simulates a slow UI to show that capture never waits
+for it and that the update it takes is always fresh.
+
+Usage:
+    python scripts/bench_vnc_capture.py [--frames 100] [--size 800 480]
+                                        [--consumer-ms 50]
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+# Ensure the project root is in sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+from vncdotool import api as vnc_api
+
+from src.services.vnc_service import VNCService
+
+# 32bpp little-endian true colour, shifts 16/8/0 (vncdotool reads it as BGRX)
+_PIXEL_FORMAT = struct.pack("!BBBBHHHBBBxxx", 32, 24, 0, 1, 255, 255, 255, 16, 8, 0)
+
+
+SPINNER = 48
+
+
+def _spinner_box(width, height):
+    return (width - SPINNER - 20, height - SPINNER - 20, width - 20, height - 20)
+
+
+def _make_frames(width, height, count=8):
+    """
+    Pre-render a few distinct UI-like frames in the server's pixel format.
+
+    Returns (full_frames, spinner_patches); each patch is just the spinner
+    area of the matching frame.
+    """
+    frames, patches = [], []
+    box = _spinner_box(width, height)
+    for i in range(count):
+        image = Image.new("RGB", (width, height), (24, 32, 48))
+        draw = ImageDraw.Draw(image)
+        for row in range(0, height - 80, 60):
+            draw.rectangle([20, row + 10, width - 20, row + 50], fill=(60, 80, 110))
+            draw.text((30, row + 22), f"Menu item {row // 60}  frame {i}", fill=(230, 230, 230))
+        draw.pieslice(box, i * 360 // count, i * 360 // count + 90, fill=(0, 150, 220))
+        frames.append(image.tobytes("raw", "BGRX"))
+        patches.append(image.crop(box).tobytes("raw", "BGRX"))
+    return frames, patches
+
+
+def _recv_exact(conn, size):
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("client closed")
+        data += chunk
+    return data
+
+
+def _serve(listener, width, height):
+    """Accept one client and answer its update requests until it disconnects."""
+    frames, patches = _make_frames(width, height)
+    spinner_x, spinner_y = _spinner_box(width, height)[:2]
+    conn, _ = listener.accept()
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        conn.sendall(b"RFB 003.008\n")
+        _recv_exact(conn, 12)
+        conn.sendall(b"\x01\x01")                   # one security type: None
+        _recv_exact(conn, 1)
+        conn.sendall(struct.pack("!I", 0))          # SecurityResult OK
+        _recv_exact(conn, 1)                        # ClientInit
+        name = b"bench"
+        conn.sendall(struct.pack("!HH", width, height) + _PIXEL_FORMAT
+                     + struct.pack("!I", len(name)) + name)
+
+        sent = 0
+        while True:
+            kind = _recv_exact(conn, 1)[0]
+            if kind == 0:                           # SetPixelFormat (ignored)
+                _recv_exact(conn, 19)
+            elif kind == 2:                         # SetEncodings
+                count = struct.unpack("!xH", _recv_exact(conn, 3))[0]
+                _recv_exact(conn, 4 * count)
+            elif kind == 3:                         # FramebufferUpdateRequest
+                incremental = _recv_exact(conn, 9)[0]
+                header = struct.pack("!BxH", 0, 1)
+                if incremental:
+                    header += struct.pack("!HHHHi", spinner_x, spinner_y, SPINNER, SPINNER, 0)
+                    conn.sendall(header + patches[(sent // 2) % len(patches)])
+                else:
+                    header += struct.pack("!HHHHi", 0, 0, width, height, 0)
+                    conn.sendall(header + frames[sent % len(frames)])
+                sent += 1
+            elif kind == 4:                         # KeyEvent
+                _recv_exact(conn, 7)
+            elif kind == 5:                         # PointerEvent
+                _recv_exact(conn, 5)
+            elif kind == 6:                         # ClientCutText
+                length = struct.unpack("!xxxI", _recv_exact(conn, 7))[0]
+                _recv_exact(conn, length)
+            else:
+                break
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        conn.close()
+
+
+def _capture_via_temp_png(vnc, frames):
+    """The original capture path: captureScreen to disk, read back, decode."""
+    for _ in range(frames):
+        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+        temp_path = temp_file.name
+        temp_file.close()
+        try:
+            vnc.client.captureScreen(temp_path)
+            with open(temp_path, 'rb') as f:
+                data = f.read()
+            Image.open(io.BytesIO(data)).load()
+        finally:
+            os.unlink(temp_path)
+
+
+def _capture_full_frames(vnc, frames):
+    """Whole in-memory frames via capture_frame()."""
+    for _ in range(frames):
+        vnc.capture_frame()
+
+
+def _stream_dirty_rects(vnc, frames, consumer_delay=0.0):
+    """
+    Run the streaming loop until it has published `frames` updates.
+
+    A consumer drains the mailbox like the UI would, taking consumer_delay
+    seconds per update; latency is how old each update is when taken.
+    """
+    available = threading.Event()
+    vnc.mailbox.on_available = available.set
+    vnc.rate.max_fps = 10000  # don't throttle; measure the pipeline
+    vnc.start_viewing()
+
+    latencies = []
+    deadline = time.monotonic() + 60
+    while vnc.mailbox.produced < frames and time.monotonic() < deadline:
+        if not available.wait(0.5):
+            continue
+        available.clear()
+        update = vnc.mailbox.take()
+        if update:
+            latencies.append(time.monotonic() - update.timestamp)
+            time.sleep(consumer_delay)
+
+    vnc.stop_viewing()
+    stats = {**vnc.change_detector.stats(), **vnc.mailbox.stats()}
+    stats["max_latency_ms"] = max(latencies, default=0) * 1000
+    return stats
+
+
+def _measure(label, capture, frames):
+    capture(1)  # warm up
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    stats = capture(frames)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    print(f"{label:<12}  {frames / wall:>7.1f}  {cpu / frames * 1000:>12.2f}")
+    if stats:
+        print(f"{'':<12}  delivered {stats['frames_delivered']}, "
+              f"duplicates dropped {stats['duplicates_dropped']}, "
+              f"consumed {stats['consumed']}, merged {stats['dropped']}, "
+              f"max latency {stats['max_latency_ms']:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=100, help="frames to capture per path")
+    parser.add_argument("--size", type=int, nargs=2, default=[800, 480], metavar=("W", "H"),
+                        help="framebuffer size")
+    parser.add_argument("--consumer-ms", type=float, default=0.0,
+                        help="time the simulated UI spends on each streamed update")
+    args = parser.parse_args()
+    width, height = args.size
+
+    print(f"{width}x{height}, {args.frames} frames")
+    print(f"{'path':<12}  {'fps':>7}  {'cpu ms/frame':>12}")
+
+    paths = (
+        ("temp png", _capture_via_temp_png),
+        ("full frame", _capture_full_frames),
+        ("dirty rects", lambda vnc, count: _stream_dirty_rects(vnc, count, args.consumer_ms / 1000)),
+    )
+    for label, capture in paths:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        server = multiprocessing.Process(target=_serve, args=(listener, width, height), daemon=True)
+        server.start()
+
+        vnc = VNCService(f"127.0.0.1::{port}")
+        vnc.connect()
+        try:
+            _measure(label, lambda count: capture(vnc, count), args.frames)
+        finally:
+            vnc.disconnect()
+            server.terminate()
+            server.join()
+            listener.close()
+
+    vnc_api.shutdown()
+    print("client CPU excludes the stand-in server process.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,31 @@
 # Controller Layer - Logic and orchestration
 
-from .data_controller import DataController
-from .alerts_controller import AlertsController
-from .telemetry_controller import TelemetryController
-from .printer_controller import PrinterController
-from .ews_controller import EWSController
-from .command_controller import CommandController
-from .report_controller import ReportBuilder
+import importlib
+
+# Submodules are imported on first attribute access, so importing one
+# Qt-free piece (e.g. from a command-line tool) does not pull in the rest.
+_EXPORTS = {
+    "DataController": ".data_controller",
+    "AlertsController": ".alerts_controller",
+    "TelemetryController": ".telemetry_controller",
+    "PrinterController": ".printer_controller",
+    "EWSController": ".ews_controller",
+    "CommandController": ".command_controller",
+    "ReportBuilder": ".report_controller",
+    "BaseDuneStrategy": ".strategies",
+    "DuneIICStrategy": ".strategies",
+    "DuneIPHStrategy": ".strategies",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Strategies
-from .strategies import BaseDuneStrategy, DuneIICStrategy, DuneIPHStrategy
 
 __all__ = [
     "DataController",
@@ -2,13 +2,17 @@
 Alerts Controller - Handles alert fetching and actions.
 
 This controller coordinates between the UI and the services layer for
-fetching alerts and sending alert actions.
+fetching alerts and sending alert actions. Alert fetches run on the shared
+async loop (AsyncPrinterClient), so polling several printers does not tie
+up a worker thread per request.
 """
 from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool
 from typing import List, Dict, Optional, Any
 
 from src.services.cdm_api import CDMApiService, CDMApiError
 from src.services.ledm_api import LEDMApiService, LEDMApiError
+from src.services.http_pool import retarget_service
+from src.services.async_client import AsyncPrinterClient, submit
 from src.utils.logging.app_logger import log_info, log_error
 
 
@@ -18,26 +22,6 @@ class WorkerSignals(QObject):
     error = Signal(str)
 
 
-class FetchAlertsWorker(QRunnable):
-    """Worker to fetch alerts in background thread."""
-    
-    def __init__(self, service: Any, use_ledm: bool = False):
-        super().__init__()
-        self.service = service
-        self.use_ledm = use_ledm
-        self.signals = WorkerSignals()
-    
-    @Slot()
-    def run(self):
-        try:
-            alerts = self.service.fetch_alerts()
-            self.signals.finished.emit(alerts)
-        except (CDMApiError, LEDMApiError) as e:
-            self.signals.error.emit(str(e))
-        except Exception as e:
-            self.signals.error.emit(f"Error fetching alerts: {str(e)}")
-
-
 class AlertActionWorker(QRunnable):
     """Worker to send alert action in background thread."""
     
@@ -94,14 +78,26 @@ class AlertsController(QObject):
         self._ip: str = ""
         self._cdm_service: Optional[CDMApiService] = None
         self._ledm_service: Optional[LEDMApiService] = None
+        self._client: Optional[AsyncPrinterClient] = None
+        self._shown_alerts: Optional[List[Dict[str, Any]]] = None  # Last list sent to the UI
+        
+        # Results of async fetches, delivered from the loop thread to this (GUI) thread
+        self._fetch_signals = WorkerSignals()
+        self._fetch_signals.finished.connect(self._on_fetch_success)
+        self._fetch_signals.error.connect(self._on_fetch_error)
     
     def set_ip(self, ip: str) -> None:
         """Update the target IP address."""
         self._ip = ip
+        if self._client is None or self._client.ip != ip:
+            self._shown_alerts = None
+            if self._client is not None:
+                submit(self._client.close())
+            self._client = AsyncPrinterClient(ip, use_ledm=self.use_ledm) if ip else None
         if self.use_ledm:
-            self._ledm_service = LEDMApiService(ip) if ip else None
+            self._ledm_service = retarget_service(self._ledm_service, LEDMApiService, ip)
         else:
-            self._cdm_service = CDMApiService(ip) if ip else None
+            self._cdm_service = retarget_service(self._cdm_service, CDMApiService, ip)
     
     @property
     def service(self):
@@ -118,7 +114,7 @@ class AlertsController(QObject):
             self.error_occurred.emit("No IP Address configured")
             return
         
-        if not self.service:
+        if not self._client:
             self.error_occurred.emit("Service not initialized")
             return
         
@@ -126,19 +122,35 @@ class AlertsController(QObject):
         self.status_message.emit("Fetching alerts...")
         log_info("alerts.fetch", "started", "Fetching alerts", {"ip": self._ip})
         
-        worker = FetchAlertsWorker(self.service, self.use_ledm)
-        worker.signals.finished.connect(self._on_fetch_success)
-        worker.signals.error.connect(self._on_fetch_error)
-        
-        self.thread_pool.start(worker)
+        # Unchanged responses come from the response cache
+        submit(self._client.fetch_alerts(), self._deliver_fetch)
+    
+    def _deliver_fetch(self, future) -> None:
+        """Hand a finished fetch to the GUI thread (runs on the async loop)."""
+        try:
+            self._fetch_signals.finished.emit(future.result())
+        except (CDMApiError, LEDMApiError) as e:
+            self._fetch_signals.error.emit(str(e))
+        except Exception as e:
+            self._fetch_signals.error.emit(f"Error fetching alerts: {str(e)}")
     
     def _on_fetch_success(self, alerts: List[Dict[str, Any]]) -> None:
-        """Handle successful alert fetch."""
+        """Handle successful alert fetch. Skips the UI rebuild if this view already shows the same alerts."""
+        # The response cache is process-wide: another tab may have fetched
+        # these alerts first, so compare with what this controller sent
+        changed = self._shown_alerts is None or not (
+            alerts is self._shown_alerts or alerts == self._shown_alerts
+        )
         self.loading_changed.emit(False)
-        self.alerts_updated.emit(alerts)
-        self.status_message.emit(f"Fetched {len(alerts)} alerts")
+        if changed:
+            self._shown_alerts = alerts
+            self.alerts_updated.emit(alerts)
+        self.status_message.emit(
+            f"Fetched {len(alerts)} alerts" if changed else "Alerts unchanged"
+        )
         log_info("alerts.fetch", "succeeded", f"Fetched {len(alerts)} alerts", {
             "count": len(alerts),
+            "changed": changed,
             "ip": self._ip
         })
     
@@ -29,22 +29,15 @@ class SSHCommandWorker(QRunnable):
     @Slot()
     def run(self):
         try:
-            ssh = None
-            should_close = False
-            
-            # Try to reuse existing SSH connection
+            # Reuse an explicitly shared connection, else borrow the pooled one
             if self.existing_ssh and self.existing_ssh.is_connected:
                 ssh = self.existing_ssh
             else:
-                ssh = SSHService(self.ip)
+                ssh = SSHService(self.ip, pooled=True)
                 ssh.connect()
-                should_close = True
             
             stdout, stderr, exit_code = ssh.exec_command(self.command)
             
-            if should_close:
-                ssh.disconnect()
-            
             if exit_code == 0:
                 self.signals.finished.emit(True, stdout or "Command executed successfully")
             else:
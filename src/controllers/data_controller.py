@@ -11,6 +11,8 @@ from typing import List, Dict, Optional, Any
 
 from src.services.cdm_api import CDMApiService, CDMApiError
 from src.services.ledm_api import LEDMApiService, LEDMApiError
+from src.services.http_pool import retarget_service
+from src.services.directory_index import get_directory_index, UNDERSCORE
 from src.utils.logging.app_logger import log_info, log_error
 
 
@@ -18,6 +20,7 @@ class WorkerSignals(QObject):
     """Signals for async workers."""
     finished = Signal(object)
     error = Signal(str)
+    result = Signal(str, str)  # endpoint, content - emitted as each endpoint finishes
 
 
 class FetchDataWorker(QRunnable):
@@ -32,7 +35,9 @@ class FetchDataWorker(QRunnable):
     @Slot()
     def run(self):
         try:
-            results = self.service.fetch_endpoints(self.endpoints)
+            results = self.service.fetch_endpoints(
+                self.endpoints, on_result=self.signals.result.emit
+            )
             self.signals.finished.emit(results)
         except Exception as e:
             self.signals.error.emit(str(e))
@@ -49,11 +54,13 @@ class DataController(QObject):
         status_message(str): Status updates for the UI
         error_occurred(str): Error messages for the UI
         data_fetched(dict): Raw data fetched from endpoints
+        endpoint_fetched(str, str): One endpoint's data, as soon as it arrives
     """
     
     status_message = Signal(str)
     error_occurred = Signal(str)
     data_fetched = Signal(dict)
+    endpoint_fetched = Signal(str, str)
     
     def __init__(self, thread_pool: QThreadPool, use_ledm: bool = False):
         """
@@ -79,9 +86,9 @@ class DataController(QObject):
         """Update the target IP address."""
         self._ip = ip
         if self.use_ledm:
-            self._ledm_service = LEDMApiService(ip) if ip else None
+            self._ledm_service = retarget_service(self._ledm_service, LEDMApiService, ip)
         else:
-            self._cdm_service = CDMApiService(ip) if ip else None
+            self._cdm_service = retarget_service(self._cdm_service, CDMApiService, ip)
     
     def set_directory(self, directory: str) -> None:
         """Update the output directory."""
@@ -124,6 +131,7 @@ class DataController(QObject):
         })
         
         worker = FetchDataWorker(self.service, endpoints)
+        worker.signals.result.connect(self.endpoint_fetched.emit)
         worker.signals.finished.connect(
             lambda results: self._on_fetch_complete(results, variant)
         )
@@ -171,57 +179,70 @@ class DataController(QObject):
             "variant": variant
         })
         
+        # Each file is written as soon as its endpoint arrives; results are
+        # delivered on the GUI thread so saves never race on file names.
+        progress = {"saved": 0, "errors": []}
+        
         worker = FetchDataWorker(self.service, endpoints)
+        worker.signals.result.connect(
+            lambda endpoint, content: self._save_result(endpoint, content, variant, progress)
+        )
         worker.signals.finished.connect(
-            lambda results: self._save_results(results, variant)
+            lambda results: self._on_save_complete(progress)
         )
         worker.signals.error.connect(self._on_fetch_error)
         
         self.thread_pool.start(worker)
     
-    def _save_results(self, results: Dict[str, str], variant: Optional[str]) -> None:
-        """Save fetched results to files."""
-        saved_count = 0
-        errors = []
+    def _save_result(self, endpoint: str, content: str, variant: Optional[str],
+                     progress: Dict[str, Any]) -> None:
+        """Save a single fetched endpoint to a file."""
+        self.endpoint_fetched.emit(endpoint, content)
         
-        for endpoint, content in results.items():
-            if content.startswith("Error:"):
-                errors.append(f"{endpoint}: {content}")
-                continue
-            
-            # Determine filename from endpoint
-            endpoint_name = self._get_endpoint_name(endpoint)
-            
-            # Get step prefix
-            step_str = ""
-            if self._step_manager:
-                step_str = f"{self._step_manager.get_step()}. "
-            
-            # Build filename
-            prefix = "LEDM" if self.use_ledm else "CDM"
-            if variant:
-                base_name = f"{step_str}{variant}. {prefix}_{endpoint_name}"
-            else:
-                base_name = f"{step_str}{prefix}_{endpoint_name}"
+        if content.startswith("Error:"):
+            progress["errors"].append(f"{endpoint}: {content}")
+            return
+        
+        # Determine filename from endpoint
+        endpoint_name = self._get_endpoint_name(endpoint)
+        
+        # Get step prefix
+        step_str = ""
+        if self._step_manager:
+            step_str = f"{self._step_manager.get_step()}. "
+        
+        # Build filename
+        prefix = "LEDM" if self.use_ledm else "CDM"
+        if variant:
+            base_name = f"{step_str}{variant}. {prefix}_{endpoint_name}"
+        else:
+            base_name = f"{step_str}{prefix}_{endpoint_name}"
+        
+        # Get versioned filename
+        filename = self._get_versioned_filename(self._directory, base_name, ".json")
+        full_path = os.path.join(self._directory, filename)
+        
+        try:
+            # Try to format as JSON
+            try:
+                parsed = json.loads(content)
+                content = json.dumps(parsed, indent=4)
+            except (json.JSONDecodeError, ValueError):
+                pass
             
-            # Get versioned filename
-            filename = self._get_versioned_filename(self._directory, base_name, ".json")
-            full_path = os.path.join(self._directory, filename)
+            with open(full_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            get_directory_index(self._directory).add(full_path)
+            progress["saved"] += 1
             
-            try:
-                # Try to format as JSON
-                try:
-                    parsed = json.loads(content)
-                    content = json.dumps(parsed, indent=4)
-                except (json.JSONDecodeError, ValueError):
-                    pass
-                
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                saved_count += 1
-                
-            except Exception as e:
-                errors.append(f"Save error {endpoint}: {str(e)}")
+        except Exception as e:
+            get_directory_index(self._directory).release(full_path)
+            progress["errors"].append(f"Save error {endpoint}: {str(e)}")
+    
+    def _on_save_complete(self, progress: Dict[str, Any]) -> None:
+        """Report the outcome once every endpoint has been fetched and saved."""
+        saved_count = progress["saved"]
+        errors = progress["errors"]
         
         if saved_count > 0:
             self.status_message.emit(f"Saved {saved_count} files")
@@ -247,44 +268,33 @@ class DataController(QObject):
         return endpoint.split('/')[-1].split('.')[0]
     
     def _get_versioned_filename(self, directory: str, base_filename: str, extension: str) -> str:
-        """Generate versioned filename if conflicts exist."""
-        base_path = os.path.join(directory, base_filename + extension)
-        
-        if not os.path.exists(base_path):
-            v1_filename = f"{base_filename}_1{extension}"
-            v1_path = os.path.join(directory, v1_filename)
-            
-            if not os.path.exists(v1_path):
-                return base_filename + extension
-        
-        # Check for _1 version
-        v1_filename = f"{base_filename}_1{extension}"
-        v1_path = os.path.join(directory, v1_filename)
-        
-        if not os.path.exists(v1_path):
-            if os.path.exists(base_path):
-                try:
-                    os.rename(base_path, v1_path)
-                except OSError:
-                    return f"{base_filename}_2{extension}"
-            return f"{base_filename}_2{extension}"
+        """
+        Generate versioned filename if conflicts exist.
         
-        # Scan for highest version
-        import re
-        pattern = re.compile(rf"^{re.escape(base_filename)}_(\d+){re.escape(extension)}$")
-        max_version = 1
+        The first capture keeps the plain name; on the second the original
+        is renamed to _1 and the new one becomes _2, then _3 and so on.
+        The name is claimed in the directory index until the file is added.
+        """
+        index = get_directory_index(directory)
+        base_name = base_filename + extension
+        v1_name = f"{base_filename}_1{extension}"
         
-        for filename in os.listdir(directory):
-            match = pattern.match(filename)
-            if match:
-                try:
-                    version = int(match.group(1))
-                    if version > max_version:
-                        max_version = version
-                except ValueError:
-                    pass
+        if not index.exists(base_name) and not index.exists(v1_name):
+            filename = base_name
+        elif not index.exists(v1_name):
+            try:
+                os.rename(os.path.join(directory, base_name), os.path.join(directory, v1_name))
+                index.remove(base_name)
+                index.add(v1_name)
+            except OSError:
+                pass
+            filename = f"{base_filename}_2{extension}"
+        else:
+            # One past the highest existing version
+            filename = f"{base_filename}_{index.highest_number(base_filename, extension, UNDERSCORE) + 1}{extension}"
         
-        return f"{base_filename}_{max_version + 1}{extension}"
+        index.claim(filename)
+        return filename
     
     # -------------------------------------------------------------------------
     # Single Endpoint View
@@ -12,6 +12,25 @@ from src.services.ews_service import EWSService, EWSServiceError
 from src.utils.logging.app_logger import log_info, log_error
 
 
+def log_capture_timing(service: Optional[EWSService] = None,
+                       timings: Optional[List[Dict[str, Any]]] = None) -> None:
+    """
+    Log how long captures took and whether the browser was cold.
+
+    Args:
+        service: Logs the service's last capture
+        timings: Logs these captures instead (e.g. EWSScreenshotCapturer.timings)
+    """
+    if timings is None:
+        timings = [service.last_timing] if service is not None else []
+    for timing in timings:
+        if not timing:
+            continue
+        state = "first capture, browser started" if timing["cold"] else "warm browser"
+        log_info("ews.capture", "timing",
+                 f"{timing['pages']} page(s) in {timing['seconds']:.2f}s ({state})", timing)
+
+
 class WorkerSignals(QObject):
     """Signals for async workers."""
     finished = Signal(bool, str)  # success, message
@@ -33,6 +52,7 @@ class EWSCaptureWorker(QRunnable):
         try:
             service = EWSService(self.ip, self.password)
             saved_files = service.capture_and_save(self.directory, self.prefix)
+            log_capture_timing(service)
             self.signals.finished.emit(True, f"Saved {len(saved_files)} EWS screenshots")
         except EWSServiceError as e:
             self.signals.finished.emit(False, str(e))
@@ -141,6 +161,7 @@ class EWSController(QObject):
                 try:
                     service = EWSService(self.ip, self.password)
                     screenshot = service.capture_page(self.url_path)
+                    log_capture_timing(service)
                     
                     filename = f"{self.prefix}EWS {self.page_name}.png"
                     filepath = os.path.join(self.directory, filename)
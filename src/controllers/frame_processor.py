@@ -0,0 +1,100 @@
+"""
+Frame Processor - Decodes and pre-scales stream frames off the GUI thread.
+
+Stream services publish encoded PNG/JPEG frames into a FrameMailbox on
+their own capture threads. The processor takes the newest one, decodes it
+straight into a QImage and scales it to the display size on a dedicated
+QThread, so the GUI thread only has to put a ready-sized image on screen.
+"""
+import threading
+from typing import Optional
+
+from PySide6.QtCore import QObject, QThread, Signal, Slot, QMetaObject, Qt, QSize, QCoreApplication
+from PySide6.QtGui import QImage
+
+from src.services.frame_mailbox import FrameMailbox
+
+
+class FrameProcessor(QObject):
+    """
+    Latest-frame-wins decode/scale stage running on its own thread.
+
+    Drains the mailbox given to set_source(). If frames arrive faster than
+    they can be decoded, the mailbox overwrites the stale ones (see its
+    dropped counter) and only the newest is processed.
+
+    Signals:
+        frame_ready(QImage): Decoded frame, scaled down to fit the target size
+    """
+
+    frame_ready = Signal(QImage)
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._source: Optional[FrameMailbox[bytes]] = None
+        self._target_size = QSize()
+        self.frames_processed = 0
+
+        self._thread = QThread()
+        self._thread.setObjectName("FrameProcessor")
+        self.moveToThread(self._thread)
+        self._thread.start()
+
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stop, Qt.ConnectionType.DirectConnection)
+
+    def set_target_size(self, size: QSize) -> None:
+        """Set the size frames are scaled to fit (an invalid size disables scaling)."""
+        with self._lock:
+            self._target_size = QSize(size)
+
+    def set_source(self, mailbox: Optional[FrameMailbox[bytes]]) -> None:
+        """
+        Drain encoded frames from a stream service's mailbox.
+
+        Args:
+            mailbox: The mailbox to take frames from (None detaches)
+        """
+        with self._lock:
+            if self._source is not None:
+                self._source.on_available = None
+            self._source = mailbox
+        if mailbox is not None:
+            mailbox.on_available = self._schedule
+
+    def _schedule(self) -> None:
+        """Queue a _process call on the processor thread (any thread)."""
+        QMetaObject.invokeMethod(self, "_process", Qt.ConnectionType.QueuedConnection)
+
+    def stop(self) -> None:
+        """Stop the processing thread (called automatically on app exit)."""
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
+    @Slot()
+    def _process(self) -> None:
+        """Decode and scale the newest pending frame (processor thread)."""
+        with self._lock:
+            source = self._source
+            target = QSize(self._target_size)
+        data = source.take() if source else None
+        if data is None:
+            return
+
+        image = QImage.fromData(data)
+        if image.isNull():
+            return
+
+        # Scale down to fit, never up
+        if target.isValid() and (image.width() > target.width() or image.height() > target.height()):
+            image = image.scaled(
+                target,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
+        self.frames_processed += 1
+        self.frame_ready.emit(image)
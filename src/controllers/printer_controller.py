@@ -5,15 +5,17 @@ This controller coordinates between the UI and the services layer for
 managing printer UI streaming, interaction, and screen capture.
 """
 import os
-from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool, QRect, QSize
+from PySide6.QtGui import QImage
 from typing import Optional, Tuple, Dict, Any
 from PIL import Image
-import io
 
 from src.services.vnc_service import VNCService, VNCServiceError
 from src.services.ssh_service import SSHService, SSHServiceError
 from src.services.sirius_stream_service import SiriusStreamService, SiriusStreamError
+from src.services.file_service import FileManager
+from src.services.directory_index import get_directory_index, UNDERSCORE
+from src.controllers.frame_processor import FrameProcessor
 from src.utils.logging.app_logger import log_info, log_error
 
 
@@ -29,14 +31,15 @@ class VNCConnectWorker(QRunnable):
     @Slot()
     def run(self):
         try:
-            # Start VNC server via SSH
-            ssh = SSHService(self.ip)
+            # Start VNC server via SSH (pooled: reuses the printer's open transport)
+            ssh = SSHService(self.ip, pooled=True)
             ssh.connect()
             ssh.start_vnc_server(self.rotation)
             
             # Connect to VNC
             vnc = VNCService(self.ip, self.rotation)
-            vnc.on_frame_update = self.controller._on_frame_update
+            vnc.mailbox.on_available = self.controller._vnc_frame_available.emit
+            vnc.rate.set_paused(not self.controller._stream_visible)
             vnc.connect()
             
             # Store references
@@ -69,6 +72,17 @@ class VNCDisconnectWorker(QRunnable):
     def run(self):
         try:
             if self.controller._vnc_service:
+                vnc = self.controller._vnc_service
+                stats = {**vnc.change_detector.stats(), **vnc.mailbox.stats()}
+                log_info("printer.vnc", "stream_stats",
+                         f"{stats['frames_delivered']} frames delivered, "
+                         f"{stats['duplicates_dropped']} duplicates dropped, "
+                         f"{stats['dropped']} merged before display", stats)
+                if vnc.input:
+                    input_stats = vnc.input.stats()
+                    log_info("printer.vnc", "input_stats",
+                             f"{input_stats['queued']} input events queued, "
+                             f"{input_stats['coalesced']} coalesced", input_stats)
                 self.controller._vnc_service.disconnect()
                 self.controller._vnc_service = None
             
@@ -84,6 +98,38 @@ class VNCDisconnectWorker(QRunnable):
             self.controller.connection_status.emit(False, "Disconnected")
 
 
+class RecordingExportWorker(QRunnable):
+    """Worker to write the stream recording to disk in background thread."""
+    
+    def __init__(self, controller: 'PrinterController', service, filepath: str):
+        super().__init__()
+        self.controller = controller
+        self.service = service
+        self.filepath = filepath
+    
+    @Slot()
+    def run(self):
+        index = get_directory_index(os.path.dirname(self.filepath))
+        try:
+            # The name was claimed when the save was requested; note the
+            # directory state again now that the file is about to be written
+            index.claim(self.filepath)
+            frames = self.service.export_recording(self.filepath)
+            if frames:
+                index.add(self.filepath)
+                self.controller.status_message.emit(f"Saved: {os.path.basename(self.filepath)}")
+                log_info("printer.recording", "succeeded",
+                         f"Saved {frames} frames to {self.filepath}",
+                         {"frames": frames, **self.service.recorder.stats()})
+            else:
+                index.release(self.filepath)
+                self.controller.error_occurred.emit("Nothing recorded yet")
+        except Exception as e:
+            index.release(self.filepath)
+            self.controller.error_occurred.emit(f"Failed to save recording: {str(e)}")
+            log_error("printer.recording", "failed", str(e))
+
+
 class PrinterController(QObject):
     """
     Controller for printer UI streaming.
@@ -92,13 +138,19 @@ class PrinterController(QObject):
     for Sirius printers. Provides frame updates and interaction methods.
     
     Signals:
-        frame_ready(QPixmap): New frame available for display
+        frame_ready(QImage): New frame, already scaled for display (Sirius)
+        frame_region_ready(QImage, QRect, QSize): Changed region of the VNC
+            frame - (pixels, where they go, full frame size)
         connection_status(bool, str): Connection state changed
         error_occurred(str): Error message
         status_message(str): Status update
     """
     
-    frame_ready = Signal(QPixmap)
+    frame_ready = Signal(QImage)
+    frame_region_ready = Signal(QImage, QRect, QSize)
+    
+    # Emitted from the VNC capture thread when its mailbox fills
+    _vnc_frame_available = Signal()
     connection_status = Signal(bool, str)
     error_occurred = Signal(str)
     status_message = Signal(str)
@@ -121,11 +173,17 @@ class PrinterController(QObject):
         self._step_manager = None
         self._username: Optional[str] = None
         self._password: Optional[str] = None
+        self._stream_visible: bool = True
         
         # Services
         self._vnc_service: Optional[VNCService] = None
         self._ssh_service: Optional[SSHService] = None
         self._sirius_service: Optional[SiriusStreamService] = None
+        self._frame_processor: Optional[FrameProcessor] = None
+        self._display_size = QSize()
+        
+        # Queued to the GUI thread, which then drains the VNC mailbox
+        self._vnc_frame_available.connect(self._on_vnc_frame_available)
     
     def set_ip(self, ip: str) -> None:
         """Update the target IP address."""
@@ -147,6 +205,29 @@ class PrinterController(QObject):
         if self._sirius_service:
             self._sirius_service.set_credentials(username, password)
     
+    def set_display_size(self, size: QSize) -> None:
+        """
+        Set the size Sirius frames are pre-scaled to.
+        
+        Args:
+            size: Size of the area the stream is shown in
+        """
+        self._display_size = QSize(size)
+        if self._frame_processor:
+            self._frame_processor.set_target_size(size)
+    
+    def set_stream_visible(self, visible: bool) -> None:
+        """
+        Pause polling while the stream widget is hidden, resume when shown.
+        
+        Args:
+            visible: Whether the stream is on screen
+        """
+        self._stream_visible = visible
+        for service in (self._vnc_service, self._sirius_service):
+            if service:
+                service.rate.set_paused(not visible)
+    
     @property
     def is_connected(self) -> bool:
         """Check if stream is active."""
@@ -193,14 +274,20 @@ class PrinterController(QObject):
     
     def _connect_sirius(self) -> None:
         """Connect via HTTPS (Sirius printers)."""
+        if self._frame_processor is None:
+            self._frame_processor = FrameProcessor()
+            self._frame_processor.set_target_size(self._display_size)
+            self._frame_processor.frame_ready.connect(self.frame_ready)
+        
         try:
             self._sirius_service = SiriusStreamService(
                 self._ip,
                 username=self._username or "admin",
                 password=self._password
             )
-            self._sirius_service.on_image_update = self._on_sirius_frame
+            self._frame_processor.set_source(self._sirius_service.mailbox)
             self._sirius_service.on_connection_status = self._on_sirius_status
+            self._sirius_service.rate.set_paused(not self._stream_visible)
             self._sirius_service.connect()
         except SiriusStreamError as e:
             self.error_occurred.emit(str(e))
@@ -222,6 +309,10 @@ class PrinterController(QObject):
         """Disconnect Sirius stream."""
         if self._sirius_service:
             self._sirius_service.disconnect()
+            stats = self._sirius_service.mailbox.stats()
+            log_info("printer.sirius", "stream_stats",
+                     f"{stats['consumed']} of {stats['produced']} frames displayed", stats)
+            self._frame_processor.set_source(None)
             self._sirius_service = None
         self.connection_status.emit(False, "Disconnected")
     
@@ -263,12 +354,13 @@ class PrinterController(QObject):
                     
                     # Reconnect with new rotation
                     try:
-                        ssh = SSHService(self.ip)
+                        ssh = SSHService(self.ip, pooled=True)
                         ssh.connect()
                         ssh.start_vnc_server(self.rotation)
                         
                         vnc = VNCService(self.ip, self.rotation)
-                        vnc.on_frame_update = self.controller._on_frame_update
+                        vnc.mailbox.on_available = self.controller._vnc_frame_available.emit
+                        vnc.rate.set_paused(not self.controller._stream_visible)
                         vnc.connect()
                         
                         self.controller._ssh_service = ssh
@@ -288,33 +380,23 @@ class PrinterController(QObject):
     # Frame Handling
     # -------------------------------------------------------------------------
     
-    def _on_frame_update(self, pil_image: Image.Image, raw_data: bytes) -> None:
-        """Handle VNC frame update (called from VNC thread)."""
-        try:
-            if pil_image:
-                # Convert to RGB if needed
-                if pil_image.mode != 'RGB':
-                    pil_image = pil_image.convert('RGB')
-                
-                # Convert PIL to QPixmap
-                data = pil_image.tobytes("raw", "RGB")
-                qim = QImage(data, pil_image.width, pil_image.height, QImage.Format.Format_RGB888)
-                pixmap = QPixmap.fromImage(qim)
-                self.frame_ready.emit(pixmap)
-        except Exception:
-            pass
-
-    def _on_sirius_frame(self, image_data: bytes) -> None:
-        """Handle Sirius frame update."""
+    @Slot()
+    def _on_vnc_frame_available(self) -> None:
+        """Take the newest VNC update and emit its patches (GUI thread)."""
+        vnc = self._vnc_service
+        update = vnc.mailbox.take() if vnc else None
+        if update is None:
+            return
+        
         try:
-            pil_image = Image.open(io.BytesIO(image_data))
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-            
-            data = pil_image.tobytes("raw", "RGB")
-            qim = QImage(data, pil_image.width, pil_image.height, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(qim)
-            self.frame_ready.emit(pixmap)
+            frame_size = QSize(update.width, update.height)
+            for rect in update.rects:
+                # Wrap the raw RGB pixels, then copy so the QImage owns them
+                patch = QImage(rect.data, rect.width, rect.height,
+                               rect.bytes_per_line, QImage.Format.Format_RGB888).copy()
+                self.frame_region_ready.emit(
+                    patch, QRect(rect.x, rect.y, rect.width, rect.height), frame_size
+                )
         except Exception:
             pass
     
@@ -416,22 +498,42 @@ class PrinterController(QObject):
             step_str = f"{self._step_manager.get_step()}. "
         
         base_filename = f"{step_str}UI {screen_name}"
-        filepath = os.path.join(self._directory, f"{base_filename}.png")
         
         # Handle existing file
-        counter = 1
-        while os.path.exists(filepath):
-            filepath = os.path.join(self._directory, f"{base_filename}_{counter}.png")
-            counter += 1
+        index = get_directory_index(self._directory)
+        filepath = os.path.join(self._directory, index.next_free_name(base_filename, ".png", UNDERSCORE))
         
         try:
             frame.save(filepath)
+            index.add(filepath)
             self.status_message.emit(f"Saved: {os.path.basename(filepath)}")
             log_info("printer.capture", "succeeded", f"Saved {filepath}")
         except Exception as e:
+            index.release(filepath)
             self.error_occurred.emit(f"Failed to save: {str(e)}")
             log_error("printer.capture", "failed", str(e))
     
+    def save_recording(self, name: str = "Recording") -> None:
+        """
+        Save the last seconds of the stream as an animated PNG.
+        
+        The file goes to the capture directory with the usual step prefix
+        and never overwrites an existing one.
+        
+        Args:
+            name: Name for the recording file
+        """
+        service = self._vnc_service or self._sirius_service
+        if not self.is_connected or service is None:
+            self.error_occurred.emit("Printer not connected. Cannot save recording.")
+            return
+        
+        file_manager = FileManager(self._directory, step_manager=self._step_manager)
+        filepath, filename = file_manager.get_safe_filepath(None, f"UI {name}", ".png")
+        
+        self.status_message.emit(f"Saving recording: {filename}...")
+        self.thread_pool.start(RecordingExportWorker(self, service, filepath))
+    
     def capture_ecl(self, variant: str = "") -> None:
         """
         Capture Estimated Cartridge Levels screen.
@@ -1,70 +1,148 @@
 import os
 import json
 
+from src.services.directory_index import get_directory_index, FILE_CATEGORIES
+from src.services.document_cache import get_document_cache
+
+# Report categories as the Report Builder lists them (display name -> key).
+# The manual "Tap" section is added per strategy, see ReportBuilder.tap_label().
+REPORT_CATEGORIES = {
+    "UI": "UI",
+    "EWS": "EWS",
+    "Alerts": "alerts",
+    "Supplies Public": "suppliesPublic",
+    "Supplies Private": "suppliesPrivate",
+    "Supply Assessment": "supplyAssessment",
+    "Telemetry": "Telemetry",
+    "Reports": "Reports",
+    "DSR Packet": "DSR Packet",
+}
+
+# Categories picked out of the "Other" files by name
+NAME_MATCHED_CATEGORIES = ["UI", "EWS", "Reports"]
+
 class ReportBuilder:
+    """
+    Builds the text report for one step of a capture directory.
+
+    File contents, and each file's formatted output for a given section,
+    color selection and strategy, come from the process-wide document
+    cache, so regenerating after a UI toggle only re-processes the files
+    whose inputs changed.
+    """
+
     def __init__(self, directory, step_number, strategy=None):
         self.directory = directory
         self.step_number = str(step_number)
         self.step_prefix = f"{self.step_number}. "
         self.strategy = strategy
+        self.cache = get_document_cache()
+        # Part of every cache key, since processing depends on the strategy
+        self._strategy_key = strategy.get_name() if strategy else None
     
     def scan_files(self):
         """
         Scans for all files belonging to the current step and categorizes them.
         Returns a dict of available categories and their file paths.
+        Served from the directory's shared index; the directory is only
+        listed again when it has changed.
         """
-        found_items = {
-            "alerts": [],
-            "suppliesPrivate": [],
-            "suppliesPublic": [],
-            "supplyAssessment": [],
-            "DSR Packet": [],
-            "Telemetry": [],
-            "Other": []
-        }
-        
-        if not os.path.exists(self.directory):
-            return found_items
+        if not os.path.exists(self.directory) or not self.step_number.isdigit():
+            return {category: [] for category in FILE_CATEGORIES}
 
-        try:
-            for f in os.listdir(self.directory):
-                # Must start with "Step. " e.g. "1. "
-                if not f.startswith(self.step_prefix):
-                    continue
-                    
-                full_path = os.path.join(self.directory, f)
-                if not os.path.isfile(full_path):
-                    continue
-                    
-                lower_name = f.lower()
-                
-                # Categorize based on filename keywords
-                if "alert" in lower_name and "cdm" in lower_name:
-                    found_items["alerts"].append(full_path)
-                elif "suppliesprivate" in lower_name:
-                    found_items["suppliesPrivate"].append(full_path)
-                elif "suppliespublic" in lower_name:
-                    found_items["suppliesPublic"].append(full_path)
-                elif "supplyassessment" in lower_name:
-                    found_items["supplyAssessment"].append(full_path)
-                elif "dsr" in lower_name:
-                    found_items["DSR Packet"].append(full_path)
-                elif "telemetry" in lower_name:
-                    found_items["Telemetry"].append(full_path)
-                else:
-                    found_items["Other"].append(full_path)
-        except OSError:
-            pass
-                
-        return found_items
+        return get_directory_index(self.directory).files_by_category(int(self.step_number))
+
+    def tap_label(self):
+        """Header of the manual Tap section for this strategy."""
+        if self.strategy and self.strategy.get_name() == "Dune IPH":
+            return "43-Tap"
+        return "63-Tap"
+
+    @staticmethod
+    def summary_sentence(display_names):
+        """Opening line of a report, e.g. "UI, EWS, and Alerts were correct and to spec." """
+        if not display_names:
+            return "Nothing selected."
+        if len(display_names) == 1:
+            return f"{display_names[0]} was correct and to spec."
+        if len(display_names) == 2:
+            return f"{display_names[0]} and {display_names[1]} were correct and to spec."
+        return f"{', '.join(display_names[:-1])}, and {display_names[-1]} were correct and to spec."
+
+    def build_step_report(self, categories, colors=None, telemetry="latest"):
+        """
+        The step's full report text, as the Report Builder window shows it
+        for the same selections, without any UI.
+
+        Where the window offers a file picker, its default is used: the
+        first file of a category that has several.
+
+        categories: category keys or display names (see REPORT_CATEGORIES; "Tap" for the manual section)
+        colors: color names to filter Telemetry/Supplies/Alerts by
+        telemetry: telemetry file to include per color: "latest", "first" or "none"
+        """
+        colors = list(colors or [])
+        display_names = {key: name for name, key in REPORT_CATEGORIES.items()}
+        display_names["Tap"] = self.tap_label()
+        wanted = {REPORT_CATEGORIES.get(c, c) for c in categories}
+        if wanted & {"43-Tap", "63-Tap"}:
+            wanted.add("Tap")
+
+        found = self.scan_files()
+        selected_categories = {}
+        active_names = []
+
+        for key, name in display_names.items():
+            if key not in wanted or key == "Telemetry":
+                continue
+            active_names.append(name)
+            if key == "Tap":
+                selected_categories[key] = [name]
+            elif key in NAME_MATCHED_CATEGORIES:
+                matched = [f for f in found.get("Other", []) if key.lower() in os.path.basename(f).lower()]
+                if matched:
+                    selected_categories[key] = matched
+            else:
+                files = found.get(key, [])
+                selected_categories[key] = files[:1] if len(files) > 1 else files
+
+        if "Telemetry" in wanted:
+            by_label = {}
+            for path in found.get("Telemetry", []):
+                by_label.setdefault(self.get_telemetry_color_label_from_file(path), []).append(path)
+            chosen = []
+            if telemetry != "none":
+                chosen = [paths[0] if telemetry == "first" else paths[-1] for paths in by_label.values()]
+            selected_categories["Telemetry"] = chosen
+            if chosen:
+                active_names.append("Telemetry")
+
+        body = self.generate_report(selected_categories, colors)
+
+        # Replace the builder's generic first line with the summary
+        lines = body.split("\n")
+        if lines and "correct and to spec" in lines[0]:
+            body = "\n".join(lines[2:]) if len(lines) > 2 else ""
+        text = f"{self.summary_sentence(active_names)}\n\n{body}"
+
+        if "UI" in selected_categories or "EWS" in selected_categories:
+            text = text.rstrip() + "\n\n"
+        return text
 
     def get_telemetry_color_label_from_file(self, file_path):
         """
         Determines the display label (e.g., 'Black', 'Cyan', 'Tri-Color') for a telemetry file.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            return self.cache.derive(file_path, ("telemetry_label", self._strategy_key),
+                                     self._telemetry_color_label)
+        except Exception:
+            return "Unknown"
+
+    def _telemetry_color_label(self, content):
+        """Color label from a telemetry file's text."""
+        try:
+            content = content.strip()
             if not content:
                 return "Unknown"
             data = json.loads(content)
@@ -106,17 +184,15 @@ class ReportBuilder:
         
         for f_path in alert_files:
             try:
-                with open(f_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    data = json.loads(content)
-                    if "alerts" in data and isinstance(data["alerts"], list):
-                        for alert in data["alerts"]:
-                            alerts_list.append({
-                                "id": alert.get("id"),
-                                "category": alert.get("category", "Unknown"),
-                                "visibility": alert.get("visibility", ""),
-                                "file_path": f_path
-                            })
+                data = self.cache.load_json(f_path)
+                if "alerts" in data and isinstance(data["alerts"], list):
+                    for alert in data["alerts"]:
+                        alerts_list.append({
+                            "id": alert.get("id"),
+                            "category": alert.get("category", "Unknown"),
+                            "visibility": alert.get("visibility", ""),
+                            "file_path": f_path
+                        })
             except:
                 pass
         return alerts_list
@@ -176,15 +252,19 @@ class ReportBuilder:
             # But scan_files finds them. The UI passes what is selected.
             # If "Alerts" toggle is ON, the UI should pass the alert files in selected_categories["alerts"].
             
-            # Determine processor based on section
+            # Determine processor based on section, and the inputs its output depends on
             if section == "alerts":
                 processor = lambda c: self._process_alerts_json(c, target_alert_ids)
+                inputs = tuple(target_alert_ids)
             elif "supplies" in section:
                 processor = lambda c: self._process_supplies_json(c, colors)
+                inputs = tuple(colors)
             elif section in ["supplyAssessment", "DSR Packet"]:
                 processor = lambda c: self._process_color_coded_json(c, colors)
+                inputs = tuple(colors)
             else:
                 processor = self._process_generic_json
+                inputs = ()
 
             section_lines = self._build_section(
                 section,
@@ -192,6 +272,7 @@ class ReportBuilder:
                 processor,
                 force_header=True,
                 empty_line_count=empty_lines_when_no_content,
+                cache_key=(section, inputs, self._strategy_key),
             )
             output.extend(section_lines)
 
@@ -263,10 +344,13 @@ class ReportBuilder:
 
         return "\n".join(output)
 
-    def _build_section(self, section_name, file_paths, processor_func, force_header=False, empty_line_count=3):
+    def _build_section(self, section_name, file_paths, processor_func, force_header=False, empty_line_count=3,
+                       cache_key=None):
         """
         Builds a section as a list of lines.
         If force_header is True, the header is returned even if there is no content, followed by empty_line_count blanks.
+        With a cache_key (everything processor_func's output depends on), each file's
+        processed text is cached until the file changes.
         """
         header = self._format_section_header(section_name)
         lines = []
@@ -283,10 +367,10 @@ class ReportBuilder:
 
         for file_path in file_paths:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    file_content = f.read()
-
-                processed_text = processor_func(file_content)
+                if cache_key is None:
+                    processed_text = processor_func(self.cache.read_text(file_path))
+                else:
+                    processed_text = self.cache.derive(file_path, cache_key, processor_func)
 
                 # If processor returned empty string (e.g. no matching colors), skip it
                 if processed_text.strip() == "" or processed_text.strip() == "{}":
@@ -617,20 +701,24 @@ class ReportBuilder:
         results = []
         for path in file_paths:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if content:
-                        # Parse and check color match
-                        try:
-                            data = json.loads(content)
-                            # Pretty print with standard 4-space indent
-                            pretty = json.dumps(data, indent=4)
-                            # Add tab prefix to each line
-                            tab_prefixed = '\t' + pretty.replace('\n', '\n\t')
-                            results.append(tab_prefixed)
-                        except json.JSONDecodeError:
-                            # If not valid JSON, skip it
-                            pass
+                formatted = self.cache.derive(path, ("telemetry",), self._format_telemetry)
+                if formatted:
+                    results.append(formatted)
             except:
                 pass
         return results
+
+    def _format_telemetry(self, content):
+        """Pretty-printed, tab-indented telemetry JSON ("" if empty or not JSON)."""
+        content = content.strip()
+        if not content:
+            return ""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            # If not valid JSON, skip it
+            return ""
+        # Pretty print with standard 4-space indent
+        pretty = json.dumps(data, indent=4)
+        # Add tab prefix to each line
+        return '\t' + pretty.replace('\n', '\n\t')
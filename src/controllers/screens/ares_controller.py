@@ -23,6 +23,7 @@ from src.views.components.widgets.alerts_widget import AlertsWidget
 from src.views.components.widgets.telemetry_widget import TelemetryWidget
 from src.views.components.cards.manual_ops_card import ManualOpsCard
 from src.services.ews_capture import EWSScreenshotCapturer
+from src.controllers.ews_controller import log_capture_timing
 from src.utils.logging.app_logger import log_info, log_error
 
 
@@ -153,6 +154,7 @@ class AresScreenController(QObject):
             telemetry_ctrl.set_step_manager(self.step_manager)
             
             telemetry_ctrl.telemetry_updated.connect(self.telemetry_widget.populate_telemetry)
+            telemetry_ctrl.event_received.connect(self.telemetry_widget.add_event)
             telemetry_ctrl.loading_changed.connect(self.telemetry_widget.set_loading)
             telemetry_ctrl.erasing_changed.connect(self.telemetry_widget.set_erasing)
             telemetry_ctrl.status_message.connect(self.screen.status_message.emit)
@@ -170,6 +172,8 @@ class AresScreenController(QObject):
             data_ctrl.data_fetched.connect(self._on_data_fetched)
             data_ctrl.status_message.connect(self.screen.status_message.emit)
             data_ctrl.error_occurred.connect(self.screen.error_occurred.emit)
+            data_ctrl.endpoint_fetched.connect(self.cdm_widget.show_endpoint_result)
+            data_ctrl.error_occurred.connect(self.cdm_widget.end_save_progress)
             
             self.cdm_widget.save_requested.connect(
                 lambda endpoints, variant: data_ctrl.fetch_and_save(endpoints, variant)
@@ -226,6 +230,8 @@ class AresScreenController(QObject):
                     self.screen.error_occurred.emit("EWS Capture failed. Check logs.")
                     return
                 
+                log_capture_timing(timings=capturer.timings)
+                
                 saved_count = 0
                 log_info("ews.capture", "processing", f"Processing {len(screenshots)} screenshots")
                 
@@ -128,6 +128,8 @@ class DuneScreenController:
             data_ctrl.data_fetched.connect(self._on_data_fetched)
             data_ctrl.status_message.connect(self.screen.status_message.emit)
             data_ctrl.error_occurred.connect(self.screen.error_occurred.emit)
+            data_ctrl.endpoint_fetched.connect(self.cdm_widget.show_endpoint_result)
+            data_ctrl.error_occurred.connect(self.cdm_widget.end_save_progress)
             
             self.cdm_widget.save_requested.connect(
                 lambda endpoints, variant: data_ctrl.fetch_and_save(endpoints, variant)
@@ -140,6 +142,8 @@ class DuneScreenController:
             printer_ctrl.set_step_manager(self.step_manager)
             
             printer_ctrl.frame_ready.connect(self.stream_widget.set_frame)
+            printer_ctrl.frame_region_ready.connect(self.stream_widget.update_region)
+            self.stream_widget.visibility_changed.connect(printer_ctrl.set_stream_visible)
             printer_ctrl.connection_status.connect(self.stream_widget.set_status)
             printer_ctrl.connection_status.connect(self._on_connection_status)
             printer_ctrl.error_occurred.connect(self.screen.error_occurred.emit)
@@ -171,6 +175,7 @@ class DuneScreenController:
             telemetry_ctrl.set_step_manager(self.step_manager)
             
             telemetry_ctrl.telemetry_updated.connect(self._on_telemetry_updated)
+            telemetry_ctrl.event_received.connect(self._on_telemetry_event)
             telemetry_ctrl.loading_changed.connect(self.telemetry_widget.set_loading)
             telemetry_ctrl.erasing_changed.connect(self.telemetry_widget.set_erasing)
             telemetry_ctrl.status_message.connect(self.screen.status_message.emit)
@@ -219,6 +224,10 @@ class DuneScreenController:
         """Handle telemetry with Dune-specific formatting."""
         self.telemetry_widget.populate_telemetry(events, is_dune_format=True)
     
+    def _on_telemetry_event(self, event):
+        """Show an event with Dune-specific formatting while the fetch runs."""
+        self.telemetry_widget.add_event(event, is_dune_format=True)
+    
     def _on_snip_completed(self, path: str):
         """Handle snip completion."""
         self.config_manager.set("capture_regions", self.snip_tool.get_regions())
@@ -286,6 +295,11 @@ class DuneScreenController:
                 action.triggered.connect(lambda checked=False, p=param: self._capture_ecl(p))
             
             menu.addAction(action)
+        
+        menu.addSeparator()
+        action_recording = QAction("Save UI Recording", menu)
+        action_recording.triggered.connect(self._save_ui_recording)
+        menu.addAction(action_recording)
         return menu
     
     def _create_ews_menu(self):
@@ -320,6 +334,13 @@ class DuneScreenController:
         else:
             self.screen.error_occurred.emit("Printer controller not available")
     
+    def _save_ui_recording(self):
+        printer_ctrl = self._controllers.get('printer')
+        if printer_ctrl:
+            printer_ctrl.save_recording()
+        else:
+            self.screen.error_occurred.emit("Printer controller not available")
+    
     def _capture_ecl(self, variant: str):
         printer_ctrl = self._controllers.get('printer')
         if printer_ctrl:
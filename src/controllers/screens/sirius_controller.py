@@ -26,6 +26,7 @@ from src.views.components.cards.manual_ops_card import ManualOpsCard
 from src.views.components.cards.data_control_card import DataControlCard
 from src.views.components.cards.printer_view_card import PrinterViewCard
 from src.services.ews_capture import EWSScreenshotCapturer
+from src.controllers.ews_controller import log_capture_timing
 
 
 class SiriusScreenController(QObject):
@@ -130,6 +131,8 @@ class SiriusScreenController(QObject):
             data_ctrl.data_fetched.connect(self._on_data_fetched)
             data_ctrl.status_message.connect(self.screen.status_message.emit)
             data_ctrl.error_occurred.connect(self.screen.error_occurred.emit)
+            data_ctrl.endpoint_fetched.connect(self.ledm_widget.show_endpoint_result)
+            data_ctrl.error_occurred.connect(self.ledm_widget.end_save_progress)
             
             self.ledm_widget.save_requested.connect(
                 lambda endpoints, variant: data_ctrl.fetch_and_save(endpoints, variant)
@@ -156,6 +159,7 @@ class SiriusScreenController(QObject):
             telemetry_ctrl.set_step_manager(self.step_manager)
             
             telemetry_ctrl.telemetry_updated.connect(self.telemetry_widget.populate_telemetry)
+            telemetry_ctrl.event_received.connect(self.telemetry_widget.add_event)
             telemetry_ctrl.loading_changed.connect(self.telemetry_widget.set_loading)
             telemetry_ctrl.erasing_changed.connect(self.telemetry_widget.set_erasing)
             telemetry_ctrl.status_message.connect(self.screen.status_message.emit)
@@ -171,8 +175,10 @@ class SiriusScreenController(QObject):
             printer_ctrl.set_step_manager(self.step_manager)
             printer_ctrl.set_ip(self.ip if self.ip else "")
             printer_ctrl.set_credentials("admin", self.config_manager.get("password", ""))
-            # Convert QPixmap to bytes for SiriusStreamWidget
-            printer_ctrl.frame_ready.connect(self._on_frame_ready)
+            printer_ctrl.frame_ready.connect(self.ui_widget.set_frame)
+            self.ui_widget.display_resized.connect(printer_ctrl.set_display_size)
+            printer_ctrl.set_display_size(self.ui_widget.image_label.size())
+            self.ui_widget.visibility_changed.connect(printer_ctrl.set_stream_visible)
             printer_ctrl.connection_status.connect(self.ui_widget.set_status)
             printer_ctrl.connection_status.connect(self._on_connection_status)
             printer_ctrl.error_occurred.connect(self.screen.error_occurred.emit)
@@ -208,17 +214,6 @@ class SiriusScreenController(QObject):
         """Update widget passwords."""
         self.ui_widget.set_password(pwd)
     
-    # === Frame Handling ===
-    
-    def _on_frame_ready(self, pixmap):
-        """Convert QPixmap to bytes for SiriusStreamWidget."""
-        from PySide6.QtCore import QBuffer, QIODevice
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(buffer, "PNG")
-        image_bytes = bytes(buffer.data())
-        self.ui_widget.set_frame(image_bytes)
-    
     # === UI Status ===
     
     def _on_connection_status(self, connected: bool, message: str):
@@ -256,6 +251,13 @@ class SiriusScreenController(QObject):
             action.triggered.connect(lambda checked=False, v=val: self._capture_ecl(v))
             menu.addAction(action)
         
+        menu.addSeparator()
+        
+        # Recent stream history
+        action_recording = QAction("Save UI Recording", menu)
+        action_recording.triggered.connect(self._save_ui_recording)
+        menu.addAction(action_recording)
+        
         return menu
     
     # === Connection Logic ===
@@ -297,6 +299,14 @@ class SiriusScreenController(QObject):
         else:
             self.screen.error_occurred.emit("Printer controller not available")
     
+    def _save_ui_recording(self):
+        """Save the recent stream history."""
+        printer_ctrl = self._controllers.get('printer')
+        if printer_ctrl:
+            printer_ctrl.save_recording()
+        else:
+            self.screen.error_occurred.emit("Printer controller not available")
+    
     def _on_capture_ews(self):
         if not self.ip:
             self.screen.error_occurred.emit("No IP configured")
@@ -317,6 +327,7 @@ class SiriusScreenController(QObject):
                 directory = self.file_manager.default_directory
                 capturer = EWSScreenshotCapturer(None, snap_ip, directory, password=pwd)
                 screenshots = capturer._capture_ews_screenshots()
+                log_capture_timing(timings=capturer.timings)
                 
                 saved_count = 0
                 for img_bytes, desc in screenshots:
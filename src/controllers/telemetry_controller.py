@@ -2,15 +2,18 @@
 Telemetry Controller - Handles telemetry fetching, viewing, and saving.
 
 This controller coordinates between the UI and the services layer for
-telemetry operations via both HTTP (CDM) and SSH.
+telemetry operations via both HTTP (CDM) and SSH. CDM telemetry fetches
+run on the shared async loop (AsyncPrinterClient).
 """
 import os
 import json
 from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool
 from typing import List, Dict, Optional, Any
 
-from src.services.cdm_api import CDMApiService, CDMApiError
+from src.services.cdm_api import CDMApiError
 from src.services.ssh_service import SSHService, SSHServiceError
+from src.services.async_client import AsyncPrinterClient, submit
+from src.services.directory_index import get_directory_index, UNDERSCORE
 from src.utils.logging.app_logger import log_info, log_error
 
 
@@ -18,25 +21,7 @@ class WorkerSignals(QObject):
     """Signals for async workers."""
     finished = Signal(object)
     error = Signal(str)
-
-
-class FetchCDMTelemetryWorker(QRunnable):
-    """Worker to fetch telemetry via CDM HTTP API."""
-    
-    def __init__(self, service: CDMApiService):
-        super().__init__()
-        self.service = service
-        self.signals = WorkerSignals()
-    
-    @Slot()
-    def run(self):
-        try:
-            events = self.service.fetch_telemetry_events()
-            self.signals.finished.emit(events)
-        except CDMApiError as e:
-            self.signals.error.emit(str(e))
-        except Exception as e:
-            self.signals.error.emit(f"Error fetching telemetry: {str(e)}")
+    event = Signal(dict)  # one telemetry event, as soon as it is received
 
 
 class FetchSSHTelemetryWorker(QRunnable):
@@ -50,8 +35,9 @@ class FetchSSHTelemetryWorker(QRunnable):
     @Slot()
     def run(self):
         try:
-            events = self.ssh_service.fetch_telemetry()
-            self.signals.finished.emit(events)
+            # Incremental: only new/changed event files are downloaded
+            delta = self.ssh_service.sync_telemetry(on_event=self.signals.event.emit)
+            self.signals.finished.emit(delta.events)
         except SSHServiceError as e:
             self.signals.error.emit(str(e))
         except Exception as e:
@@ -70,7 +56,7 @@ class EraseTelemetryWorker(QRunnable):
     @Slot()
     def run(self):
         try:
-            ssh = SSHService(self.ip)
+            ssh = SSHService(self.ip, pooled=True)
             ssh.connect()
             
             if self.use_ssh_files:
@@ -104,6 +90,8 @@ class TelemetryController(QObject):
         status_message(str): Status updates for the UI
         error_occurred(str): Error messages for the UI
         telemetry_updated(list): List of fetched telemetry events
+        event_received(dict): A new SSH telemetry event, emitted while a fetch
+            is still in progress
         loading_changed(bool): Loading state changed
         erasing_changed(bool): Erasing state changed
     """
@@ -111,6 +99,7 @@ class TelemetryController(QObject):
     status_message = Signal(str)
     error_occurred = Signal(str)
     telemetry_updated = Signal(list)
+    event_received = Signal(dict)
     loading_changed = Signal(bool)
     erasing_changed = Signal(bool)
     
@@ -137,16 +126,27 @@ class TelemetryController(QObject):
         self._directory: str = os.getcwd()
         self._step_manager = None
         
-        self._cdm_service: Optional[CDMApiService] = None
+        self._client: Optional[AsyncPrinterClient] = None
         self._ssh_service: Optional[SSHService] = None
+        self._shown_events: Optional[List[Dict[str, Any]]] = None  # Last list sent to the UI
+        self._streamed = False  # The UI was changed by streamed events since _shown_events
+        
+        # Results of async CDM fetches, delivered from the loop thread to this (GUI) thread
+        self._fetch_signals = WorkerSignals()
+        self._fetch_signals.finished.connect(self._on_fetch_success)
+        self._fetch_signals.error.connect(self._on_fetch_error)
     
     def set_ip(self, ip: str) -> None:
         """Update the target IP address."""
+        if ip != self._ip:
+            self._shown_events = None
         self._ip = ip
         if self.use_ssh:
-            self._ssh_service = SSHService(ip) if ip else None
-        else:
-            self._cdm_service = CDMApiService(ip) if ip else None
+            self._ssh_service = SSHService(ip, pooled=True) if ip else None
+        elif self._client is None or self._client.ip != ip:
+            if self._client is not None:
+                submit(self._client.close())
+            self._client = AsyncPrinterClient(ip) if ip else None
     
     def set_directory(self, directory: str) -> None:
         """Update the output directory."""
@@ -170,23 +170,55 @@ class TelemetryController(QObject):
         self.status_message.emit("Fetching telemetry...")
         log_info("telemetry.fetch", "started", "Fetching telemetry", {"ip": self._ip})
         
-        if self.use_ssh:
-            if not self._ssh_service:
-                self._ssh_service = SSHService(self._ip)
-            worker = FetchSSHTelemetryWorker(self._ssh_service)
-        else:
-            if not self._cdm_service:
-                self._cdm_service = CDMApiService(self._ip)
-            worker = FetchCDMTelemetryWorker(self._cdm_service)
+        if not self.use_ssh:
+            if not self._client:
+                self._client = AsyncPrinterClient(self._ip)
+            # Unchanged responses come from the response cache
+            submit(self._client.fetch_telemetry_events(), self._deliver_fetch)
+            return
         
+        if not self._ssh_service:
+            self._ssh_service = SSHService(self._ip, pooled=True)
+        if not self._ssh_service.telemetry_synced:
+            # Full resync: streamed events start from an empty list
+            self._streamed = True
+            self.telemetry_updated.emit([])
+        worker = FetchSSHTelemetryWorker(self._ssh_service)
+        worker.signals.event.connect(self._on_event)
         worker.signals.finished.connect(self._on_fetch_success)
         worker.signals.error.connect(self._on_fetch_error)
         
         self.thread_pool.start(worker)
     
+    def _deliver_fetch(self, future) -> None:
+        """Hand a finished CDM fetch to the GUI thread (runs on the async loop)."""
+        try:
+            self._fetch_signals.finished.emit(future.result())
+        except CDMApiError as e:
+            self._fetch_signals.error.emit(str(e))
+        except Exception as e:
+            self._fetch_signals.error.emit(f"Error fetching telemetry: {str(e)}")
+    
+    def _on_event(self, event: Dict[str, Any]) -> None:
+        """Pass on an event received while an SSH fetch is running."""
+        self._streamed = True
+        self.event_received.emit(event)
+    
     def _on_fetch_success(self, events: List[Dict[str, Any]]) -> None:
-        """Handle successful telemetry fetch."""
+        """Handle successful telemetry fetch. Skips the UI rebuild if this view already shows the same events."""
+        # The response cache is process-wide: another tab may have fetched
+        # these events first, so compare with what this controller sent.
+        # Streamed events changed the view in place, so it is always rebuilt then.
+        changed = self._streamed or self._shown_events is None or not (
+            events is self._shown_events or events == self._shown_events
+        )
+        self._streamed = False
         self.loading_changed.emit(False)
+        if not changed:
+            self.status_message.emit("Telemetry unchanged")
+            log_info("telemetry.fetch", "succeeded", "Telemetry unchanged", {"ip": self._ip})
+            return
+        self._shown_events = events
         self.telemetry_updated.emit(events)
         self.status_message.emit(f"Fetched {len(events)} telemetry events")
         log_info("telemetry.fetch", "succeeded", f"Fetched {len(events)} events", {
@@ -196,6 +228,10 @@ class TelemetryController(QObject):
     
     def _on_fetch_error(self, error_msg: str) -> None:
         """Handle telemetry fetch error."""
+        if self._streamed:
+            # Don't leave a partly streamed list on screen
+            self._streamed = False
+            self.telemetry_updated.emit(self._shown_events or [])
         self.loading_changed.emit(False)
         log_error("telemetry.fetch", "failed", error_msg, {"ip": self._ip})
         self.error_occurred.emit("Telemetry failed to update")
@@ -279,17 +315,19 @@ class TelemetryController(QObject):
                 step_str = f"{self._step_manager.get_step()}. "
             
             base_filename = f"{step_str}Telemetry_{color_part}_{reasons_part}_{trigger_part}"
-            filepath = os.path.join(self._directory, f"{base_filename}.json")
             
             # Handle existing file
-            counter = 1
-            while os.path.exists(filepath):
-                filepath = os.path.join(self._directory, f"{base_filename}_{counter}.json")
-                counter += 1
+            index = get_directory_index(self._directory)
+            filepath = os.path.join(self._directory, index.next_free_name(base_filename, ".json", UNDERSCORE))
             
             # Save JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(event_data, f, indent=4)
+            try:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(event_data, f, indent=4)
+            except Exception:
+                index.release(filepath)
+                raise
+            index.add(filepath)
             
             self.status_message.emit(f"Saved: {os.path.basename(filepath)}")
             log_info("telemetry.save", "succeeded", f"Saved telemetry to {filepath}")
@@ -12,6 +12,7 @@ from .families import (
     get_family_config,
 )
 from .step_manager import QtStepManager
+from .log_model import LogTableModel, LogFilterModel
 
 __all__ = [
     # App State
@@ -21,6 +22,10 @@ __all__ = [
     # Step Management
     "QtStepManager",
     
+    # Log Viewer
+    "LogTableModel",
+    "LogFilterModel",
+    
     # Family Configurations
     "BaseFamilyConfig",
     "DuneIICConfig",
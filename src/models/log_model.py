@@ -0,0 +1,306 @@
+"""
+Log Model - Item models behind the Application Log screen.
+
+LogTableModel holds the recent log entries (newest first) and only ever
+inserts new rows at the top or drops the oldest from the bottom, so views
+repaint just what changed. LogFilterModel is a proxy over it that keeps the
+list of entries matching the level and search filters: new entries are
+tested once as they arrive, and a search that only grows (typing more
+characters) is narrowed from the previous matches instead of rescanning
+every entry. Matching uses each entry's precomputed lowercase search_text.
+"""
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+
+from src.utils.logging.app_logger import DEFAULT_MAX_ENTRIES, LogEntry
+
+LOG_COLUMNS = ["Time", "Level", "Action", "Message"]
+
+EntryRole = Qt.ItemDataRole.UserRole   # data() role returning the LogEntry itself
+
+
+class LogTableModel(QAbstractTableModel):
+    """
+    Bounded store of log entries, shown newest first.
+
+    Entries are kept oldest first and addressed by an absolute position
+    that never changes while the entry is in the store (the first entry
+    ever added is 0), which lets the filter proxy keep plain integer lists.
+    Live entries with a seq not above the last snapshot (or clear) are
+    ignored, so a snapshot and the live signal can be combined without
+    duplicates. Later live entries are all kept, even when threads
+    deliver them slightly out of seq order.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, parent=None):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_entries: Entries kept; the oldest are dropped beyond this
+                (in chunks, so dropping is not paid on every new entry)
+        """
+        super().__init__(parent)
+        self.max_entries = max(1, int(max_entries))
+        self._entries: List[LogEntry] = []  # Oldest first
+        self._first = 0                     # Absolute position of _entries[0]
+        self._last_seq = 0                  # Highest seq added so far
+        self._snapshot_seq = 0              # Highest seq covered by the last reset
+
+    # -------------------------------------------------------------------------
+    # Store
+    # -------------------------------------------------------------------------
+
+    @property
+    def first_position(self) -> int:
+        """Absolute position of the oldest entry in the store."""
+        return self._first
+
+    @property
+    def end_position(self) -> int:
+        """Absolute position the next entry will get."""
+        return self._first + len(self._entries)
+
+    def entry_at(self, position: int) -> Optional[LogEntry]:
+        """The entry at an absolute position, or None if it was dropped."""
+        offset = position - self._first
+        if 0 <= offset < len(self._entries):
+            return self._entries[offset]
+        return None
+
+    def position_of_row(self, row: int) -> int:
+        """Absolute position of a (newest first) row."""
+        return self._first + len(self._entries) - 1 - row
+
+    def row_of_position(self, position: int) -> int:
+        """Row showing an absolute position."""
+        return self._first + len(self._entries) - 1 - position
+
+    def append_entries(self, entries: Sequence[LogEntry]) -> None:
+        """Add entries (oldest first) at the top, dropping old ones if full."""
+        new = [entry for entry in entries if entry.seq == 0 or entry.seq > self._snapshot_seq]
+        if not new:
+            return
+        self._last_seq = max(self._last_seq, max(entry.seq for entry in new))
+
+        self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+        self._entries.extend(new)
+        self.endInsertRows()
+
+        # Let the store overshoot by a tenth before trimming back to size
+        excess = len(self._entries) - self.max_entries
+        if excess > max(1, self.max_entries // 10):
+            self._drop_oldest(excess)
+
+    def reset_entries(self, entries: Sequence[LogEntry]) -> None:
+        """Replace the store with entries (oldest first), e.g. a buffer snapshot."""
+        self.beginResetModel()
+        self._first += len(self._entries)
+        self._entries = list(entries[-self.max_entries:])
+        self._last_seq = max([self._last_seq] + [entry.seq for entry in self._entries])
+        self._snapshot_seq = self._last_seq
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove every entry (entries already seen stay ignored)."""
+        self.reset_entries([])
+
+    def set_max_entries(self, max_entries: int) -> None:
+        """Change the capacity, dropping the oldest entries if needed."""
+        self.max_entries = max(1, int(max_entries))
+        excess = len(self._entries) - self.max_entries
+        if excess > 0:
+            self._drop_oldest(excess)
+
+    def _drop_oldest(self, count: int) -> None:
+        rows = len(self._entries)
+        self.beginRemoveRows(QModelIndex(), rows - count, rows - 1)
+        del self._entries[:count]
+        self._first += count
+        self.endRemoveRows()
+
+    # -------------------------------------------------------------------------
+    # QAbstractTableModel
+    # -------------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(LOG_COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entry_at(self.position_of_row(index.row()))
+        return entry_data(entry, index.column(), role)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(LOG_COLUMNS)):
+            return LOG_COLUMNS[section]
+        return None
+
+
+def entry_data(entry: Optional[LogEntry], column: int, role):
+    """Cell value of a log entry for a column and role."""
+    if entry is None:
+        return None
+    if role == EntryRole:
+        return entry
+    if role == Qt.ItemDataRole.DisplayRole:
+        if column == 0:
+            return entry.timestamp.strftime("%H:%M:%S")
+        if column == 1:
+            return entry.level
+        if column == 2:
+            return entry.action or entry.status
+        if column == 3:
+            return entry.message
+    return None
+
+
+class LogFilterModel(QAbstractProxyModel):
+    """
+    Level/search filtered view of a LogTableModel.
+
+    Keeps the absolute positions of the matching entries in ascending
+    order; proxy row r is the r-th newest match.
+    """
+
+    def __init__(self, source: LogTableModel, parent=None):
+        super().__init__(parent)
+        self._level: Optional[str] = None   # Upper-case level name, None for all
+        self._query = ""                    # Lower-case search text
+        self._matches: List[int] = []
+        self.setSourceModel(source)
+        source.rowsInserted.connect(self._on_rows_inserted)
+        source.rowsRemoved.connect(self._on_rows_removed)
+        source.modelReset.connect(self._on_model_reset)
+        self._rebuild(range(source.first_position, source.end_position))
+
+    # -------------------------------------------------------------------------
+    # Filtering
+    # -------------------------------------------------------------------------
+
+    @property
+    def level(self) -> Optional[str]:
+        return self._level
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def set_filter(self, level: Optional[str] = None, query: str = "") -> None:
+        """
+        Show only entries of a level containing a search text.
+
+        Args:
+            level: Level name ("Info", "Error", ...); None or "All" shows every level
+            query: Case-insensitive text to find in the message, action,
+                status or details
+        """
+        level = None if not level or level.lower() == "all" else level.upper()
+        query = query.lower().strip()
+        if level == self._level and query == self._query:
+            return
+
+        source = self.sourceModel()
+        if level == self._level and self._query in query:
+            # The new search only narrows the old one: test just the current matches
+            candidates = self._matches
+        else:
+            candidates = range(source.first_position, source.end_position)
+        self._level, self._query = level, query
+
+        self.beginResetModel()
+        self._rebuild(candidates)
+        self.endResetModel()
+
+    def entry(self, row: int) -> Optional[LogEntry]:
+        """The entry shown in a proxy row."""
+        if 0 <= row < len(self._matches):
+            return self.sourceModel().entry_at(self._matches[len(self._matches) - 1 - row])
+        return None
+
+    def _accepts(self, entry: Optional[LogEntry]) -> bool:
+        if entry is None:
+            return False
+        if self._level is not None and entry.level != self._level:
+            return False
+        return not self._query or self._query in entry.search_text
+
+    def _rebuild(self, candidates) -> None:
+        entry_at = self.sourceModel().entry_at
+        self._matches = [position for position in candidates if self._accepts(entry_at(position))]
+
+    def _on_rows_inserted(self, parent, first, last) -> None:
+        source = self.sourceModel()
+        end = source.end_position
+        entry_at = source.entry_at
+        new = [position for position in range(end - (last - first + 1), end)
+               if self._accepts(entry_at(position))]
+        if not new:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+        self._matches.extend(new)
+        self.endInsertRows()
+
+    def _on_rows_removed(self, parent, first, last) -> None:
+        count = bisect_left(self._matches, self.sourceModel().first_position)
+        if not count:
+            return
+        rows = len(self._matches)
+        self.beginRemoveRows(QModelIndex(), rows - count, rows - 1)
+        del self._matches[:count]
+        self.endRemoveRows()
+
+    def _on_model_reset(self) -> None:
+        source = self.sourceModel()
+        self.beginResetModel()
+        self._rebuild(range(source.first_position, source.end_position))
+        self.endResetModel()
+
+    # -------------------------------------------------------------------------
+    # QAbstractProxyModel
+    # -------------------------------------------------------------------------
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._matches)) or not (0 <= column < len(LOG_COLUMNS)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._matches)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(LOG_COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        return entry_data(self.entry(index.row()), index.column(), role)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or not (0 <= proxy_index.row() < len(self._matches)):
+            return QModelIndex()
+        position = self._matches[len(self._matches) - 1 - proxy_index.row()]
+        source = self.sourceModel()
+        return source.index(source.row_of_position(position), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        position = self.sourceModel().position_of_row(source_index.row())
+        i = bisect_left(self._matches, position)
+        if i == len(self._matches) or self._matches[i] != position:
+            return QModelIndex()
+        return self.createIndex(len(self._matches) - 1 - i, source_index.column())
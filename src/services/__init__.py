@@ -1,18 +1,74 @@
 # Service Layer - External communication (HTTP, VNC, SSH) and utilities
 
-from .cdm_api import CDMApiService, CDMApiError, fetch_cdm_data
-from .ledm_api import LEDMApiService, LEDMApiError, LEDMEndpoints, fetch_ledm_data
-from .ssh_service import SSHService, SSHServiceError, ssh_exec
-from .vnc_service import VNCService, VNCServiceError
-from .sirius_stream_service import SiriusStreamService, SiriusStreamError
-from .ews_service import EWSService, EWSServiceError, capture_ews_screenshot
-from .config_service import ConfigManager
-from .file_service import FileManager
-from .theme_service import ThemeManager
-from .ews_capture import EWSScreenshotCapturer
-from .sirius_connection import SiriusConnection
+import importlib
+
+# Submodules are imported on first attribute access, so importing one
+# Qt-free piece (e.g. from a command-line tool) does not pull in the rest.
+_EXPORTS = {
+    "HttpSessionPool": ".http_pool",
+    "get_http_pool": ".http_pool",
+    "fetch_concurrently": ".fetch_engine",
+    "set_max_concurrency": ".fetch_engine",
+    "CDMApiService": ".cdm_api",
+    "CDMApiError": ".cdm_api",
+    "fetch_cdm_data": ".cdm_api",
+    "LEDMApiService": ".ledm_api",
+    "LEDMApiError": ".ledm_api",
+    "LEDMEndpoints": ".ledm_api",
+    "fetch_ledm_data": ".ledm_api",
+    "SSHConnectionPool": ".ssh_pool",
+    "get_ssh_pool": ".ssh_pool",
+    "SSHService": ".ssh_service",
+    "SSHServiceError": ".ssh_service",
+    "ssh_exec": ".ssh_service",
+    "VNCService": ".vnc_service",
+    "VNCServiceError": ".vnc_service",
+    "VNCFrame": ".vnc_service",
+    "VNCFrameUpdate": ".vnc_service",
+    "VNCRect": ".vnc_service",
+    "VNCInputQueue": ".vnc_input",
+    "TileChangeDetector": ".frame_change",
+    "FrameMailbox": ".frame_mailbox",
+    "StreamRecorder": ".stream_recorder",
+    "configure_recording": ".stream_recorder",
+    "SiriusStreamService": ".sirius_stream_service",
+    "SiriusStreamError": ".sirius_stream_service",
+    "BrowserPool": ".browser_pool",
+    "get_browser_pool": ".browser_pool",
+    "EWSService": ".ews_service",
+    "EWSServiceError": ".ews_service",
+    "capture_ews_screenshot": ".ews_service",
+    "ConfigManager": ".config_service",
+    "FileManager": ".file_service",
+    "DirectoryIndex": ".directory_index",
+    "get_directory_index": ".directory_index",
+    "DocumentCache": ".document_cache",
+    "get_document_cache": ".document_cache",
+    "ThemeManager": ".theme_service",
+    "EWSScreenshotCapturer": ".ews_capture",
+    "SiriusConnection": ".sirius_connection",
+    "AsyncPrinterClient": ".async_client",
+    "AsyncRunner": ".async_client",
+    "get_async_runner": ".async_client",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    # HTTP session pool (shared by CDM, LEDM, Sirius)
+    "HttpSessionPool",
+    "get_http_pool",
+    "fetch_concurrently",
+    "set_max_concurrency",
+    
     # CDM (Dune, Ares)
     "CDMApiService",
     "CDMApiError",
@@ -28,10 +84,20 @@ __all__ = [
     "SSHService",
     "SSHServiceError",
     "ssh_exec",
+    "SSHConnectionPool",
+    "get_ssh_pool",
     
     # VNC (Dune)
     "VNCService",
     "VNCServiceError",
+    "VNCFrame",
+    "VNCFrameUpdate",
+    "VNCRect",
+    "VNCInputQueue",
+    "TileChangeDetector",
+    "FrameMailbox",
+    "StreamRecorder",
+    "configure_recording",
     
     # Sirius Stream
     "SiriusStreamService",
@@ -42,12 +108,23 @@ __all__ = [
     "EWSServiceError",
     "capture_ews_screenshot",
     "EWSScreenshotCapturer",
+    "BrowserPool",
+    "get_browser_pool",
     
     # Configuration & Files
     "ConfigManager",
     "FileManager",
+    "DirectoryIndex",
+    "get_directory_index",
+    "DocumentCache",
+    "get_document_cache",
     "ThemeManager",
     
     # Connections
     "SiriusConnection",
+    
+    # Async client layer (one shared event loop)
+    "AsyncPrinterClient",
+    "AsyncRunner",
+    "get_async_runner",
 ]
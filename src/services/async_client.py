@@ -0,0 +1,489 @@
+"""
+Async Client - asyncio-native printer operations on one background event loop.
+
+A single event loop runs on a daemon thread for the whole process. Callers
+(including Qt controllers) hand it coroutines with submit() and get a
+concurrent.futures.Future back, so dozens of printer operations can be in
+flight without tying up one worker thread each.
+
+HTTP uses aiohttp and SSH uses asyncssh (both in requirements.txt). If
+they are missing, the same coroutines run the synchronous services on a
+small bounded executor, so callers never need to know which backend is
+active. Alert and telemetry polling go through the shared response cache
+either way.
+No Qt or UI dependencies.
+"""
+import asyncio
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import asyncssh
+    ASYNCSSH_AVAILABLE = True
+except ImportError:
+    ASYNCSSH_AVAILABLE = False
+
+from src.services.cdm_api import (
+    CDMApiService, CDMApiError, normalize_alerts, normalize_telemetry_events,
+    ALERTS_ENDPOINT as CDM_ALERTS_ENDPOINT, TELEMETRY_ENDPOINT,
+    DEFAULT_TIMEOUT, SHORT_TIMEOUT
+)
+from src.services.ledm_api import (
+    LEDMApiService, LEDMApiError, parse_alerts_xml,
+    ALERTS_ENDPOINT as LEDM_ALERTS_ENDPOINT
+)
+from src.services.sirius_stream_service import SiriusStreamService
+from src.services.ssh_service import (
+    SSHService, SSHServiceError, build_telemetry_command, parse_telemetry_output
+)
+from src.services.fetch_engine import get_max_concurrency
+from src.services.response_cache import get_response_cache, resolve_response
+
+# Threads used for blocking calls when aiohttp/asyncssh are not installed
+FALLBACK_WORKERS = 8
+
+
+class AsyncRunner:
+    """
+    Owns the process-wide asyncio event loop and its thread.
+
+    The loop starts lazily on first submit() and runs until shutdown().
+    Thread safety: submit() and shutdown() may be called from any thread.
+    """
+
+    def __init__(self, fallback_workers: int = FALLBACK_WORKERS):
+        """
+        Initialize the runner.
+
+        Args:
+            fallback_workers: Max threads for blocking calls (sync fallbacks).
+        """
+        self._fallback_workers = fallback_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop (started on first access)."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start_locked()
+            return self._loop
+
+    def _start_locked(self) -> None:
+        """Start the loop thread. Caller must hold the lock."""
+        self._loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._fallback_workers, thread_name_prefix="async-blocking"
+        )
+        self._loop.set_default_executor(self._executor)
+
+        started = threading.Event()
+
+        def _run(loop: asyncio.AbstractEventLoop) -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(
+            target=_run, args=(self._loop,), name="async-printer-loop", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+
+    def submit(
+        self,
+        coro: Awaitable[Any],
+        callback: Optional[Callable[[Future], None]] = None
+    ) -> Future:
+        """
+        Schedule a coroutine on the background loop.
+
+        Args:
+            coro: Coroutine to run
+            callback: Optional function called with the finished Future. It
+                runs on the loop thread, so Qt callers should only emit a
+                signal from it.
+
+        Returns:
+            A concurrent.futures.Future for the coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if callback:
+            future.add_done_callback(callback)
+        return future
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking function on the bounded fallback executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the loop and its thread."""
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread:
+            thread.join(timeout=timeout)
+        if executor:
+            executor.shutdown(wait=False)
+        if not loop.is_running():
+            loop.close()
+
+
+# Process-wide runner shared by all async clients
+_async_runner = AsyncRunner()
+
+# Per-printer HTTP request limits (loop thread only), keyed by IP
+_printer_limits: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_async_runner() -> AsyncRunner:
+    """Return the process-wide async runner."""
+    return _async_runner
+
+
+def submit(
+    coro: Awaitable[Any],
+    callback: Optional[Callable[[Future], None]] = None
+) -> Future:
+    """Schedule a coroutine on the shared background loop (see AsyncRunner.submit)."""
+    return _async_runner.submit(coro, callback)
+
+
+class AsyncPrinterClient:
+    """
+    Async counterpart of the CDM/LEDM, Sirius stream and SSH services.
+
+    Method names and return values match the synchronous services, and
+    errors are raised as the same CDMApiError / LEDMApiError /
+    SSHServiceError types. Coroutines must run on the shared loop, e.g.
+    submit(client.fetch_alerts()).
+    In-flight HTTP requests per printer (across all clients for that IP)
+    are capped at fetch_engine's max concurrency.
+    """
+
+    def __init__(
+        self,
+        ip: str,
+        use_ledm: bool = False,
+        auth: Optional[Tuple[str, str]] = None,
+        ssh_username: str = SSHService.DEFAULT_USERNAME,
+        ssh_password: str = SSHService.DEFAULT_PASSWORD
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            ip: The IP address of the printer.
+            use_ledm: If True, talk LEDM (Sirius); otherwise CDM.
+            auth: Optional (username, password) for screen capture.
+            ssh_username: SSH username.
+            ssh_password: SSH password.
+        """
+        self.ip = ip
+        self.use_ledm = use_ledm
+        self.auth = auth
+        self.ssh_username = ssh_username
+        self.ssh_password = ssh_password
+
+        # Created lazily on the loop thread
+        self._http = None
+        self._ssh_conn = None
+        self._ssh_lock: Optional[asyncio.Lock] = None
+
+        # Synchronous fallbacks
+        self._sync_ssh: Optional[SSHService] = None
+        self._sync_ssh_lock = threading.Lock()
+
+    @property
+    def _error_cls(self) -> type:
+        return LEDMApiError if self.use_ledm else CDMApiError
+
+    def _sync_service(self):
+        """Synchronous service used when aiohttp is not installed."""
+        return LEDMApiService(self.ip) if self.use_ledm else CDMApiService(self.ip)
+
+    def _url(self, endpoint: str) -> str:
+        """Build the URL the same way the synchronous services do."""
+        if self.use_ledm:
+            # LEDM uses HTTP, not HTTPS
+            if not endpoint.startswith('/'):
+                endpoint = f"/{endpoint}"
+            return f"http://{self.ip}{endpoint}"
+        return f"https://{self.ip}/{endpoint.lstrip('/')}"
+
+    # -------------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------------
+
+    def _limit(self) -> asyncio.Semaphore:
+        """The printer's request limit, shared by every client for this IP."""
+        limit = _printer_limits.get(self.ip)
+        if limit is None:
+            limit = _printer_limits[self.ip] = asyncio.Semaphore(get_max_concurrency())
+        return limit
+
+    def _session(self):
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=get_max_concurrency(), ssl=False)
+            self._http = aiohttp.ClientSession(connector=connector)
+        return self._http
+
+    async def _get(self, url: str, timeout: float = DEFAULT_TIMEOUT,
+                   auth: Optional[Tuple[str, str]] = None, error_cls: Optional[type] = None) -> bytes:
+        """
+        Perform a GET request and return the body.
+
+        Raises:
+            CDMApiError / LEDMApiError (or error_cls): If the request fails
+        """
+        _, body, _ = await self._request(url, timeout, auth, error_cls)
+        return body
+
+    async def _request(self, url: str, timeout: float = DEFAULT_TIMEOUT,
+                       auth: Optional[Tuple[str, str]] = None, error_cls: Optional[type] = None,
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes, Any]:
+        """
+        Perform a GET request.
+
+        Returns:
+            Tuple of (status, body, response headers); status is below 400
+
+        Raises:
+            CDMApiError / LEDMApiError (or error_cls): If the request fails
+        """
+        error_cls = error_cls or self._error_cls
+        basic_auth = aiohttp.BasicAuth(*auth) if auth else None
+
+        try:
+            async with self._limit():
+                async with self._session().get(
+                    url, auth=basic_auth, headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    if response.status == 401 and not self.use_ledm:
+                        raise error_cls("Unauthorized (401): Authentication required.")
+                    if response.status >= 400:
+                        raise error_cls(f"HTTP error: {response.status}")
+                    return response.status, await response.read(), response.headers
+        except error_cls:
+            raise
+        except asyncio.TimeoutError:
+            raise error_cls("Connection timed out. Check IP address.")
+        except aiohttp.ClientConnectionError:
+            raise error_cls("Failed to connect to printer.")
+        except Exception as e:
+            raise error_cls(f"Request failed: {str(e)}")
+
+    async def _get_text(self, endpoint: str, timeout: float = DEFAULT_TIMEOUT) -> str:
+        body = await self._get(self._url(endpoint), timeout)
+        return body.decode('utf-8', errors='replace')
+
+    async def _get_cached(self, endpoint: str, parse: Callable[[bytes], Any],
+                          timeout: float = DEFAULT_TIMEOUT) -> Any:
+        """
+        GET an endpoint through the shared response cache (see CDMApiService._get_cached).
+
+        Args:
+            endpoint: The API endpoint path (the cache key, as the sync services use it)
+            parse: Function turning the response body into the cached object
+            timeout: Request timeout in seconds
+
+        Returns:
+            The parsed data (the cached object when unchanged)
+        """
+        cache = get_response_cache()
+        entry = cache.lookup(self.ip, endpoint)
+        status, body, headers = await self._request(
+            self._url(endpoint), timeout, headers=entry.validators() if entry else None
+        )
+        return resolve_response(cache, self.ip, endpoint, entry, status, body, headers,
+                                lambda: parse(body))
+
+    def _parse_json(self, body: bytes) -> Any:
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise self._error_cls(f"Invalid JSON response: {str(e)}")
+
+    async def fetch_alerts(self) -> List[Dict[str, Any]]:
+        """
+        Fetch alerts from the printer.
+
+        The cached list is reused if the printer's response is unchanged.
+
+        Returns:
+            List of alert dictionaries (same format as the sync services)
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await _async_runner.run_blocking(self._sync_service().fetch_alerts)
+
+        if self.use_ledm:
+            return await self._get_cached(
+                LEDM_ALERTS_ENDPOINT, lambda body: parse_alerts_xml(body.decode('utf-8', errors='replace'))
+            )
+        return await self._get_cached(
+            CDM_ALERTS_ENDPOINT, lambda body: normalize_alerts(self._parse_json(body)), SHORT_TIMEOUT
+        )
+
+    async def fetch_telemetry_events(self) -> List[Dict[str, Any]]:
+        """
+        Fetch telemetry/supply events from a CDM printer.
+
+        The cached list is reused if the printer's response is unchanged.
+
+        Returns:
+            List of telemetry event dictionaries
+        """
+        if self.use_ledm:
+            raise LEDMApiError("Telemetry events are not available over LEDM")
+        if not AIOHTTP_AVAILABLE:
+            return await _async_runner.run_blocking(self._sync_service().fetch_telemetry_events)
+
+        return await self._get_cached(
+            TELEMETRY_ENDPOINT, lambda body: normalize_telemetry_events(self._parse_json(body)), SHORT_TIMEOUT
+        )
+
+    async def fetch_endpoint(self, endpoint: str) -> str:
+        """Fetch raw text content from any endpoint."""
+        if not AIOHTTP_AVAILABLE:
+            return await _async_runner.run_blocking(self._sync_service().fetch_endpoint, endpoint)
+        return await self._get_text(endpoint)
+
+    async def fetch_endpoints(
+        self,
+        endpoints: List[str],
+        on_result: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
+        """
+        Fetch multiple endpoints concurrently.
+
+        Args:
+            endpoints: List of endpoint paths
+            on_result: Optional callback called on the loop thread with
+                (endpoint, text) as each endpoint finishes
+
+        Returns:
+            Dict mapping endpoint to response text (or "Error: ..." message),
+            in the same order as endpoints
+        """
+        async def _fetch(endpoint: str) -> str:
+            try:
+                text = await self.fetch_endpoint(endpoint)
+            except Exception as e:
+                text = f"Error: {str(e)}"
+            if on_result:
+                on_result(endpoint, text)
+            return text
+
+        unique = list(dict.fromkeys(endpoints))
+        texts = await asyncio.gather(*(_fetch(endpoint) for endpoint in unique))
+        return dict(zip(unique, texts))
+
+    async def capture_screen(self) -> Optional[bytes]:
+        """
+        Capture the current Sirius screen as image bytes.
+
+        Returns:
+            PNG/JPEG image bytes, or None if failed
+        """
+        if not AIOHTTP_AVAILABLE:
+            service = SiriusStreamService(self.ip, *(self.auth or (None, None)))
+            return await _async_runner.run_blocking(service.capture_screen)
+
+        url = f"https://{self.ip}{SiriusStreamService.CAPTURE_ENDPOINT}"
+        try:
+            return await self._get(url, SiriusStreamService.DEFAULT_TIMEOUT, self.auth)
+        except self._error_cls:
+            return None
+
+    # -------------------------------------------------------------------------
+    # SSH
+    # -------------------------------------------------------------------------
+
+    async def _ssh_connection(self):
+        if self._ssh_lock is None:
+            self._ssh_lock = asyncio.Lock()
+
+        async with self._ssh_lock:
+            if self._ssh_conn is None or self._ssh_conn.is_closed():
+                try:
+                    self._ssh_conn = await asyncssh.connect(
+                        self.ip,
+                        username=self.ssh_username,
+                        password=self.ssh_password,
+                        known_hosts=None,
+                        connect_timeout=SSHService.DEFAULT_TIMEOUT
+                    )
+                except asyncssh.PermissionDenied:
+                    raise SSHServiceError("SSH authentication failed. Check credentials.")
+                except (asyncssh.Error, OSError) as e:
+                    raise SSHServiceError(f"Failed to connect: {str(e)}")
+            return self._ssh_conn
+
+    def _sync_ssh_exec(self, command: str, timeout: int) -> Tuple[str, str, int]:
+        with self._sync_ssh_lock:
+            if self._sync_ssh is None:
+                self._sync_ssh = SSHService(self.ip, self.ssh_username, self.ssh_password, pooled=True)
+            self._sync_ssh.connect()
+        return self._sync_ssh.exec_command(command, timeout=timeout)
+
+    async def ssh_exec(self, command: str, timeout: int = 30) -> Tuple[str, str, int]:
+        """
+        Execute a command over SSH, reusing one connection per client.
+
+        Returns:
+            Tuple of (stdout_text, stderr_text, exit_code)
+
+        Raises:
+            SSHServiceError: If connection or execution fails
+        """
+        if not ASYNCSSH_AVAILABLE:
+            return await _async_runner.run_blocking(self._sync_ssh_exec, command, timeout)
+
+        conn = await self._ssh_connection()
+        try:
+            result = await conn.run(command, timeout=timeout, check=False)
+        except Exception as e:
+            raise SSHServiceError(f"Command execution failed: {str(e)}")
+        return result.stdout or "", result.stderr or "", result.exit_status or 0
+
+    async def fetch_telemetry(self) -> List[Dict[str, Any]]:
+        """Fetch and parse telemetry files over SSH (see SSHService.fetch_telemetry)."""
+        stdout, _, _ = await self.ssh_exec(
+            build_telemetry_command(SSHService.TELEMETRY_PATH, SSHService.TELEMETRY_PATTERN)
+        )
+        return parse_telemetry_output(stdout)
+
+    # -------------------------------------------------------------------------
+    # Cleanup
+    # -------------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Close HTTP and SSH connections held by this client."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+        if self._ssh_conn is not None:
+            self._ssh_conn.close()
+            self._ssh_conn = None
+
+        if self._sync_ssh is not None:
+            await _async_runner.run_blocking(self._sync_ssh.disconnect)
+            self._sync_ssh = None
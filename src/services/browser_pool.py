@@ -0,0 +1,277 @@
+"""
+Browser Pool - One long-lived headless Chromium for EWS captures.
+
+Starting Chromium takes far longer than rendering an EWS page, so the
+browser is launched once, on first use, and kept warm. Each printer
+(IP + admin password) gets its own authenticated browser context, whose
+pages are reused between captures. At most max_tabs pages load at the
+same time; further captures wait for a free tab. Everything is closed again after the
+pool has been idle for idle_timeout seconds, and relaunched if Chromium
+crashes.
+
+Playwright objects must stay on the event loop that created them, so the
+pool lives on the shared async loop (see async_client.get_async_runner());
+synchronous callers use run().
+No Qt or UI dependencies.
+"""
+import asyncio
+import atexit
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+from src.services.async_client import get_async_runner
+
+# Default pool settings
+DEFAULT_IDLE_TIMEOUT = 300.0    # Seconds before an unused browser is closed
+DEFAULT_MAX_TABS = 4            # Pages loading at the same time
+MAX_IDLE_PAGES = 8              # Blank pages kept open per printer for reuse
+
+
+class _PooledContext:
+    """An authenticated browser context plus its pages waiting for reuse."""
+
+    def __init__(self, context):
+        self.context = context
+        self.idle_pages: List[Any] = []
+        self.closed = False
+
+
+class BrowserPool:
+    """
+    Lazily started, shared headless browser with per-printer contexts.
+
+    Counters:
+        launches: Times Chromium was started (more than one means it was
+            closed for idleness or crashed in between)
+
+    Thread safety: Coroutines must run on the shared loop (run() does that
+    from any thread); all pool state is only touched there.
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 max_tabs: int = DEFAULT_MAX_TABS):
+        """
+        Initialize the pool (nothing is started until the first capture).
+
+        Args:
+            idle_timeout: Seconds of inactivity before the browser is closed.
+            max_tabs: Pages that may be borrowed at the same time.
+        """
+        self.idle_timeout = float(idle_timeout)
+        self.max_tabs = max(1, int(max_tabs))
+        self.launches = 0
+
+        # Loop-thread state
+        self._playwright = None
+        self._browser = None
+        self._contexts: Dict[Tuple[str, str], _PooledContext] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._tabs: Optional[asyncio.Semaphore] = None
+        self._in_use = 0
+        self._last_used = time.monotonic()
+        self._idle_timer: Optional[asyncio.TimerHandle] = None
+
+    def configure(self, idle_timeout: Optional[float] = None,
+                  max_tabs: Optional[int] = None) -> None:
+        """
+        Update pool settings.
+
+        Args:
+            idle_timeout: Seconds of inactivity before the browser is closed.
+            max_tabs: Pages that may be borrowed at the same time (applies
+                to captures started afterwards).
+        """
+        if idle_timeout is not None:
+            self.idle_timeout = float(idle_timeout)
+        if max_tabs is not None:
+            self.max_tabs = max(1, int(max_tabs))
+            self._tabs = None
+
+    @property
+    def is_running(self) -> bool:
+        """True while a browser is open (the next capture will be warm)."""
+        return self._browser is not None and self._browser.is_connected()
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a pool coroutine on the shared loop and wait for its result.
+
+        Args:
+            coro: Coroutine using page() / the pool
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            The coroutine's result (its exception is re-raised)
+        """
+        return get_async_runner().submit(coro).result(timeout)
+
+    # -------------------------------------------------------------------------
+    # Pages
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def page(self, ip: str, password: str = "") -> AsyncIterator[Any]:
+        """
+        Borrow a page logged in to a printer's EWS.
+
+        Waits while max_tabs pages are already borrowed. The page is blanked and kept for reuse when the block exits, or
+        closed if it broke or enough pages are already waiting.
+
+        Args:
+            ip: The IP address of the printer.
+            password: EWS admin password.
+
+        Yields:
+            A Playwright Page
+        """
+        if self._tabs is None:
+            self._tabs = asyncio.Semaphore(self.max_tabs)
+        tabs = self._tabs
+        await tabs.acquire()
+
+        self._in_use += 1
+        self._cancel_idle_timer()
+        page = None
+        pooled = None
+        try:
+            pooled = await self._context(ip, password)
+            while pooled.idle_pages and page is None:
+                candidate = pooled.idle_pages.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await pooled.context.new_page()
+            yield page
+        finally:
+            self._in_use -= 1
+            self._last_used = time.monotonic()
+            if page is not None:
+                await self._release(pooled, page)
+            tabs.release()
+            self._schedule_idle_close()
+
+    async def _release(self, pooled: _PooledContext, page) -> None:
+        """Blank a page and keep it for the next capture, or close it."""
+        try:
+            if not pooled.closed and not page.is_closed() and len(pooled.idle_pages) < MAX_IDLE_PAGES:
+                # Leave the EWS app so the next goto is a full, fresh load
+                await page.goto("about:blank")
+                pooled.idle_pages.append(page)
+                return
+            await page.close()
+        except Exception:
+            pass
+
+    async def _context(self, ip: str, password: str) -> _PooledContext:
+        """Get the warm context for a printer, starting the browser if needed."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if not self.is_running:
+                await self._launch()
+
+            key = (ip, password)
+            pooled = self._contexts.get(key)
+            if pooled is None:
+                # A changed password makes the printer's old context useless
+                for stale in [k for k in self._contexts if k[0] == ip]:
+                    await self._close_context(self._contexts.pop(stale))
+                context = await self._browser.new_context(
+                    ignore_https_errors=True,
+                    http_credentials={"username": "admin", "password": password}
+                )
+                pooled = self._contexts[key] = _PooledContext(context)
+            return pooled
+
+    async def _launch(self) -> None:
+        """Start (or restart after a crash) Playwright and Chromium. Lock held."""
+        await self._close_all()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        self.launches += 1
+
+    # -------------------------------------------------------------------------
+    # Shutdown
+    # -------------------------------------------------------------------------
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _schedule_idle_close(self) -> None:
+        if self._in_use or self.idle_timeout <= 0 or self._playwright is None:
+            return
+        self._cancel_idle_timer()
+        loop = asyncio.get_running_loop()
+        self._idle_timer = loop.call_later(
+            self.idle_timeout, lambda: loop.create_task(self._close_if_idle())
+        )
+
+    async def _close_if_idle(self) -> None:
+        self._idle_timer = None
+        if self._in_use or time.monotonic() - self._last_used < self.idle_timeout:
+            return
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every page, context and the browser."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._cancel_idle_timer()
+            await self._close_all()
+
+    async def _close_all(self) -> None:
+        """Tear everything down, ignoring errors from a dead browser. Lock held."""
+        contexts, self._contexts = list(self._contexts.values()), {}
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+
+        for pooled in contexts:
+            await self._close_context(pooled)
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    @staticmethod
+    async def _close_context(pooled: _PooledContext) -> None:
+        pooled.closed = True
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Close the browser from any thread (no-op if it never started)."""
+        if self._playwright is None:
+            return
+        try:
+            self.run(self.close(), timeout)
+        except Exception:
+            pass
+
+
+# Process-wide browser pool shared by all EWS captures
+_browser_pool = BrowserPool()
+atexit.register(_browser_pool.shutdown)
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool."""
+    return _browser_pool
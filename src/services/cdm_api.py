@@ -6,7 +6,11 @@ No Qt or UI dependencies - pure data fetching and returning.
 """
 import requests
 import urllib3
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+from src.services.http_pool import get_http_pool
+from src.services.fetch_engine import fetch_concurrently
+from src.services.response_cache import conditional_get, get_response_cache
 
 # Suppress insecure request warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -16,16 +20,61 @@ DEFAULT_TIMEOUT = 10
 SHORT_TIMEOUT = 5
 
 
+# Endpoint paths
+ALERTS_ENDPOINT = "cdm/alert/v1/alerts"
+TELEMETRY_ENDPOINT = "cdm/eventing/v1/events/supply"
+
+
 class CDMApiError(Exception):
     """Exception raised for CDM API errors."""
     pass
 
 
+def normalize_alerts(data: Any) -> List[Dict[str, Any]]:
+    """
+    Normalize a parsed alerts response to a list of alert dictionaries.
+    
+    Shared by CDMApiService and the async client.
+    """
+    if isinstance(data, dict):
+        if 'alerts' in data:
+            return data['alerts']
+        elif 'elements' in data:
+            return data['elements']
+        elif any(key in data for key in ['stringId', 'category', 'severity', 'id']):
+            return [data]
+        else:
+            return []
+    
+    return data if isinstance(data, list) else []
+
+
+def normalize_telemetry_events(data: Any) -> List[Dict[str, Any]]:
+    """
+    Normalize a parsed supply events response to a list of event dictionaries.
+    
+    Shared by CDMApiService and the async client.
+    """
+    if isinstance(data, dict):
+        if 'events' in data:
+            return data['events']
+        elif any(key in data for key in ['sequenceNumber', 'eventDetail']):
+            return [data]
+        else:
+            return []
+    
+    return data if isinstance(data, list) else []
+
+
 class CDMApiService:
     """
     Service for fetching data from CDM endpoints.
     
     All methods are synchronous and return raw data or raise CDMApiError.
+    Requests go through the shared per-printer keep-alive session pool.
+    Alerts and telemetry polls use conditional GETs backed by the shared
+    response cache, so an unchanged response returns the previously
+    parsed list itself (callers must not mutate it).
     Thread safety: This class is stateless and thread-safe.
     """
     
@@ -39,16 +88,21 @@ class CDMApiService:
         self.ip = ip
     
     def set_ip(self, ip: str) -> None:
-        """Update the target IP address."""
-        self.ip = ip
+        """Update the target IP address. Closes pooled sockets to the old printer."""
+        if ip != self.ip:
+            get_http_pool().close(self.ip)
+            get_response_cache().invalidate(self.ip)
+            self.ip = ip
     
-    def _get(self, endpoint: str, timeout: int = DEFAULT_TIMEOUT) -> requests.Response:
+    def _get(self, endpoint: str, timeout: int = DEFAULT_TIMEOUT,
+             headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """
         Perform a GET request to the specified endpoint.
         
         Args:
             endpoint: The API endpoint path (e.g., 'cdm/alert/v1/alerts')
             timeout: Request timeout in seconds
+            headers: Optional extra request headers (e.g. conditional GET validators)
             
         Returns:
             The response object
@@ -61,7 +115,9 @@ class CDMApiService:
         url = f"https://{self.ip}/{endpoint}"
         
         try:
-            response = requests.get(url, verify=False, timeout=timeout)
+            response = get_http_pool().get_session(self.ip).get(
+                url, headers=headers, verify=False, timeout=timeout
+            )
             response.raise_for_status()
             return response
         except requests.exceptions.Timeout:
@@ -75,6 +131,28 @@ class CDMApiService:
         except Exception as e:
             raise CDMApiError(f"Request failed: {str(e)}")
     
+    def _get_cached(self, endpoint: str, parse, timeout: int = DEFAULT_TIMEOUT) -> Any:
+        """
+        GET an endpoint through the response cache.
+        
+        Args:
+            endpoint: The API endpoint path
+            parse: Function turning the response into the cached object
+            timeout: Request timeout in seconds
+            
+        Returns:
+            The parsed data. When unchanged, the cached object is returned
+            as-is, so callers must not mutate it.
+            
+        Raises:
+            CDMApiError: If the request fails
+        """
+        return conditional_get(
+            get_response_cache(), self.ip, endpoint,
+            lambda headers: self._get(endpoint, timeout=timeout, headers=headers),
+            parse
+        )
+    
     def _put(self, endpoint: str, payload: dict, timeout: int = DEFAULT_TIMEOUT) -> requests.Response:
         """
         Perform a PUT request to the specified endpoint.
@@ -94,7 +172,7 @@ class CDMApiService:
         url = f"https://{self.ip}/{endpoint}"
         
         try:
-            response = requests.put(url, json=payload, verify=False, timeout=timeout)
+            response = get_http_pool().get_session(self.ip).put(url, json=payload, verify=False, timeout=timeout)
             response.raise_for_status()
             return response
         except requests.exceptions.Timeout:
@@ -112,27 +190,17 @@ class CDMApiService:
         """
         Fetch alerts from the printer.
         
+        The cached list is reused if the printer's response is unchanged.
+        
         Returns:
             List of alert dictionaries
             
         Raises:
             CDMApiError: If the request fails
         """
-        response = self._get("cdm/alert/v1/alerts", timeout=SHORT_TIMEOUT)
-        data = response.json()
-        
-        # Normalize response to list
-        if isinstance(data, dict):
-            if 'alerts' in data:
-                return data['alerts']
-            elif 'elements' in data:
-                return data['elements']
-            elif any(key in data for key in ['stringId', 'category', 'severity', 'id']):
-                return [data]
-            else:
-                return []
-        
-        return data if isinstance(data, list) else []
+        return self._get_cached(
+            ALERTS_ENDPOINT, lambda response: normalize_alerts(response.json()), SHORT_TIMEOUT
+        )
     
     def send_alert_action(self, alert_id: int, action: str) -> bool:
         """
@@ -164,25 +232,17 @@ class CDMApiService:
         """
         Fetch telemetry/supply events from the printer.
         
+        The cached list is reused if the printer's response is unchanged.
+        
         Returns:
             List of telemetry event dictionaries
             
         Raises:
             CDMApiError: If the request fails
         """
-        response = self._get("cdm/eventing/v1/events/supply", timeout=SHORT_TIMEOUT)
-        data = response.json()
-        
-        # Normalize response to list
-        if isinstance(data, dict):
-            if 'events' in data:
-                return data['events']
-            elif any(key in data for key in ['sequenceNumber', 'eventDetail']):
-                return [data]
-            else:
-                return []
-        
-        return data if isinstance(data, list) else []
+        return self._get_cached(
+            TELEMETRY_ENDPOINT, lambda response: normalize_telemetry_events(response.json()), SHORT_TIMEOUT
+        )
     
     # -------------------------------------------------------------------------
     # Generic Endpoint Fetching
@@ -204,27 +264,25 @@ class CDMApiService:
         response = self._get(endpoint)
         return response.text
     
-    def fetch_endpoints(self, endpoints: List[str]) -> Dict[str, str]:
+    def fetch_endpoints(
+        self,
+        endpoints: List[str],
+        on_result: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
         """
-        Fetch multiple endpoints and return results.
+        Fetch multiple endpoints in parallel and return results.
+        
+        Concurrency is capped per printer (see fetch_engine.set_max_concurrency).
         
         Args:
             endpoints: List of endpoint paths
+            on_result: Optional callback called with (endpoint, text) as each
+                endpoint finishes, before all of them are done
             
         Returns:
             Dict mapping endpoint to response text (or error message)
         """
-        results = {}
-        
-        for endpoint in endpoints:
-            try:
-                results[endpoint] = self.fetch_endpoint(endpoint)
-            except CDMApiError as e:
-                results[endpoint] = f"Error: {str(e)}"
-            except Exception as e:
-                results[endpoint] = f"Error: {str(e)}"
-        
-        return results
+        return fetch_concurrently(self.ip, endpoints, self.fetch_endpoint, on_result)
     
     def fetch_endpoint_json(self, endpoint: str) -> Any:
         """
@@ -1,20 +1,39 @@
 import os
 import json
+import time
+import atexit
 import tempfile
 import threading
 
+DEFAULT_WRITE_DELAY = 0.5       # Seconds of quiet before write-behind saves
+MAX_WRITE_DELAY_FACTOR = 10     # Continuous changes still save after delay * this
+
 
 class ConfigManager:
     """
     Manages application configuration with shared state and atomic writes.
     - Single shared in-memory config across all instances.
-    - Each mutation is auto-saved atomically to disk.
+    - Each mutation is auto-saved atomically to disk, merged over the
+      latest file so external edits to other keys survive.
+    - In write-behind mode (enable_write_behind()) mutations apply in
+      memory at once and a background thread saves them once changes
+      have paused for a short delay; flush() saves immediately, and
+      pending changes are flushed at interpreter exit.
     """
 
-    _lock = threading.Lock()
+    _lock = threading.Lock()         # Guards the shared dict (held only briefly)
+    _write_lock = threading.Lock()   # Serializes saves; file I/O runs under this only
     _shared_config = None
     _shared_filepath = None
 
+    # Write-behind state (shared, guarded by _cond)
+    _cond = threading.Condition()
+    _write_delay = None             # None: write-through
+    _dirty_since = None             # monotonic() of the first unsaved change
+    _last_change = None             # monotonic() of the latest unsaved change
+    _flusher = None
+    writes = 0                      # Files written (for diagnostics)
+
     def __init__(self, filename="config.json", base_dir=None):
         base_dir = base_dir or os.getcwd()
         self.filepath = os.path.join(base_dir, filename)
@@ -68,16 +87,113 @@ class ConfigManager:
         """
         Set a value and auto-save.
         Merges latest on disk to avoid overwriting newer external edits.
+        In write-behind mode only the in-memory value changes now; the
+        save follows after the write delay.
         """
+        if ConfigManager._write_delay is None:
+            with ConfigManager._lock:
+                self._config[key] = value
+            with ConfigManager._write_lock:
+                self._save_merged()
+            return
+
         with ConfigManager._lock:
-            latest_disk = self._load_from_disk()
-            # Merge: disk -> current shared -> new value
-            merged = {**latest_disk, **self._config}
-            merged[key] = value
+            self._config[key] = value
+        with ConfigManager._cond:
+            now = time.monotonic()
+            if ConfigManager._dirty_since is None:
+                ConfigManager._dirty_since = now
+            ConfigManager._last_change = now
+            ConfigManager._cond.notify_all()
 
-            # Update shared dict in place so all references see it
-            self._config.clear()
-            self._config.update(merged)
+    def flush(self):
+        """
+        Save pending write-behind changes now.
 
-            self._atomic_write(self._config)
+        Waits for a save already in progress (e.g. by the flusher thread),
+        so everything set before the call is on disk when it returns.
+        """
+        with ConfigManager._write_lock:
+            with ConfigManager._cond:
+                if ConfigManager._dirty_since is None:
+                    return
+                dirty_since = ConfigManager._dirty_since
+                ConfigManager._dirty_since = None
+                ConfigManager._last_change = None
+            try:
+                self._save_merged()
+            except Exception:
+                # Keep the changes pending so a later flush retries them
+                with ConfigManager._cond:
+                    if ConfigManager._dirty_since is None:
+                        ConfigManager._dirty_since = dirty_since
+                        ConfigManager._last_change = time.monotonic()
+                raise
+
+    def _save_merged(self):
+        """
+        Merge the latest file under the shared config and write it (write lock held).
 
+        Only the copy of the config is taken under _lock; reading, writing
+        and syncing the file do not block set() or get().
+        """
+        with ConfigManager._lock:
+            current = dict(self._config)
+        latest_disk = self._load_from_disk()
+        # Merge: disk -> current shared
+        self._atomic_write({**latest_disk, **current})
+        ConfigManager.writes += 1
+
+        # Adopt keys only the file has (external edits), in place so all
+        # references see them; values set meanwhile are left alone
+        with ConfigManager._lock:
+            self._config.update({key: value for key, value in latest_disk.items()
+                                 if key not in self._config})
+
+    # -------------------------------------------------------------------------
+    # Write-behind
+    # -------------------------------------------------------------------------
+
+    def enable_write_behind(self, delay=DEFAULT_WRITE_DELAY):
+        """
+        Switch all instances to write-behind saving.
+
+        Args:
+            delay: Seconds without further changes before saving; a value
+                of 0 or less (or None) goes back to saving on every set().
+        """
+        if not delay or delay <= 0:
+            self.flush()
+            with ConfigManager._cond:
+                ConfigManager._write_delay = None
+            return
+
+        with ConfigManager._cond:
+            ConfigManager._write_delay = float(delay)
+            if ConfigManager._flusher is None:
+                ConfigManager._flusher = threading.Thread(
+                    target=self._flush_loop, name="ConfigFlusher", daemon=True
+                )
+                ConfigManager._flusher.start()
+                atexit.register(self.flush)
+            ConfigManager._cond.notify_all()
+
+    def _flush_loop(self):
+        """Save once changes have been quiet for the delay (or pending too long)."""
+        while True:
+            with ConfigManager._cond:
+                while True:
+                    delay = ConfigManager._write_delay
+                    if ConfigManager._dirty_since is None or delay is None:
+                        ConfigManager._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    due = min(ConfigManager._last_change + delay,
+                              ConfigManager._dirty_since + delay * MAX_WRITE_DELAY_FACTOR)
+                    if now >= due:
+                        break
+                    ConfigManager._cond.wait(due - now)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error saving config: {e}")
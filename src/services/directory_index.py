@@ -0,0 +1,330 @@
+"""
+Directory Index - In-memory index of the files in a capture directory.
+
+Capture directories collect thousands of step-prefixed files ("3. CDM_alerts.json",
+"3. UI Home (2).png", ...). Instead of probing os.path.exists in a loop or
+listing the directory on every save, callers ask the index for the next
+free name, the files of a step, or a step's files by report category.
+
+The index is kept current two ways: code that writes into the directory
+reports its files with add()/remove(), and every query first compares the
+directory's modification time with the one seen at the last scan - a
+single stat that notices files created, renamed or deleted by anyone else
+and triggers a rescan. Our own writes only skip that rescan if the
+directory was unchanged since its last scan when the name was claimed.
+Names handed out are still confirmed with one exists check, so a missed
+change can never overwrite a file.
+No Qt or UI dependencies.
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+# Numbering styles for repeated names
+PAREN = "paren"             # "name.ext", "name (1).ext", "name (2).ext", ...
+UNDERSCORE = "underscore"   # "name.ext", "name_1.ext", "name_2.ext", ...
+
+# Report categories, in the order files are matched against them
+FILE_CATEGORIES = (
+    "alerts", "suppliesPrivate", "suppliesPublic", "supplyAssessment",
+    "DSR Packet", "Telemetry", "Other",
+)
+
+MAX_INDEXED_DIRECTORIES = 16
+
+# Seconds after which a claimed name that was never add()ed or release()d
+# is given up at the next rescan
+CLAIM_TIMEOUT = 600
+
+_STEP_RE = re.compile(r"^(0|[1-9]\d*)\. ")
+_NUMBERED_RE = {
+    PAREN: re.compile(r"^(.*) \((\d+)\)$"),
+    UNDERSCORE: re.compile(r"^(.*)_(\d+)$"),
+}
+
+
+def categorize_filename(filename: str) -> str:
+    """Report category of a capture file, judged by keywords in its name."""
+    lower_name = filename.lower()
+    if "alert" in lower_name and "cdm" in lower_name:
+        return "alerts"
+    if "suppliesprivate" in lower_name:
+        return "suppliesPrivate"
+    if "suppliespublic" in lower_name:
+        return "suppliesPublic"
+    if "supplyassessment" in lower_name:
+        return "supplyAssessment"
+    if "dsr" in lower_name:
+        return "DSR Packet"
+    if "telemetry" in lower_name:
+        return "Telemetry"
+    return "Other"
+
+
+def step_of(filename: str) -> Optional[int]:
+    """Step number from a "N. " filename prefix, or None."""
+    match = _STEP_RE.match(filename)
+    return int(match.group(1)) if match else None
+
+
+class DirectoryIndex:
+    """
+    Names of the regular files in one directory, grouped for lookup.
+
+    Lookups are keyed by os.path.normcase(name), so they follow the
+    platform's case rules; results use the names as they are on disk.
+
+    Thread safety: All methods are thread-safe.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize an index (the directory is scanned on first use).
+
+        Args:
+            directory: Directory to index
+        """
+        self.directory = directory
+        self.scans = 0
+        self._lock = threading.RLock()
+        self._mtime: Optional[int] = None
+        self._names: Dict[str, str] = {}                                  # key -> name
+        self._steps: Dict[int, Dict[str, Dict[str, str]]] = {}            # step -> category -> {key: name}
+        self._numbers: Dict[Tuple[str, str, str], Set[int]] = {}          # (stem, ext, style) -> counters
+        self._claimed: Dict[str, Tuple[float, Optional[int]]] = {}        # key -> (claimed at, dir mtime then)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def exists(self, name: str) -> bool:
+        """Whether a file of this name is in the directory."""
+        with self._lock:
+            self._validate()
+            return os.path.normcase(name) in self._names
+
+    def steps(self) -> List[int]:
+        """Step numbers that have at least one file, ascending."""
+        with self._lock:
+            self._validate()
+            return sorted(step for step, categories in self._steps.items()
+                          if any(categories.values()))
+
+    def files(self, step: Optional[int] = None) -> List[str]:
+        """
+        Full paths of the indexed files.
+
+        Args:
+            step: Only files with this "N. " prefix (all files if None)
+        """
+        with self._lock:
+            self._validate()
+            if step is None:
+                names = list(self._names.values())
+            else:
+                categories = self._steps.get(int(step), {})
+                names = [name for group in categories.values() for name in group.values()]
+        return [os.path.join(self.directory, name) for name in sorted(names)]
+
+    def files_by_category(self, step: int) -> Dict[str, List[str]]:
+        """
+        Full paths of a step's files, grouped by FILE_CATEGORIES.
+
+        Every category is present in the result, empty if it has no files.
+        """
+        with self._lock:
+            self._validate()
+            categories = self._steps.get(int(step), {})
+            grouped = {category: sorted(categories.get(category, {}).values())
+                       for category in FILE_CATEGORIES}
+        return {category: [os.path.join(self.directory, name) for name in names]
+                for category, names in grouped.items()}
+
+    def highest_number(self, stem: str, extension: str, style: str = UNDERSCORE) -> int:
+        """Largest N among the "stem_N.ext" (or "stem (N).ext") files, 0 if none."""
+        with self._lock:
+            self._validate()
+            numbers = self._numbers.get(self._family(stem, extension, style))
+            return max(numbers) if numbers else 0
+
+    def next_free_name(self, stem: str, extension: str, style: str = PAREN, claim: bool = True) -> str:
+        """
+        A filename that is not taken yet.
+
+        Returns "stem.ext" if that is free, otherwise the stem numbered one
+        past the highest number already used in the given style.
+
+        Args:
+            stem: Filename without extension
+            extension: Extension including the dot
+            style: PAREN or UNDERSCORE numbering
+            claim: Reserve the name (see claim()), so concurrent savers
+                get different names before the file is written
+        """
+        with self._lock:
+            self._validate()
+            name = f"{stem}{extension}"
+            numbers = self._numbers.get(self._family(stem, extension, style))
+            number = max(numbers) if numbers else 0
+            while self._taken(name):
+                number += 1
+                name = f"{stem} ({number}){extension}" if style == PAREN else f"{stem}_{number}{extension}"
+            if claim:
+                self._claim(name)
+            return name
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def claim(self, name: str) -> None:
+        """
+        Reserve a name about to be written, until it is add()ed or release()d.
+
+        Also notes the directory's state, so add() knows whether anyone else
+        changed the directory meanwhile. Call it right before writing;
+        calling it again for a claimed name refreshes that note.
+        """
+        with self._lock:
+            self._validate()
+            self._claim(os.path.basename(name))
+
+    def release(self, path: str) -> None:
+        """Give up a claimed name that was not written after all."""
+        with self._lock:
+            self._claimed.pop(os.path.normcase(os.path.basename(path)), None)
+
+    def add(self, path: str) -> None:
+        """Record a file this process wrote into the directory."""
+        name = os.path.basename(path)
+        with self._lock:
+            claim = self._claimed.pop(os.path.normcase(name), None)
+            self._add_name(name)
+            self._accept_mtime(claim[1] if claim else None)
+
+    def remove(self, path: str) -> None:
+        """Record a file this process deleted or renamed away."""
+        with self._lock:
+            self._remove_name(os.path.basename(path))
+            self._accept_mtime(None)
+
+    def invalidate(self) -> None:
+        """Force a rescan on the next query."""
+        with self._lock:
+            self._mtime = None
+
+    # -------------------------------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------------------------------
+
+    def _claim(self, name: str) -> None:
+        self._claimed[os.path.normcase(name)] = (time.monotonic(), self._mtime)
+
+    def _taken(self, name: str) -> bool:
+        key = os.path.normcase(name)
+        return (key in self._names or key in self._claimed
+                or os.path.exists(os.path.join(self.directory, name)))
+
+    def _validate(self) -> None:
+        """Rescan if the directory changed since the last scan."""
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            mtime = -1  # Missing directory: index it as empty
+        if mtime != self._mtime:
+            self._scan(mtime)
+
+    def _accept_mtime(self, before: Optional[int]) -> None:
+        """
+        After our own change, adopt the new mtime instead of rescanning.
+
+        Only if the directory was as last scanned right before the change
+        (before, the mtime noted at claim time, is still the indexed one);
+        otherwise another writer may have added files, so rescan.
+        """
+        if self._mtime is None or before != self._mtime:
+            self._mtime = None
+            return
+        try:
+            self._mtime = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            self._mtime = None
+
+    def _scan(self, mtime: int) -> None:
+        self._names.clear()
+        self._steps.clear()
+        self._numbers.clear()
+        self.scans += 1
+        expired = time.monotonic() - CLAIM_TIMEOUT
+        self._claimed = {key: claim for key, claim in self._claimed.items() if claim[0] > expired}
+        if mtime != -1:
+            try:
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                self._add_name(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                mtime = None
+        self._mtime = mtime
+
+    def _add_name(self, name: str) -> None:
+        key = os.path.normcase(name)
+        if key in self._names:
+            return
+        self._names[key] = name
+        step = step_of(name)
+        if step is not None:
+            categories = self._steps.setdefault(step, {})
+            categories.setdefault(categorize_filename(name), {})[key] = name
+        for family, number in self._numbered(name):
+            self._numbers.setdefault(family, set()).add(number)
+
+    def _remove_name(self, name: str) -> None:
+        key = os.path.normcase(name)
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        step = step_of(name)
+        if step is not None:
+            self._steps.get(step, {}).get(categorize_filename(name), {}).pop(key, None)
+        for family, number in self._numbered(name):
+            self._numbers.get(family, set()).discard(number)
+
+    def _numbered(self, name: str) -> List[Tuple[Tuple[str, str, str], int]]:
+        """The (family, number) pairs a name counts towards."""
+        stem, extension = os.path.splitext(name)
+        pairs = []
+        for style, pattern in _NUMBERED_RE.items():
+            match = pattern.match(stem)
+            if match:
+                pairs.append((self._family(match.group(1), extension, style), int(match.group(2))))
+        return pairs
+
+    @staticmethod
+    def _family(stem: str, extension: str, style: str) -> Tuple[str, str, str]:
+        return os.path.normcase(stem), os.path.normcase(extension), style
+
+
+# Process-wide indexes, most recently used last
+_indexes: "OrderedDict[str, DirectoryIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_directory_index(directory: str) -> DirectoryIndex:
+    """Return the shared index for a directory (created on first use)."""
+    key = os.path.normcase(os.path.abspath(directory))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = DirectoryIndex(directory)
+            while len(_indexes) > MAX_INDEXED_DIRECTORIES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
@@ -0,0 +1,163 @@
+"""
+Document Cache - Parsed capture files, reused until they change on disk.
+
+The report builder reads the same saved JSON files over and over: every
+checkbox or combo change regenerates the whole report. This cache keeps
+each file's text, its parsed JSON, and any output derived from it (a
+formatted report section for a given color selection, a telemetry color
+label, ...), all keyed by path and checked against the file's mtime and
+size on every access. A changed file drops everything derived from it.
+
+Cached objects are shared between callers and must not be modified.
+No Qt or UI dependencies.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+MAX_DOCUMENTS = 2048        # Files kept (least recently used dropped first)
+MAX_DERIVED_PER_FILE = 64   # Derived outputs kept per file
+
+_UNPARSED = object()
+
+
+class _Document:
+    """One file's text plus what has been computed from it."""
+
+    __slots__ = ("signature", "text", "parsed", "derived")
+
+    def __init__(self, signature: Tuple[int, int], text: str):
+        self.signature = signature
+        self.text = text
+        self.parsed: Any = _UNPARSED
+        self.derived: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+
+class DocumentCache:
+    """
+    Process-wide cache of capture file contents.
+
+    Counters:
+        hits: Lookups answered without reading the file
+        misses: Lookups that (re)read the file
+
+    Thread safety: All methods are thread-safe. Derived values are computed
+    outside the lock, so two threads may occasionally compute the same one.
+    """
+
+    def __init__(self, max_documents: int = MAX_DOCUMENTS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_documents: Files to keep before dropping the least recently used
+        """
+        self.max_documents = max_documents
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._documents: "OrderedDict[str, _Document]" = OrderedDict()
+
+    def read_text(self, path: str) -> str:
+        """
+        Contents of a UTF-8 text file.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return self._document(path).text
+
+    def load_json(self, path: str) -> Any:
+        """
+        Parsed JSON of a file (shared; do not modify).
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not valid JSON (the error is not cached)
+        """
+        document = self._document(path)
+        if document.parsed is _UNPARSED:
+            parsed = json.loads(document.text)
+            with self._lock:
+                document.parsed = parsed
+        return document.parsed
+
+    def derive(self, path: str, key: Hashable, compute: Callable[[str], Any]) -> Any:
+        """
+        Output computed from a file's text, cached until the file changes.
+
+        Args:
+            path: The file
+            key: Identifies the computation and its inputs (e.g.
+                ("supplies", colors, strategy name))
+            compute: Called with the file's text on a miss; exceptions
+                propagate and are not cached
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        document = self._document(path)
+        with self._lock:
+            if key in document.derived:
+                document.derived.move_to_end(key)
+                return document.derived[key]
+
+        value = compute(document.text)
+        with self._lock:
+            document.derived[key] = value
+            while len(document.derived) > MAX_DERIVED_PER_FILE:
+                document.derived.popitem(last=False)
+        return value
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached files.
+
+        Args:
+            path: Only drop this file; None drops everything.
+        """
+        with self._lock:
+            if path is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(os.path.abspath(path), None)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the counters and size."""
+        with self._lock:
+            return {"documents": len(self._documents), "hits": self.hits, "misses": self.misses}
+
+    def _document(self, path: str) -> _Document:
+        """The cached document for a path, re-read if the file changed."""
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None and document.signature == signature:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+
+        with open(key, "r", encoding="utf-8") as f:
+            document = _Document(signature, f.read())
+
+        with self._lock:
+            self.misses += 1
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        return document
+
+
+# Process-wide cache shared by every ReportBuilder
+_document_cache = DocumentCache()
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide document cache."""
+    return _document_cache
@@ -1,11 +1,8 @@
 import os
-import io
-from PIL import Image
-from playwright.sync_api import sync_playwright
 import tkinter as tk
 from tkinter import ttk, filedialog
-import concurrent.futures
-from playwright.sync_api import sync_playwright
+
+from src.services.ews_service import EWSService
 
 class EWSScreenshotCapturer:
     def __init__(self, parent_frame, ip_address, directory, password=""):
@@ -13,6 +10,7 @@ class EWSScreenshotCapturer:
         self.ip_address = ip_address
         self.directory = directory
         self.password = password
+        self.timings = []  # {"page", "seconds", "pages", "cold"} per capture
         print(f"    >> Initializing EWSScreenshotCapturer for IP: {ip_address}")
 
     def capture_screenshots(self, number):
@@ -38,78 +36,16 @@ class EWSScreenshotCapturer:
             print("    >> No IP address provided, aborting")
             return None
 
-        def capture_page(url, description, crop_amounts):
-            """Capture and crop a single page screenshot."""
-            print(f"    >> Capturing page: {description}")
-            with sync_playwright() as p:
-                print("    >> Launching browser")
-                browser = p.chromium.launch()
-                
-                # Create context with HTTP credentials
-                context = browser.new_context(
-                    ignore_https_errors=True,
-                    http_credentials={
-                        "username": "admin",
-                        "password": self.password  # Use instance password
-                    }
-                )
-                
-                page = context.new_page()
-                print(f"    >> Navigating to {url}")
-                page.goto(url, timeout=60000)
-                page.wait_for_load_state('networkidle')
-
-                # Remove the 'btn-list' div
-                print("    >> Removing 'btn-list' div")
-                page.evaluate("""
-                    () => {
-                        const btnList = document.querySelector('.btn-list');
-                        if (btnList) {
-                            btnList.remove();
-                        }
-                    }
-                """)
-
-                print("    >> Taking screenshot")
-                screenshot = page.screenshot(full_page=True)
-                image = Image.open(io.BytesIO(screenshot))
-                
-                # Crop the image
-                print("    >> Cropping image")
-                left, upper, right, lower = crop_amounts
-                right = image.width - right
-                lower = image.height - lower
-                cropped_image = image.crop((left, upper, right, lower))
-                
-                # Convert cropped image to bytes
-                print("    >> Converting image to bytes")
-                cropped_image_bytes = io.BytesIO()
-                cropped_image.save(cropped_image_bytes, format='PNG')
-                
-                # Close context and browser
-                context.close()
-                browser.close()
-                
-                return cropped_image_bytes.getvalue(), description
-
-        # Define URLs and crop settings for each page
-        urls = [
-            (f'https://{self.ip_address}/#hId-pgDevInfo', "EWS Printer Information", (150, 0, 150, 180)),
-            (f'https://{self.ip_address}/#hId-pgConsumables', "EWS Supply Status", (150, 0, 150, 170))
-        ]
+        self.timings = []
 
         print("    >> Capturing all specified pages concurrently")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
-            future_to_url = {executor.submit(capture_page, url, description, crop_amounts): (url, description) for url, description, crop_amounts in urls}
-            results = []
-            for future in concurrent.futures.as_completed(future_to_url):
-                url, description = future_to_url[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    print(f"    >> Captured: {description}")
-                except Exception as exc:
-                    print(f"    >> Error capturing {description}: {exc}")
+        service = EWSService(self.ip_address, self.password)
+        results = service.capture_pages(EWSService.DEFAULT_PAGES, skip_failed=True)
+        self.timings.append({"page": "all", **service.last_timing})
+        for _, description in results:
+            print(f"    >> Captured: {description}")
+        for description, error in service.last_errors.items():
+            print(f"    >> Error capturing {description}: {error}")
         
         return results
 
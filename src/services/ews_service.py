@@ -2,19 +2,39 @@
 EWS Service - Screenshot capture from Embedded Web Server.
 
 This service handles browser automation to capture EWS page screenshots.
+Pages are rendered in the shared, long-lived browser of the BrowserPool,
+and only the region wanted (an element, or the page minus fixed margins)
+is screenshotted, so Chromium encodes the final PNG itself.
 No Qt or UI dependencies - pure capture and return.
 """
 import os
-import io
+import time
+import asyncio
 from typing import List, Tuple, Optional, Dict, Any
-from PIL import Image
 
-# Playwright is imported at runtime to allow graceful failure
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+from src.services.browser_pool import get_browser_pool, PLAYWRIGHT_AVAILABLE
+
+# Removes UI elements that shouldn't be in the screenshot
+_REMOVE_BUTTONS_JS = """
+    () => {
+        const btnList = document.querySelector('.btn-list');
+        if (btnList) {
+            btnList.remove();
+        }
+    }
+"""
+
+# Size of the whole scrollable page, as a full_page screenshot sees it
+_PAGE_SIZE_JS = """
+    () => {
+        const root = document.documentElement;
+        const body = document.body || root;
+        return [
+            Math.max(root.scrollWidth, body.scrollWidth, root.clientWidth),
+            Math.max(root.scrollHeight, body.scrollHeight, root.clientHeight)
+        ];
+    }
+"""
 
 
 class EWSServiceError(Exception):
@@ -26,7 +46,12 @@ class EWSService:
     """
     Service for capturing EWS (Embedded Web Server) screenshots.
     
-    Uses Playwright for browser automation. All methods are synchronous.
+    Uses Playwright for browser automation. All methods are synchronous;
+    the browser itself is shared and stays warm between captures.
+    
+    Attributes:
+        last_timing: {"seconds", "pages", "cold"} of the latest capture call;
+            cold means the browser had to be started for it
     """
     
     # Default crop amounts: (left, top, right, bottom)
@@ -35,7 +60,13 @@ class EWSService:
         "supply_status": (150, 0, 150, 170),
     }
     
-    # Default EWS pages to capture
+    # Default EWS pages to capture. "crop" names margins in DEFAULT_CROPS;
+    # a page may instead give a CSS "selector", and only that element is
+    # captured (which follows layout changes). "ready" is a selector of the
+    # page's own data container; the capture waits for it or for network
+    # idle, whichever comes first. Shared chrome such as the .btn-list action
+    # bar can show up before the data, so pages without a content selector
+    # leave "ready" out and wait for network idle.
     DEFAULT_PAGES = [
         {"url_path": "#hId-pgDevInfo", "name": "EWS Printer Information", "crop": "printer_info"},
         {"url_path": "#hId-pgConsumables", "name": "EWS Supply Status", "crop": "supply_status"},
@@ -54,6 +85,8 @@ class EWSService:
         
         self.ip = ip
         self.password = password
+        self.last_timing: Dict[str, Any] = {}
+        self.last_errors: Dict[str, str] = {}  # Page name -> error from capture_pages
     
     def set_ip(self, ip: str) -> None:
         """Update the target IP address."""
@@ -67,7 +100,8 @@ class EWSService:
         self,
         url_path: str,
         crop_amounts: Optional[Tuple[int, int, int, int]] = None,
-        timeout: int = 60000
+        timeout: int = 60000,
+        selector: Optional[str] = None
     ) -> bytes:
         """
         Capture a screenshot of an EWS page.
@@ -76,6 +110,8 @@ class EWSService:
             url_path: The path/hash portion of the URL (e.g., '#hId-pgDevInfo')
             crop_amounts: Optional (left, top, right, bottom) crop amounts
             timeout: Page load timeout in milliseconds
+            selector: Optional CSS selector; only that element is captured
+                (takes precedence over crop_amounts)
             
         Returns:
             PNG image bytes
@@ -83,85 +119,151 @@ class EWSService:
         Raises:
             EWSServiceError: If capture fails
         """
-        url = f"https://{self.ip}/{url_path}"
+        pool = get_browser_pool()
+        cold = not pool.is_running
+        start = time.perf_counter()
         
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                
-                # Create context with HTTP credentials
-                context = browser.new_context(
-                    ignore_https_errors=True,
-                    http_credentials={
-                        "username": "admin",
-                        "password": self.password
-                    }
-                )
-                
-                page = context.new_page()
-                page.goto(url, timeout=timeout)
-                page.wait_for_load_state('networkidle')
-                
-                # Remove UI elements that shouldn't be in screenshot
-                page.evaluate("""
-                    () => {
-                        const btnList = document.querySelector('.btn-list');
-                        if (btnList) {
-                            btnList.remove();
-                        }
-                    }
-                """)
-                
-                # Take screenshot
-                screenshot = page.screenshot(full_page=True)
-                
-                # Crop if specified
-                if crop_amounts:
-                    image = Image.open(io.BytesIO(screenshot))
-                    left, upper, right, lower = crop_amounts
-                    right = image.width - right
-                    lower = image.height - lower
-                    cropped = image.crop((left, upper, right, lower))
-                    
-                    # Convert back to bytes
-                    output = io.BytesIO()
-                    cropped.save(output, format='PNG')
-                    screenshot = output.getvalue()
-                
-                context.close()
-                browser.close()
-                
-                return screenshot
-                
+            screenshot = pool.run(self._render(url_path, timeout, crop=crop_amounts, selector=selector))
         except Exception as e:
             raise EWSServiceError(f"Failed to capture EWS page: {str(e)}")
+        
+        self.last_timing = {"seconds": time.perf_counter() - start, "pages": 1, "cold": cold}
+        return screenshot
     
-    def capture_default_pages(self) -> List[Tuple[bytes, str]]:
+    async def _render(
+        self,
+        url_path: str,
+        timeout: int,
+        ready: Optional[str] = None,
+        crop: Optional[Tuple[int, int, int, int]] = None,
+        selector: Optional[str] = None
+    ) -> bytes:
+        """Load a page in a pooled tab and screenshot it (runs on the pool's loop)."""
+        url = f"https://{self.ip}/{url_path}"
+        
+        async with get_browser_pool().page(self.ip, self.password) as page:
+            await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+            await self._wait_ready(page, ready, timeout)
+            await page.evaluate(_REMOVE_BUTTONS_JS)
+            
+            if selector:
+                element = await page.wait_for_selector(selector, state="visible", timeout=timeout)
+                return await element.screenshot(timeout=timeout)
+            
+            clip = None
+            if crop:
+                width, height = await page.evaluate(_PAGE_SIZE_JS)
+                clip = self._clip(width, height, crop)
+            return await page.screenshot(full_page=True, clip=clip, timeout=timeout)
+    
+    @staticmethod
+    async def _wait_ready(page, ready: Optional[str], timeout: int) -> None:
         """
-        Capture all default EWS pages.
+        Wait until the page has rendered.
+        
+        With a ready selector, returns as soon as it is visible - or once
+        the network goes idle, should the selector never appear.
+        """
+        idle = asyncio.ensure_future(page.wait_for_load_state("networkidle", timeout=timeout))
+        if not ready:
+            await idle
+            return
+        
+        visible = asyncio.ensure_future(page.wait_for_selector(ready, state="visible", timeout=timeout))
+        pending = {idle, visible}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.exception() is None for task in done):
+                    return
+            # Neither condition was met; report why
+            visible.result()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def _clip(width: int, height: int, crop_amounts: Tuple[int, int, int, int]) -> Optional[Dict[str, int]]:
+        """Screenshot clip for a page with (left, top, right, bottom) margins cut off."""
+        left, upper, right, lower = crop_amounts
+        clip_width = width - left - right
+        clip_height = height - upper - lower
+        if clip_width <= 0 or clip_height <= 0:
+            return None  # Page smaller than the margins; keep all of it
+        return {"x": left, "y": upper, "width": clip_width, "height": clip_height}
+    
+    def capture_pages(
+        self,
+        pages: Optional[List[Dict[str, Any]]] = None,
+        timeout: int = 60000,
+        skip_failed: bool = False
+    ) -> List[Tuple[bytes, str]]:
+        """
+        Capture several pages at once, each in its own tab.
+        
+        Tabs share the printer's logged-in browser context; how many load at
+        the same time is capped by the browser pool's max_tabs. Capturing a
+        list takes about as long as its slowest page.
         
+        Args:
+            pages: Page configs ({"url_path", "name", optional "crop",
+                "selector" and "ready"}). Uses DEFAULT_PAGES if not provided.
+            timeout: Per-page load timeout in milliseconds
+            skip_failed: Leave failed pages out of the result instead of
+                raising (their errors are kept in last_errors)
+            
         Returns:
-            List of (image_bytes, page_name) tuples
+            List of (image_bytes, page_name) tuples, in the order given
             
         Raises:
-            EWSServiceError: If any capture fails
+            EWSServiceError: If any page fails (after the others finished)
         """
-        results = []
+        pages = pages or self.DEFAULT_PAGES
+        pool = get_browser_pool()
+        cold = not pool.is_running
+        start = time.perf_counter()
+        
+        async def _render_all():
+            return await asyncio.gather(
+                *(self._render(page["url_path"], timeout, page.get("ready"),
+                               self.DEFAULT_CROPS.get(page.get("crop")), page.get("selector"))
+                  for page in pages),
+                return_exceptions=True
+            )
         
-        for page_config in self.DEFAULT_PAGES:
-            url_path = page_config["url_path"]
+        try:
+            screenshots = pool.run(_render_all())
+        except Exception as e:
+            raise EWSServiceError(f"Failed to capture EWS pages: {str(e)}")
+        
+        results = []
+        self.last_errors = {}
+        for page_config, screenshot in zip(pages, screenshots):
             name = page_config["name"]
-            crop_key = page_config.get("crop")
-            crop_amounts = self.DEFAULT_CROPS.get(crop_key) if crop_key else None
-            
-            try:
-                screenshot = self.capture_page(url_path, crop_amounts)
+            if isinstance(screenshot, BaseException):
+                self.last_errors[name] = str(screenshot)
+            else:
                 results.append((screenshot, name))
-            except EWSServiceError:
-                raise
         
+        self.last_timing = {"seconds": time.perf_counter() - start, "pages": len(results), "cold": cold}
+        if self.last_errors and not skip_failed:
+            failures = "; ".join(f"{name}: {error}" for name, error in self.last_errors.items())
+            raise EWSServiceError(f"Failed to capture {failures}")
         return results
     
+    def capture_default_pages(self) -> List[Tuple[bytes, str]]:
+        """
+        Capture all default EWS pages.
+        
+        Returns:
+            List of (image_bytes, page_name) tuples
+            
+        Raises:
+            EWSServiceError: If any capture fails
+        """
+        return self.capture_pages(self.DEFAULT_PAGES)
+    
     def capture_and_save(
         self,
         directory: str,
@@ -169,7 +271,7 @@ class EWSService:
         pages: Optional[List[Dict[str, Any]]] = None
     ) -> List[str]:
         """
-        Capture pages and save them to files.
+        Capture pages (concurrently, see capture_pages) and save them to files.
         
         Args:
             directory: Directory to save screenshots
@@ -185,28 +287,18 @@ class EWSService:
         if not os.path.exists(directory):
             raise EWSServiceError(f"Directory does not exist: {directory}")
         
-        pages = pages or self.DEFAULT_PAGES
         saved_files = []
-        
-        for page_config in pages:
-            url_path = page_config["url_path"]
-            name = page_config["name"]
-            crop_key = page_config.get("crop")
-            crop_amounts = self.DEFAULT_CROPS.get(crop_key) if crop_key else None
+        for screenshot, name in self.capture_pages(pages):
+            filename = f"{prefix}{name}.png" if prefix else f"{name}.png"
+            filepath = os.path.join(directory, filename)
             
             try:
-                screenshot = self.capture_page(url_path, crop_amounts)
-                
-                filename = f"{prefix}{name}.png" if prefix else f"{name}.png"
-                filepath = os.path.join(directory, filename)
-                
                 with open(filepath, 'wb') as f:
                     f.write(screenshot)
-                
-                saved_files.append(filepath)
-                
-            except Exception as e:
-                raise EWSServiceError(f"Failed to capture/save {name}: {str(e)}")
+            except OSError as e:
+                raise EWSServiceError(f"Failed to save {name}: {str(e)}")
+            
+            saved_files.append(filepath)
         
         return saved_files
 
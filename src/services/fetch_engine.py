@@ -0,0 +1,99 @@
+"""
+Fetch Engine - Bounded-concurrency fetching of many endpoints.
+
+Used by CDMApiService and LEDMApiService to fetch endpoint lists in parallel
+instead of one round trip after another. Concurrency is capped per printer
+so that several callers hitting the same printer share one limit.
+No Qt or UI dependencies.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.services.http_pool import get_http_pool
+
+# Callback invoked as each endpoint finishes: (endpoint, text_or_error)
+ResultCallback = Callable[[str, str], None]
+
+_limits_lock = threading.Lock()
+_printer_limits: Dict[str, Tuple[int, threading.BoundedSemaphore]] = {}
+_max_concurrency: Optional[int] = None
+
+
+def set_max_concurrency(limit: Optional[int]) -> None:
+    """
+    Set the per-printer concurrency limit.
+
+    Args:
+        limit: Max in-flight requests per printer, or None to follow the
+            HTTP session pool size (so every request gets a kept-alive socket).
+    """
+    global _max_concurrency
+    with _limits_lock:
+        _max_concurrency = max(1, int(limit)) if limit else None
+        _printer_limits.clear()
+
+
+def get_max_concurrency() -> int:
+    """Return the effective per-printer concurrency limit."""
+    return _max_concurrency or get_http_pool().pool_size
+
+
+def _printer_semaphore(ip: str) -> threading.BoundedSemaphore:
+    """Get the shared semaphore that caps in-flight requests to one printer."""
+    limit = get_max_concurrency()
+    with _limits_lock:
+        entry = _printer_limits.get(ip)
+        # Rebuild if the pool size changed since the semaphore was created
+        if entry is None or entry[0] != limit:
+            entry = (limit, threading.BoundedSemaphore(limit))
+            _printer_limits[ip] = entry
+        return entry[1]
+
+
+def fetch_concurrently(
+    ip: str,
+    endpoints: List[str],
+    fetch_one: Callable[[str], str],
+    on_result: Optional[ResultCallback] = None,
+) -> Dict[str, str]:
+    """
+    Fetch endpoints in parallel with a per-printer concurrency limit.
+
+    Args:
+        ip: Printer IP (the concurrency limit is shared per IP)
+        endpoints: Endpoint paths to fetch
+        fetch_one: Function fetching a single endpoint and returning its text
+        on_result: Optional callback called with (endpoint, text) as each
+            endpoint finishes, in completion order, on the calling thread
+
+    Returns:
+        Dict mapping endpoint to response text (or "Error: ..." message),
+        in the same order as endpoints
+    """
+    results: Dict[str, str] = {}
+    if not endpoints:
+        return results
+
+    semaphore = _printer_semaphore(ip)
+
+    def _fetch(endpoint: str) -> str:
+        with semaphore:
+            try:
+                return fetch_one(endpoint)
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+    unique = list(dict.fromkeys(endpoints))
+    workers = min(get_max_concurrency(), len(unique))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as executor:
+        futures = {executor.submit(_fetch, endpoint): endpoint for endpoint in unique}
+        for future in as_completed(futures):
+            endpoint = futures[future]
+            results[endpoint] = future.result()
+            if on_result:
+                on_result(endpoint, results[endpoint])
+
+    # Preserve caller's ordering
+    return {endpoint: results[endpoint] for endpoint in unique}
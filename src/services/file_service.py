@@ -9,6 +9,8 @@ import json
 from typing import Tuple, Optional, Any, Union
 from PIL import Image
 
+from src.services.directory_index import get_directory_index, PAREN
+
 
 class FileManager:
     """
@@ -54,6 +56,10 @@ class FileManager:
         """
         Creates a safe filepath that won't overwrite existing files.
         
+        The name is looked up in (and claimed from) the directory's shared
+        DirectoryIndex; callers that write the file should report it with
+        get_directory_index(directory).add(filepath).
+        
         Args:
             directory: Directory to save the file in (uses default if None)
             base_filename: Base name for the file (without step prefix)
@@ -88,17 +94,9 @@ class FileManager:
         if clean_filename.endswith('.') and extension.startswith('.'):
             clean_filename = clean_filename[:-1]
         
-        # Create initial filepath
-        filepath = os.path.join(directory, f"{clean_filename}{extension}")
-        filename = f"{clean_filename}{extension}"
-        
-        # If file exists, add a counter to make it unique
-        counter = 1
-        while os.path.exists(filepath):
-            counter_filename = f"{clean_filename} ({counter}){extension}"
-            filepath = os.path.join(directory, counter_filename)
-            filename = counter_filename
-            counter += 1
+        # If the name is taken, number it: "name (1).ext", "name (2).ext", ...
+        filename = get_directory_index(directory).next_free_name(clean_filename, extension, PAREN)
+        filepath = os.path.join(directory, filename)
         
         return filepath, filename
     
@@ -119,6 +117,7 @@ class FileManager:
         if directory is None:
             directory = self.default_directory
         
+        filepath = None
         try:
             # Convert string to dict if needed
             if isinstance(data, str):
@@ -141,6 +140,7 @@ class FileManager:
             tab_prefixed_json = '\t' + pretty_json.replace('\n', '\n\t')
             with open(filepath, 'w', encoding='utf-8') as file:
                 file.write(tab_prefixed_json)
+            get_directory_index(directory).add(filepath)
             
             if self.debug:
                 print(f"JSON saved to: {filepath}")
@@ -150,6 +150,8 @@ class FileManager:
             
             return True, filepath
         except Exception as e:
+            if filepath:
+                get_directory_index(directory).release(filepath)
             if self.debug:
                 print(f"Error saving JSON: {str(e)}")
             
@@ -179,6 +181,7 @@ class FileManager:
         
         extension = f".{format.lower()}"
         
+        filepath = None
         try:
             # Get safe filepath
             filepath, filename = self.get_safe_filepath(directory, base_filename, extension, step_number)
@@ -190,6 +193,7 @@ class FileManager:
             else:
                 # Assume PIL Image
                 image_data.save(filepath, format=format)
+            get_directory_index(directory).add(filepath)
             
             if self.debug:   
                 print(f"Image saved to: {filepath}")
@@ -199,6 +203,8 @@ class FileManager:
             
             return True, filepath
         except Exception as e:
+            if filepath:
+                get_directory_index(directory).release(filepath)
             if self.debug:
                 print(f"Error saving image: {str(e)}")
             
@@ -226,6 +232,7 @@ class FileManager:
         if directory is None:
             directory = self.default_directory
         
+        filepath = None
         try:
             # Get safe filepath
             filepath, filename = self.get_safe_filepath(directory, base_filename, extension, step_number)
@@ -233,6 +240,7 @@ class FileManager:
             # Write text data
             with open(filepath, 'w', encoding='utf-8') as file:
                 file.write(text_data)
+            get_directory_index(directory).add(filepath)
             
             if self.debug:
                 print(f"Text saved to: {filepath}")
@@ -242,6 +250,8 @@ class FileManager:
             
             return True, filepath
         except Exception as e:
+            if filepath:
+                get_directory_index(directory).release(filepath)
             if self.debug:
                 print(f"Error saving text: {str(e)}")
             
@@ -0,0 +1,196 @@
+"""
+Frame Change Detection - Tile hashing for streamed framebuffers.
+
+Splits the screen into fixed-size tiles and remembers a fast hash of each
+one. VNC servers report rectangles they *might* have changed (some resend
+whole regions on every poll), so VNCService rehashes only the tiles those
+rectangles touch and forwards the ones whose pixels really differ.
+Hashes use xxhash when installed and BLAKE2b otherwise.
+No Qt or UI dependencies.
+"""
+import hashlib
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+
+from PIL import Image
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+DEFAULT_TILE_SIZE = 32
+
+# (left, top, right, bottom) in pixels, right/bottom exclusive
+Box = Tuple[int, int, int, int]
+# (column, row) in tiles
+Tile = Tuple[int, int]
+
+
+def _new_hasher():
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+
+class TileChangeDetector:
+    """
+    Per-tile content hashes for one framebuffer.
+
+    Counters:
+        frames_delivered: Updates that had at least one changed tile
+        duplicates_dropped: Updates whose tiles all hashed the same as before
+        tiles_changed: Total changed tiles across delivered updates
+
+    Thread safety: diff() is meant to be called from one capture thread;
+    the counters can be read from any thread.
+    """
+
+    def __init__(self, tile_size: int = DEFAULT_TILE_SIZE):
+        """
+        Initialize the detector.
+
+        Args:
+            tile_size: Tile edge in pixels.
+        """
+        self.tile_size = max(8, int(tile_size))
+        self._hashes: Dict[Tile, bytes] = {}
+        self._size: Tuple[int, int] = (0, 0)
+        self._lock = threading.Lock()
+        self.frames_delivered = 0
+        self.duplicates_dropped = 0
+        self.tiles_changed = 0
+
+    def reset(self) -> None:
+        """Forget all tile hashes (the next diff reports every tile it checks)."""
+        self._hashes.clear()
+
+    def reset_counters(self) -> None:
+        """Zero the delivered/dropped counters."""
+        with self._lock:
+            self.frames_delivered = 0
+            self.duplicates_dropped = 0
+            self.tiles_changed = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the counters."""
+        with self._lock:
+            return {
+                "frames_delivered": self.frames_delivered,
+                "duplicates_dropped": self.duplicates_dropped,
+                "tiles_changed": self.tiles_changed,
+            }
+
+    def diff(self, screen: Image.Image, boxes: Iterable[Box]) -> List[Tile]:
+        """
+        Rehash the tiles under the given boxes and return those that changed.
+
+        Args:
+            screen: Current framebuffer (RGB)
+            boxes: Regions that may have changed; widened to whole tiles
+
+        Returns:
+            Changed tiles, sorted by row then column. Empty means the update
+            was a duplicate (counted in duplicates_dropped).
+        """
+        width, height = screen.size
+        if self._size != (width, height):
+            self._size = (width, height)
+            self.reset()
+
+        size = self.tile_size
+        changed: List[Tile] = []
+        seen: Set[Tile] = set()
+
+        for box in self._align(boxes, width, height):
+            left, top, right, bottom = box
+            data = memoryview(screen.crop(box).tobytes())
+            stride = (right - left) * 3
+
+            for ty in range(top, bottom, size):
+                rows = range(ty - top, min(ty + size, bottom) - top)
+                for tx in range(left, right, size):
+                    tile = (tx // size, ty // size)
+                    if tile in seen:
+                        continue
+                    seen.add(tile)
+
+                    start = (tx - left) * 3
+                    end = (min(tx + size, right) - left) * 3
+                    hasher = _new_hasher()
+                    for row in rows:
+                        hasher.update(data[row * stride + start:row * stride + end])
+                    digest = hasher.digest()
+
+                    if self._hashes.get(tile) != digest:
+                        self._hashes[tile] = digest
+                        changed.append(tile)
+
+        with self._lock:
+            if changed:
+                self.frames_delivered += 1
+                self.tiles_changed += len(changed)
+            else:
+                self.duplicates_dropped += 1
+
+        changed.sort(key=lambda tile: (tile[1], tile[0]))
+        return changed
+
+    def tiles_to_boxes(self, tiles: List[Tile]) -> List[Box]:
+        """
+        Merge changed tiles into as few pixel boxes as is cheap to find.
+
+        Runs of adjacent tiles in a row become one box, and identical runs
+        on consecutive rows are stacked into one taller box.
+
+        Args:
+            tiles: Tiles sorted by row then column (as returned by diff)
+
+        Returns:
+            Boxes clipped to the frame
+        """
+        size = self.tile_size
+        width, height = self._size
+
+        # Horizontal runs per row: row -> [(first_col, last_col)]
+        runs: Dict[int, List[Tuple[int, int]]] = {}
+        for col, row in tiles:
+            row_runs = runs.setdefault(row, [])
+            if row_runs and row_runs[-1][1] == col - 1:
+                row_runs[-1] = (row_runs[-1][0], col)
+            else:
+                row_runs.append((col, col))
+
+        # Stack identical runs on consecutive rows: (first_col, last_col) -> [first_row, last_row]
+        open_spans: Dict[Tuple[int, int], List[int]] = {}
+        spans: List[Tuple[int, int, int, int]] = []
+        for row in sorted(runs):
+            current = set(runs[row])
+            for run in list(open_spans):
+                if run not in current or open_spans[run][1] != row - 1:
+                    spans.append((*run, *open_spans.pop(run)))
+            for run in runs[row]:
+                if run in open_spans:
+                    open_spans[run][1] = row
+                else:
+                    open_spans[run] = [row, row]
+        spans.extend((*run, *rows) for run, rows in open_spans.items())
+
+        return [
+            (first_col * size, first_row * size,
+             min((last_col + 1) * size, width), min((last_row + 1) * size, height))
+            for first_col, last_col, first_row, last_row in spans
+        ]
+
+    def _align(self, boxes: Iterable[Box], width: int, height: int) -> List[Box]:
+        """Widen boxes to tile boundaries and clip them to the frame."""
+        size = self.tile_size
+        aligned = []
+        for left, top, right, bottom in boxes:
+            left, top = max(0, left) // size * size, max(0, top) // size * size
+            right = min(width, -(-right // size) * size)
+            bottom = min(height, -(-bottom // size) * size)
+            if right > left and bottom > top:
+                aligned.append((left, top, right, bottom))
+        return aligned
@@ -0,0 +1,88 @@
+"""
+Frame Mailbox - Single-slot, latest-wins handoff from a stream to the UI.
+
+Stream services publish every frame into their mailbox from the capture
+thread and never wait for the consumer. The mailbox holds at most one
+frame: publishing over an unconsumed frame replaces it (or merges it, for
+streams of deltas), so a slow consumer costs dropped frames instead of a
+growing backlog, and the frame it takes is always the newest one.
+No Qt or UI dependencies.
+"""
+import threading
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class FrameMailbox(Generic[T]):
+    """
+    One-slot mailbox with overwrite semantics.
+
+    The consumer is told about new frames through on_available, which is
+    called (on the publishing thread) only when the slot goes from empty
+    to full, so it never has more than one notification in flight. It then
+    calls take() from its own thread.
+
+    Counters:
+        produced: Frames published
+        consumed: Frames taken
+        dropped: Frames overwritten (or merged away) before being taken
+
+    Thread safety: All methods are thread-safe.
+    """
+
+    def __init__(self, merge: Optional[Callable[[T, T], T]] = None):
+        """
+        Initialize an empty mailbox.
+
+        Args:
+            merge: Optional function (pending, new) -> frame used instead of
+                plain replacement, for frames that are deltas of each other.
+        """
+        self.merge = merge
+        self.on_available: Optional[Callable[[], None]] = None
+        self._lock = threading.Lock()
+        self._frame: Optional[T] = None
+        self.produced = 0
+        self.consumed = 0
+        self.dropped = 0
+
+    def publish(self, frame: T) -> None:
+        """Put a frame in the slot, replacing (or merging with) any unconsumed one."""
+        with self._lock:
+            self.produced += 1
+            was_empty = self._frame is None
+            if was_empty:
+                self._frame = frame
+            else:
+                self.dropped += 1
+                self._frame = self.merge(self._frame, frame) if self.merge else frame
+            notify = self.on_available if was_empty else None
+
+        if notify:
+            notify()
+
+    def take(self) -> Optional[T]:
+        """Remove and return the newest frame, or None if the slot is empty."""
+        with self._lock:
+            frame, self._frame = self._frame, None
+            if frame is not None:
+                self.consumed += 1
+            return frame
+
+    def clear(self) -> None:
+        """Discard any unconsumed frame (not counted as dropped)."""
+        with self._lock:
+            self._frame = None
+
+    def reset_counters(self) -> None:
+        """Zero the produced/consumed/dropped counters."""
+        with self._lock:
+            self.produced = 0
+            self.consumed = 0
+            self.dropped = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the counters."""
+        with self._lock:
+            return {"produced": self.produced, "consumed": self.consumed, "dropped": self.dropped}
@@ -0,0 +1,140 @@
+"""
+Adaptive Frame Rate - Decides how often a stream should poll the printer.
+
+Used by VNCService and SiriusStreamService. Polls at the full rate while
+the screen is changing or the user is clicking/dragging/scrolling, decays
+toward a low idle rate once the screen goes static, stops completely while
+the stream is paused (widget hidden) and backs off exponentially while
+captures keep failing.
+No Qt or UI dependencies.
+"""
+import threading
+import time
+
+
+class AdaptiveRateController:
+    """
+    Frame pacing for one stream's capture loop.
+
+    The capture loop reports what happened (note_frame, note_error) and
+    calls sleep() between captures; other threads report user input
+    (note_interaction) and visibility (set_paused). Both wake a sleeping
+    loop immediately, so input never waits out an idle interval.
+    Thread safety: All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_fps: float,
+        idle_fps: float,
+        hold: float = 1.0,
+        half_life: float = 2.0,
+        error_backoff: float = 0.5,
+        max_backoff: float = 10.0,
+    ):
+        """
+        Initialize the rate controller.
+
+        Args:
+            max_fps: Rate while the screen changes or the user interacts.
+            idle_fps: Floor the rate decays to on a static screen.
+            hold: Seconds to stay at max_fps after the last activity.
+            half_life: Seconds for the rate to halve its distance to idle_fps.
+            error_backoff: Delay after the first consecutive error; doubles
+                with each further error.
+            max_backoff: Upper bound for the error delay.
+        """
+        self.max_fps = float(max_fps)
+        self.idle_fps = float(idle_fps)
+        self.hold = float(hold)
+        self.half_life = float(half_life)
+        self.error_backoff = float(error_backoff)
+        self.max_backoff = float(max_backoff)
+
+        self._cond = threading.Condition()
+        self._last_activity = time.monotonic()
+        self._errors = 0
+        self._paused = False
+        self._woken = False
+
+    @property
+    def paused(self) -> bool:
+        """True while the stream should not poll at all."""
+        return self._paused
+
+    def note_frame(self, changed: bool) -> None:
+        """Record a successful capture; a changed frame restarts the full rate."""
+        with self._cond:
+            self._errors = 0
+            if changed:
+                self._last_activity = time.monotonic()
+
+    def note_interaction(self) -> None:
+        """Record user input and wake the loop so the result shows at once."""
+        with self._cond:
+            self._last_activity = time.monotonic()
+            self._woken = True
+            self._cond.notify_all()
+
+    def note_error(self) -> None:
+        """Record a failed capture (the next delay backs off)."""
+        with self._cond:
+            self._errors += 1
+
+    def set_paused(self, paused: bool) -> None:
+        """Pause or resume polling; resuming starts again at the full rate."""
+        with self._cond:
+            if self._paused and not paused:
+                self._last_activity = time.monotonic()
+            self._paused = paused
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        """Interrupt a sleep() in progress (e.g. so the loop can see a stop flag)."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    def current_fps(self) -> float:
+        """The rate the loop should run at right now."""
+        with self._cond:
+            return self._fps(time.monotonic())
+
+    def next_delay(self) -> float:
+        """Seconds between the start of one capture and the next."""
+        with self._cond:
+            return self._delay(time.monotonic())
+
+    def sleep(self, elapsed: float = 0.0) -> None:
+        """
+        Wait until the next capture is due.
+
+        Blocks for as long as the stream is paused. Returns early on
+        note_interaction(), set_paused(False) or wake().
+
+        Args:
+            elapsed: Seconds the capture itself already took.
+        """
+        with self._cond:
+            start = time.monotonic() - elapsed
+            while not self._woken:
+                if self._paused:
+                    self._cond.wait()
+                    continue
+                remaining = start + self._delay(time.monotonic()) - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._woken = False
+
+    def _fps(self, now: float) -> float:
+        idle_for = now - self._last_activity - self.hold
+        if idle_for <= 0:
+            return self.max_fps
+        decay = 0.5 ** (idle_for / self.half_life) if self.half_life > 0 else 0.0
+        return self.idle_fps + (self.max_fps - self.idle_fps) * decay
+
+    def _delay(self, now: float) -> float:
+        if self._errors:
+            return min(self.max_backoff, self.error_backoff * 2 ** (self._errors - 1))
+        return 1.0 / max(self._fps(now), 1e-3)
@@ -0,0 +1,169 @@
+"""
+HTTP Session Pool - Shared keep-alive sessions for printer HTTP(S) traffic.
+
+Holds one requests.Session per printer IP so that CDM, LEDM and Sirius stream
+requests reuse open TCP connections (and TLS sessions) instead of doing a
+full handshake on every call.
+No Qt or UI dependencies.
+"""
+import threading
+import time
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+
+# Suppress insecure request warnings
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Default pool settings
+DEFAULT_POOL_SIZE = 4         # Max keep-alive connections per printer
+DEFAULT_IDLE_TIMEOUT = 60.0   # Seconds before an unused session is closed
+
+
+class _PooledSession:
+    """A session plus the time it was last handed out."""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+        self.last_used = time.monotonic()
+
+
+class HttpSessionPool:
+    """
+    Per-printer pool of keep-alive HTTP sessions.
+
+    Sessions are created lazily on first use and closed when they have been
+    idle for longer than idle_timeout, when the pool is reconfigured, or
+    when a service switches to a different printer.
+    Thread safety: All methods are thread-safe. requests.Session itself is
+    safe to share between worker threads for simple GET/PUT calls.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the session pool.
+
+        Args:
+            pool_size: Max keep-alive connections kept open per printer.
+            idle_timeout: Seconds of inactivity before a session is closed.
+        """
+        self.pool_size = max(1, int(pool_size))
+        self.idle_timeout = float(idle_timeout)
+        self._sessions: Dict[str, _PooledSession] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, pool_size: Optional[int] = None, idle_timeout: Optional[float] = None) -> None:
+        """
+        Update pool settings.
+
+        Changing the pool size closes existing sessions so new ones pick up
+        the new adapter limits.
+
+        Args:
+            pool_size: Max keep-alive connections per printer.
+            idle_timeout: Seconds of inactivity before a session is closed.
+        """
+        if idle_timeout is not None:
+            self.idle_timeout = float(idle_timeout)
+
+        if pool_size is not None and max(1, int(pool_size)) != self.pool_size:
+            self.pool_size = max(1, int(pool_size))
+            self.close_all()
+
+    def get_session(self, ip: str) -> requests.Session:
+        """
+        Get the shared session for a printer, creating it if needed.
+
+        Args:
+            ip: The IP address of the printer.
+
+        Returns:
+            A keep-alive requests.Session for that printer
+        """
+        with self._lock:
+            self._reap_idle_locked()
+
+            pooled = self._sessions.get(ip)
+            if pooled is None:
+                pooled = _PooledSession(self._create_session())
+                self._sessions[ip] = pooled
+
+            pooled.last_used = time.monotonic()
+            return pooled.session
+
+    def close(self, ip: str) -> None:
+        """Close the session (and its sockets) for a printer."""
+        with self._lock:
+            pooled = self._sessions.pop(ip, None)
+        if pooled:
+            self._close_session(pooled.session)
+
+    def close_all(self) -> None:
+        """Close every pooled session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for pooled in sessions:
+            self._close_session(pooled.session)
+
+    def _reap_idle_locked(self) -> None:
+        """Close sessions idle past the timeout. Caller must hold the lock."""
+        if self.idle_timeout <= 0:
+            return
+
+        now = time.monotonic()
+        expired = [
+            ip for ip, pooled in self._sessions.items()
+            if now - pooled.last_used > self.idle_timeout
+        ]
+        for ip in expired:
+            self._close_session(self._sessions.pop(ip).session)
+
+    def _create_session(self) -> requests.Session:
+        """Build a session whose adapters keep pool_size connections alive."""
+        session = requests.Session()
+        session.verify = False
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _close_session(session: requests.Session) -> None:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+# Process-wide pool shared by all HTTP services
+_http_pool = HttpSessionPool()
+
+
+def get_http_pool() -> HttpSessionPool:
+    """Return the process-wide HTTP session pool."""
+    return _http_pool
+
+
+def retarget_service(service, service_cls, ip: str):
+    """
+    Point an HTTP service at a new IP, reusing the instance so its pooled sockets get closed.
+
+    Args:
+        service: The current service instance, or None
+        service_cls: Class to create one from if there is none yet
+        ip: New printer IP ("" drops the service)
+
+    Returns:
+        The service for the new IP, or None if ip is empty
+    """
+    if not ip:
+        if service:
+            service.set_ip("")
+        return None
+    if service:
+        service.set_ip(ip)
+        return service
+    return service_cls(ip)
@@ -7,7 +7,11 @@ No Qt or UI dependencies - pure data fetching and returning.
 import requests
 import urllib3
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
+
+from src.services.http_pool import get_http_pool
+from src.services.fetch_engine import fetch_concurrently
+from src.services.response_cache import conditional_get, get_response_cache
 
 # Suppress insecure request warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -24,17 +28,81 @@ LEDM_NAMESPACES = {
 }
 
 
+# Endpoint paths
+ALERTS_ENDPOINT = "/DevMgmt/ProductStatusDyn.xml"
+
+
 class LEDMApiError(Exception):
     """Exception raised for LEDM API errors."""
     pass
 
 
+def parse_alerts_xml(xml_text: str) -> List[Dict[str, Any]]:
+    """
+    Parse ProductStatusDyn.xml into alert dictionaries in the common format.
+    
+    Shared by LEDMApiService and the async client.
+    
+    Raises:
+        LEDMApiError: If the XML cannot be parsed
+    """
+    try:
+        root = ET.fromstring(xml_text)
+        
+        alerts = []
+        ns = LEDM_NAMESPACES
+        
+        for alert in root.findall('.//psdyn:AlertTable/psdyn:Alert', ns):
+            details = alert.find('ad:AlertDetails', ns)
+            
+            # Extract color
+            color = ''
+            if details is not None:
+                color = details.findtext('ad:AlertDetailsMarkerColor', namespaces=ns, default='')
+            
+            # Normalize color names
+            if color == "CyanMagentaYellow":
+                color = "Tri-Color"
+            
+            # Extract IDs and error codes
+            product_status_id = alert.findtext('ad:ProductStatusAlertID', namespaces=ns, default='')
+            original_string_id = alert.findtext('locid:StringId', namespaces=ns, default='')
+            error_code = ''
+            if details is not None:
+                error_code = details.findtext('ad:AlertDetailsErrorCode', namespaces=ns, default='')
+            
+            # Prepare badges
+            badges = []
+            if product_status_id:
+                badges.append(product_status_id)
+            if error_code:
+                badges.append(error_code)
+            
+            # Build normalized alert object
+            alerts.append({
+                'id': product_status_id,
+                'stringId': original_string_id,
+                'badges': badges,
+                'category': color if color else 'General',
+                'severity': alert.findtext('ad:Severity', namespaces=ns, default='info'),
+                'priority': alert.findtext('ad:AlertPriority', namespaces=ns, default=''),
+                'raw_color': color,
+                'original_stringId': original_string_id
+            })
+        
+        return alerts
+        
+    except ET.ParseError as e:
+        raise LEDMApiError(f"Failed to parse XML: {str(e)}")
+
+
 class LEDMApiService:
     """
     Service for fetching data from LEDM endpoints (Sirius printers).
     
     LEDM uses HTTP (not HTTPS) and returns XML instead of JSON.
     All methods are synchronous and return raw/parsed data or raise LEDMApiError.
+    Alert polls use conditional GETs backed by the shared response cache.
     """
     
     def __init__(self, ip: str):
@@ -47,16 +115,21 @@ class LEDMApiService:
         self.ip = ip
     
     def set_ip(self, ip: str) -> None:
-        """Update the target IP address."""
-        self.ip = ip
+        """Update the target IP address. Closes pooled sockets to the old printer."""
+        if ip != self.ip:
+            get_http_pool().close(self.ip)
+            get_response_cache().invalidate(self.ip)
+            self.ip = ip
     
-    def _get(self, endpoint: str, timeout: int = DEFAULT_TIMEOUT) -> requests.Response:
+    def _get(self, endpoint: str, timeout: int = DEFAULT_TIMEOUT,
+             headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """
         Perform a GET request to the specified LEDM endpoint.
         
         Args:
             endpoint: The API endpoint path (e.g., '/DevMgmt/ProductStatusDyn.xml')
             timeout: Request timeout in seconds
+            headers: Optional extra request headers (e.g. conditional GET validators)
             
         Returns:
             The response object
@@ -72,7 +145,9 @@ class LEDMApiService:
         url = f"http://{self.ip}{endpoint}"
         
         try:
-            response = requests.get(url, verify=False, timeout=timeout)
+            response = get_http_pool().get_session(self.ip).get(
+                url, headers=headers, verify=False, timeout=timeout
+            )
             response.raise_for_status()
             return response
         except requests.exceptions.Timeout:
@@ -84,6 +159,28 @@ class LEDMApiService:
         except Exception as e:
             raise LEDMApiError(f"Request failed: {str(e)}")
     
+    def _get_cached(self, endpoint: str, parse, timeout: int = DEFAULT_TIMEOUT) -> Any:
+        """
+        GET an endpoint through the response cache.
+        
+        Args:
+            endpoint: The API endpoint path
+            parse: Function turning the response into the cached object
+            timeout: Request timeout in seconds
+            
+        Returns:
+            The parsed data. When unchanged, the cached object is returned
+            as-is, so callers must not mutate it.
+            
+        Raises:
+            LEDMApiError: If the request fails
+        """
+        return conditional_get(
+            get_response_cache(), self.ip, endpoint,
+            lambda headers: self._get(endpoint, timeout=timeout, headers=headers),
+            parse
+        )
+    
     # -------------------------------------------------------------------------
     # Alerts API
     # -------------------------------------------------------------------------
@@ -92,61 +189,15 @@ class LEDMApiService:
         """
         Fetch and parse alerts from ProductStatusDyn.xml.
         
+        The cached list is reused if ProductStatusDyn.xml is unchanged.
+        
         Returns:
             List of alert dictionaries normalized to common format
             
         Raises:
             LEDMApiError: If the request or parsing fails
         """
-        try:
-            response = self._get("/DevMgmt/ProductStatusDyn.xml")
-            root = ET.fromstring(response.text)
-            
-            alerts = []
-            ns = LEDM_NAMESPACES
-            
-            for alert in root.findall('.//psdyn:AlertTable/psdyn:Alert', ns):
-                details = alert.find('ad:AlertDetails', ns)
-                
-                # Extract color
-                color = ''
-                if details is not None:
-                    color = details.findtext('ad:AlertDetailsMarkerColor', namespaces=ns, default='')
-                
-                # Normalize color names
-                if color == "CyanMagentaYellow":
-                    color = "Tri-Color"
-                
-                # Extract IDs and error codes
-                product_status_id = alert.findtext('ad:ProductStatusAlertID', namespaces=ns, default='')
-                original_string_id = alert.findtext('locid:StringId', namespaces=ns, default='')
-                error_code = ''
-                if details is not None:
-                    error_code = details.findtext('ad:AlertDetailsErrorCode', namespaces=ns, default='')
-                
-                # Prepare badges
-                badges = []
-                if product_status_id:
-                    badges.append(product_status_id)
-                if error_code:
-                    badges.append(error_code)
-                
-                # Build normalized alert object
-                alerts.append({
-                    'id': product_status_id,
-                    'stringId': original_string_id,
-                    'badges': badges,
-                    'category': color if color else 'General',
-                    'severity': alert.findtext('ad:Severity', namespaces=ns, default='info'),
-                    'priority': alert.findtext('ad:AlertPriority', namespaces=ns, default=''),
-                    'raw_color': color,
-                    'original_stringId': original_string_id
-                })
-            
-            return alerts
-            
-        except ET.ParseError as e:
-            raise LEDMApiError(f"Failed to parse XML: {str(e)}")
+        return self._get_cached(ALERTS_ENDPOINT, lambda response: parse_alerts_xml(response.text))
     
     # -------------------------------------------------------------------------
     # Generic Endpoint Fetching
@@ -168,27 +219,25 @@ class LEDMApiService:
         response = self._get(endpoint)
         return response.text
     
-    def fetch_endpoints(self, endpoints: List[str]) -> Dict[str, str]:
+    def fetch_endpoints(
+        self,
+        endpoints: List[str],
+        on_result: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
         """
-        Fetch multiple endpoints and return results.
+        Fetch multiple endpoints in parallel and return results.
+        
+        Concurrency is capped per printer (see fetch_engine.set_max_concurrency).
         
         Args:
             endpoints: List of endpoint paths
+            on_result: Optional callback called with (endpoint, text) as each
+                endpoint finishes, before all of them are done
             
         Returns:
             Dict mapping endpoint to response text (or error message)
         """
-        results = {}
-        
-        for endpoint in endpoints:
-            try:
-                results[endpoint] = self.fetch_endpoint(endpoint)
-            except LEDMApiError as e:
-                results[endpoint] = f"Error: {str(e)}"
-            except Exception as e:
-                results[endpoint] = f"Error: {str(e)}"
-        
-        return results
+        return fetch_concurrently(self.ip, endpoints, self.fetch_endpoint, on_result)
     
     def fetch_endpoint_xml(self, endpoint: str) -> ET.Element:
         """
@@ -0,0 +1,156 @@
+"""
+Response Cache - Conditional GET support for printer HTTP endpoints.
+
+Remembers the last response per (printer IP, endpoint): its ETag /
+Last-Modified validators, a hash of the body and the parsed object built
+from it. Used by CDMApiService and LEDMApiService so that polling an
+unchanged endpoint neither downloads (304) nor re-parses (same hash) it.
+No Qt or UI dependencies.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import requests
+
+
+@dataclass
+class CachedResponse:
+    """Last known response for one endpoint."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    parsed: Any
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for this entry (empty if the firmware sent none)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Per-printer cache of parsed endpoint responses.
+
+    Thread safety: All methods are thread-safe.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[str, str], CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, ip: str, endpoint: str) -> Optional[CachedResponse]:
+        """Return the cached entry for an endpoint, if any."""
+        with self._lock:
+            return self._entries.get((ip, endpoint))
+
+    def store(self, ip: str, endpoint: str, entry: CachedResponse) -> None:
+        """Store the latest entry for an endpoint."""
+        with self._lock:
+            self._entries[(ip, endpoint)] = entry
+
+    def invalidate(self, ip: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            ip: Only drop entries for this printer; None drops everything.
+        """
+        with self._lock:
+            if ip is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == ip]:
+                    del self._entries[key]
+
+
+def conditional_get(
+    cache: ResponseCache,
+    ip: str,
+    endpoint: str,
+    get: Callable[[Dict[str, str]], requests.Response],
+    parse: Callable[[requests.Response], Any]
+) -> Any:
+    """
+    Fetch an endpoint, reusing the cached parsed object when it has not changed.
+
+    Sends If-None-Match / If-Modified-Since when the previous response had
+    validators. A 304, or a 200 whose body hashes the same as last time,
+    returns the cached parsed object without parsing again.
+
+    Args:
+        cache: The cache to consult and update
+        ip: Printer IP (part of the cache key)
+        endpoint: Endpoint path (part of the cache key)
+        get: Function performing the GET with the given extra headers
+        parse: Function turning a response into the object to cache
+
+    Returns:
+        The parsed object. When unchanged, the cached object is returned
+        as-is, so callers must not mutate it.
+    """
+    entry = cache.lookup(ip, endpoint)
+    response = get(entry.validators() if entry else {})
+    return resolve_response(
+        cache, ip, endpoint, entry,
+        response.status_code, response.content, response.headers,
+        lambda: parse(response)
+    )
+
+
+def resolve_response(
+    cache: ResponseCache,
+    ip: str,
+    endpoint: str,
+    entry: Optional[CachedResponse],
+    status_code: int,
+    content: bytes,
+    headers: Mapping[str, str],
+    parse: Callable[[], Any]
+) -> Any:
+    """
+    Second half of a conditional GET, for callers doing the request themselves.
+
+    Args:
+        cache: The cache to update
+        ip: Printer IP (part of the cache key)
+        endpoint: Endpoint path (part of the cache key)
+        entry: The entry whose validators were sent (None if none were)
+        status_code: HTTP status of the response
+        content: Response body
+        headers: Response headers
+        parse: Function building the object to cache from this response
+
+    Returns:
+        The parsed object (the cached one when unchanged)
+    """
+    if entry and status_code == 304:
+        return entry.parsed
+
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+
+    if entry and entry.content_hash == content_hash:
+        # Same body: keep the parsed object, refresh validators in case they moved
+        entry.etag, entry.last_modified = etag, last_modified
+        return entry.parsed
+
+    parsed = parse()
+    cache.store(ip, endpoint, CachedResponse(etag, last_modified, content_hash, parsed))
+    return parsed
+
+
+# Process-wide cache shared by all HTTP services
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    return _response_cache
@@ -7,11 +7,17 @@ TestService endpoint for screen capture via HTTPS.
 import threading
 import time
 import io
+import hashlib
 import requests
 import urllib3
 from typing import Optional, Callable
 from PIL import Image
 
+from src.services.http_pool import get_http_pool
+from src.services.frame_rate import AdaptiveRateController
+from src.services.frame_mailbox import FrameMailbox
+from src.services.stream_recorder import StreamRecorder
+
 # Suppress insecure request warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -33,8 +39,9 @@ class SiriusStreamService:
     
     # Timing settings
     DEFAULT_TIMEOUT = 5
-    UPDATE_INTERVAL = 1.0  # seconds between captures
-    ERROR_RETRY_INTERVAL = 5.0  # seconds to wait after error
+    ACTIVE_FPS = 4.0  # captures per second while the screen is changing
+    IDLE_FPS = 0.5  # captures per second a static screen decays to
+    ERROR_RETRY_INTERVAL = 5.0  # max seconds to wait after repeated errors
     
     def __init__(self, ip: str, username: Optional[str] = None, password: Optional[str] = None):
         """
@@ -52,9 +59,18 @@ class SiriusStreamService:
         self._connected = False
         self._stop_event = threading.Event()
         self._update_thread: Optional[threading.Thread] = None
+        self._last_frame_hash: Optional[bytes] = None
+        self.rate = AdaptiveRateController(
+            self.ACTIVE_FPS, self.IDLE_FPS, max_backoff=self.ERROR_RETRY_INTERVAL
+        )
+        
+        # Latest encoded frame for the UI (older unconsumed frames are dropped)
+        self.mailbox: FrameMailbox[bytes] = FrameMailbox()
+        
+        # Recent history (the encoded frames as received) for export_recording()
+        self.recorder = StreamRecorder()
         
         # Callbacks
-        self.on_image_update: Optional[Callable[[bytes], None]] = None
         self.on_connection_status: Optional[Callable[[bool, str], None]] = None
     
     def set_ip(self, ip: str) -> None:
@@ -63,6 +79,7 @@ class SiriusStreamService:
             was_connected = self._connected
             if was_connected:
                 self.disconnect()
+            get_http_pool().close(self.ip)
             self.ip = ip
             if was_connected:
                 self.connect()
@@ -93,7 +110,7 @@ class SiriusStreamService:
         url = f"https://{self.ip}{self.CAPTURE_ENDPOINT}"
         
         try:
-            response = requests.get(
+            response = get_http_pool().get_session(self.ip).get(
                 url,
                 timeout=self.DEFAULT_TIMEOUT,
                 verify=False,
@@ -135,6 +152,19 @@ class SiriusStreamService:
                 pass
         return None
     
+    def export_recording(self, filepath: str, seconds: Optional[float] = None) -> int:
+        """
+        Save the recently streamed screen history as an animated PNG.
+        
+        Args:
+            filepath: Path to save the recording (.png)
+            seconds: How much history to save (default: the recorder's retention)
+            
+        Returns:
+            Number of frames written (0 if nothing has been streamed yet)
+        """
+        return self.recorder.export_apng(filepath, seconds)
+    
     def connect(self) -> None:
         """
         Connect to the printer and start continuous capture.
@@ -157,8 +187,9 @@ class SiriusStreamService:
             self.on_connection_status(True, "Connected successfully")
         
         # Deliver first frame
-        if self.on_image_update and frame:
-            self.on_image_update(frame)
+        self._last_frame_hash = self._frame_hash(frame)
+        self.recorder.record_encoded(frame)
+        self.mailbox.publish(frame)
         
         # Start continuous capture
         self._start_capture_thread()
@@ -166,6 +197,7 @@ class SiriusStreamService:
     def disconnect(self) -> None:
         """Disconnect and stop continuous capture."""
         self._stop_event.set()
+        self.rate.wake()
         
         if self._update_thread and self._update_thread.is_alive():
             self._update_thread.join(timeout=2.0)
@@ -182,19 +214,38 @@ class SiriusStreamService:
         self._update_thread.start()
     
     def _capture_loop(self) -> None:
-        """Background thread for continuous capture."""
+        """
+        Background thread for continuous capture.
+        
+        Only frames whose bytes differ from the previous one are published
+        to self.mailbox; the pause between captures comes from self.rate.
+        """
         while not self._stop_event.is_set():
+            start_time = time.time()
             try:
+                if self.rate.paused:
+                    self.rate.sleep()
+                    continue
+                
                 frame = self._capture_frame()
-                if frame and self.on_image_update:
-                    self.on_image_update(frame)
-                time.sleep(self.UPDATE_INTERVAL)
+                frame_hash = self._frame_hash(frame)
+                changed = frame_hash is not None and frame_hash != self._last_frame_hash
+                if changed:
+                    self._last_frame_hash = frame_hash
+                    self.recorder.record_encoded(frame)
+                    self.mailbox.publish(frame)
+                self.rate.note_frame(changed)
                 
-            except SiriusStreamError:
-                # Wait longer on error
-                time.sleep(self.ERROR_RETRY_INTERVAL)
             except Exception:
-                time.sleep(self.ERROR_RETRY_INTERVAL)
+                # Back off while errors keep coming
+                self.rate.note_error()
+            
+            self.rate.sleep(time.time() - start_time)
+    
+    @staticmethod
+    def _frame_hash(frame: Optional[bytes]) -> Optional[bytes]:
+        """Content hash used to skip frames identical to the previous one."""
+        return hashlib.blake2b(frame, digest_size=16).digest() if frame else None
     
     def __enter__(self):
         """Context manager entry."""
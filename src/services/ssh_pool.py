@@ -0,0 +1,173 @@
+"""
+SSH Connection Pool - One shared SSH transport per printer IP.
+
+Password auth plus the paramiko handshake takes seconds on printers, so
+SSHService(pooled=True) borrows a long-lived client from this pool instead
+of connecting every time. Each command opens its own channel on the
+shared transport, so several workers can run commands at once.
+No Qt or UI dependencies.
+"""
+import threading
+import time
+import paramiko
+from typing import Dict, Optional
+
+# Default pool settings
+DEFAULT_KEEPALIVE = 15          # Seconds between SSH keepalive packets
+DEFAULT_IDLE_TIMEOUT = 300.0    # Seconds before an unused connection is closed
+
+
+class _PooledConnection:
+    """A connected client plus the credentials it was opened with."""
+
+    def __init__(self, client: paramiko.SSHClient, username: str, password: str):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.last_used = time.monotonic()
+
+
+class SSHConnectionPool:
+    """
+    Per-printer pool of persistent SSH connections.
+
+    Connections are opened lazily, kept alive with SSH keepalives, checked
+    for liveness on every acquire and transparently re-opened when the
+    printer dropped them (reboot, network blip) or they sat idle too long.
+    Thread safety: All methods are thread-safe. Connecting to one printer
+    never blocks callers that want a different printer.
+    """
+
+    def __init__(self, keepalive: int = DEFAULT_KEEPALIVE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the connection pool.
+
+        Args:
+            keepalive: Seconds between keepalive packets (0 disables them).
+            idle_timeout: Seconds of inactivity before a connection is closed.
+        """
+        self.keepalive = int(keepalive)
+        self.idle_timeout = float(idle_timeout)
+        self._connections: Dict[str, _PooledConnection] = {}
+        self._ip_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, ip: str, username: str, password: str, timeout: float = 5) -> paramiko.SSHClient:
+        """
+        Get a live connected client for a printer, connecting if needed.
+
+        Args:
+            ip: The IP address of the printer.
+            username: SSH username.
+            password: SSH password.
+            timeout: Connect timeout in seconds.
+
+        Returns:
+            A connected paramiko.SSHClient shared with other callers. Do not
+            close it; call SSHService.disconnect() / release instead.
+
+        Raises:
+            paramiko.AuthenticationException, paramiko.SSHException, OSError:
+                If a new connection cannot be established
+        """
+        self._reap_idle()
+
+        with self._ip_lock(ip):
+            with self._lock:
+                pooled = self._connections.get(ip)
+
+            if pooled and (pooled.username, pooled.password) == (username, password) \
+                    and self._is_alive(pooled.client):
+                pooled.last_used = time.monotonic()
+                return pooled.client
+
+            # Dead, stale or opened with other credentials: reconnect
+            if pooled:
+                self._close_client(pooled.client)
+
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(ip, username=username, password=password, timeout=timeout)
+
+            transport = client.get_transport()
+            if transport and self.keepalive > 0:
+                transport.set_keepalive(self.keepalive)
+
+            with self._lock:
+                self._connections[ip] = _PooledConnection(client, username, password)
+            return client
+
+    def invalidate(self, ip: str, client: Optional[paramiko.SSHClient] = None) -> None:
+        """
+        Drop a connection that turned out to be broken.
+
+        Args:
+            ip: The IP address of the printer.
+            client: Only drop it if it is still this client (another caller
+                may already have reconnected).
+        """
+        with self._lock:
+            pooled = self._connections.get(ip)
+            if pooled is None or (client is not None and pooled.client is not client):
+                return
+            del self._connections[ip]
+        self._close_client(pooled.client)
+
+    def close(self, ip: str) -> None:
+        """Close the connection to a printer."""
+        self.invalidate(ip)
+
+    def close_all(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for pooled in connections:
+            self._close_client(pooled.client)
+
+    def _ip_lock(self, ip: str) -> threading.Lock:
+        with self._lock:
+            return self._ip_locks.setdefault(ip, threading.Lock())
+
+    def _reap_idle(self) -> None:
+        """Close connections idle past the timeout."""
+        if self.idle_timeout <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                ip for ip, pooled in self._connections.items()
+                if now - pooled.last_used > self.idle_timeout
+            ]
+            stale = [self._connections.pop(ip) for ip in expired]
+        for pooled in stale:
+            self._close_client(pooled.client)
+
+    @staticmethod
+    def _is_alive(client: paramiko.SSHClient) -> bool:
+        """Check that the transport is up and the socket still accepts writes."""
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_client(client: paramiko.SSHClient) -> None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+# Process-wide pool shared by all pooled SSH services
+_ssh_pool = SSHConnectionPool()
+
+
+def get_ssh_pool() -> SSHConnectionPool:
+    """Return the process-wide SSH connection pool."""
+    return _ssh_pool
@@ -4,10 +4,19 @@ SSH Service - SSH connection and command execution.
 This service handles SSH connections for telemetry fetching and remote commands.
 No Qt or UI dependencies - pure connection and data handling.
 """
+import codecs
 import json
+import os
 import re
+import shlex
+import tarfile
+import time
+import zlib
 import paramiko
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+
+from src.services.ssh_pool import get_ssh_pool
 
 
 class SSHServiceError(Exception):
@@ -15,11 +24,263 @@ class SSHServiceError(Exception):
     pass
 
 
+def build_telemetry_command(path: str, pattern: str) -> str:
+    """Build the single shell command that dumps every telemetry file with markers."""
+    return (
+        f"cd {path} && "
+        f"for f in {pattern}; do "
+        "echo '===FILE_START==='; "
+        "echo \"$f\"; "
+        "cat \"$f\"; "
+        "echo '===FILE_END==='; "
+        "done"
+    )
+
+
+def parse_telemetry_output(stdout: str) -> List[Dict[str, Any]]:
+    """
+    Parse the marker-delimited output of build_telemetry_command.
+    
+    Shared by SSHService and the async client.
+    
+    Returns:
+        List of telemetry event dictionaries, newest sequence number first
+    """
+    # Handle empty response
+    if not stdout.strip():
+        return []
+    
+    # Parse output into individual files
+    file_blocks = re.split(
+        r'===FILE_START===\n(.*?)\n(.*?)===FILE_END===',
+        stdout,
+        flags=re.DOTALL
+    )
+    
+    telemetry_data = []
+    for i in range(0, len(file_blocks) - 1, 3):
+        if i + 2 >= len(file_blocks):
+            continue
+        
+        event = parse_telemetry_file(file_blocks[i + 1].strip(), file_blocks[i + 2])
+        if event:
+            telemetry_data.append(event)
+    
+    # Sort by sequence number (descending)
+    telemetry_data.sort(key=_sequence_key, reverse=True)
+    
+    return telemetry_data
+
+
+def parse_telemetry_file(filename: str, content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse one telemetry file into an event dictionary.
+    
+    Returns:
+        The event dict (with an 'error' key if the JSON is bad), or None if
+        the file is empty
+    """
+    content = content.strip()
+    if not content:
+        return None
+    
+    try:
+        data = json.loads(content)
+        return {
+            'filename': filename,
+            'sequenceNumber': data.get('sequenceNumber', ''),
+            'color': data.get('eventDetail', {}).get('identityInfo', {}).get('supplyColorCode', ''),
+            'reasons': data.get('eventDetail', {}).get('stateInfo', {}).get('stateReasons', []),
+            'trigger': data.get('eventDetail', {}).get('notificationTrigger', 'Unknown'),
+            'raw_data': data
+        }
+    except json.JSONDecodeError as e:
+        return {
+            'filename': filename,
+            'error': f"Invalid JSON: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            'filename': filename,
+            'error': str(e)
+        }
+
+
+# Exit codes of build_telemetry_archive_command
+ARCHIVE_NO_FILES_EXIT = 3   # No file matches the pattern
+ARCHIVE_NO_TOOLS_EXIT = 4   # tar or gzip is not installed on the printer
+
+# Seconds to wait for the exit code of an archive command we stopped reading
+ARCHIVE_EXIT_GRACE = 2.0
+
+
+def build_telemetry_archive_command(path: str, pattern: str) -> str:
+    """Build a command streaming the telemetry files as a gzipped tar archive."""
+    return (
+        f"{{ command -v tar && command -v gzip; }} >/dev/null 2>&1 || exit {ARCHIVE_NO_TOOLS_EXIT}; "
+        f"cd {path} && set -- {pattern} && "
+        f"{{ [ -e \"$1\" ] || exit {ARCHIVE_NO_FILES_EXIT}; }} && "
+        "tar cf - \"$@\" | gzip -c"
+    )
+
+
+# Callback invoked with each telemetry event as soon as it is parsed
+EventCallback = Callable[[Dict[str, Any]], None]
+
+
+class TelemetryStreamParser:
+    """
+    Incremental parser for build_telemetry_command output.
+    
+    Feed it stdout chunks as they arrive; each file's event is returned as
+    soon as its ===FILE_END=== marker is seen. Only the file currently in
+    transit is buffered, so memory stays bounded however large the output.
+    Produces the same events as parse_telemetry_output.
+    """
+    
+    START_MARKER = '===FILE_START===\n'
+    END_MARKER = '===FILE_END==='
+    
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._buffer = ''
+        self._scan_from = 0  # where to resume looking for the end marker
+    
+    def feed(self, data: Union[bytes, str]) -> List[Dict[str, Any]]:
+        """
+        Add a chunk of output.
+        
+        Args:
+            data: Raw bytes (decoded incrementally as UTF-8) or text
+            
+        Returns:
+            Events for every file completed by this chunk, in stream order
+        """
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+        self._buffer += data
+        
+        events = []
+        while True:
+            start = self._buffer.find(self.START_MARKER)
+            if start < 0:
+                # Keep just enough to complete a marker split across chunks
+                self._buffer = self._buffer[-(len(self.START_MARKER) - 1):]
+                self._scan_from = 0
+                break
+            
+            if start > 0:
+                self._buffer = self._buffer[start:]
+                self._scan_from = max(0, self._scan_from - start)
+            
+            name_end = self._buffer.find('\n', len(self.START_MARKER))
+            if name_end < 0:
+                break
+            
+            end = self._buffer.find(self.END_MARKER, max(name_end + 1, self._scan_from))
+            if end < 0:
+                self._scan_from = max(name_end + 1, len(self._buffer) - len(self.END_MARKER) + 1)
+                break
+            
+            filename = self._buffer[len(self.START_MARKER):name_end].strip()
+            event = parse_telemetry_file(filename, self._buffer[name_end + 1:end])
+            if event:
+                events.append(event)
+            
+            self._buffer = self._buffer[end + len(self.END_MARKER):]
+            self._scan_from = 0
+        
+        return events
+    
+    def close(self) -> List[Dict[str, Any]]:
+        """Flush the decoder at end of stream and return any last events."""
+        return self.feed(self._decoder.decode(b'', final=True))
+
+
+def parse_telemetry_archive(fileobj, on_event: Optional[EventCallback] = None) -> List[Dict[str, Any]]:
+    """
+    Parse a gzipped tar stream of telemetry files as it is read.
+    
+    Members are decompressed and parsed one at a time, so only one file's
+    content is held in memory besides the parsed events.
+    
+    Args:
+        fileobj: Binary stream of the archive
+        on_event: Optional callback called with each event as it is parsed
+    
+    Raises:
+        tarfile.TarError, zlib.error, EOFError: If the stream is not a valid archive
+    """
+    telemetry_data = []
+    with tarfile.open(fileobj=fileobj, mode='r|gz') as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            content = archive.extractfile(member).read().decode('utf-8', errors='replace')
+            event = parse_telemetry_file(os.path.basename(member.name), content)
+            if event:
+                telemetry_data.append(event)
+                if on_event:
+                    on_event(event)
+    
+    telemetry_data.sort(key=_sequence_key, reverse=True)
+    return telemetry_data
+
+
+def _sequence_key(event: Dict[str, Any]) -> int:
+    """Sort key for telemetry events (missing sequence numbers sort last)."""
+    return int(event.get('sequenceNumber', 0)) if event.get('sequenceNumber') else 0
+
+
+def build_telemetry_stat_command(path: str, pattern: str) -> str:
+    """Build a command listing telemetry files as 'name|size|mtime' lines."""
+    return f"cd {path} && stat -c '%n|%s|%Y' {pattern} 2>/dev/null"
+
+
+def parse_telemetry_stat_output(stdout: str) -> Dict[str, Tuple[int, int]]:
+    """Parse build_telemetry_stat_command output into {filename: (size, mtime)}."""
+    listing = {}
+    for line in stdout.splitlines():
+        parts = line.strip().rsplit('|', 2)
+        if len(parts) != 3:
+            continue
+        try:
+            listing[parts[0]] = (int(parts[1]), int(parts[2]))
+        except ValueError:
+            continue
+    return listing
+
+
+@dataclass
+class TelemetryDelta:
+    """
+    Result of an incremental telemetry sync.
+    
+    Attributes:
+        added: Events for files that are new or changed since the last sync
+        removed: Filenames that disappeared from the printer
+        events: Full current view, newest sequence number first
+        full_resync: True on the first sync (the view replaces anything shown before)
+    """
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    full_resync: bool = False
+    
+    @property
+    def changed(self) -> bool:
+        """True if the view differs from the previous sync."""
+        return self.full_resync or bool(self.added or self.removed)
+
+
 class SSHService:
     """
     Service for SSH connections and remote command execution.
     
     Handles connection management, command execution, and telemetry fetching.
+    With pooled=True the connection is borrowed from the process-wide SSH
+    pool: connect() reuses the printer's live transport (reconnecting if it
+    dropped) and disconnect() only releases it.
     """
     
     # Default credentials (common for HP printers)
@@ -31,11 +292,18 @@ class SSHService:
     TELEMETRY_PATH = "/mnt/encfs/cdm_eventing/supply/"
     TELEMETRY_PATTERN = "event_*"
     
+    # Max filenames per incremental fetch command (keeps command lines short)
+    SYNC_BATCH_SIZE = 200
+    
+    # Pull telemetry as tar+gzip when the printer supports it
+    COMPRESSED_TRANSFER = True
+    
     def __init__(
         self,
         ip: str,
         username: str = DEFAULT_USERNAME,
-        password: str = DEFAULT_PASSWORD
+        password: str = DEFAULT_PASSWORD,
+        pooled: bool = False
     ):
         """
         Initialize the SSH service.
@@ -44,22 +312,37 @@ class SSHService:
             ip: The IP address of the printer.
             username: SSH username.
             password: SSH password.
+            pooled: If True, share one connection per IP via the SSH pool.
         """
         self.ip = ip
         self.username = username
         self.password = password
+        self.pooled = pooled
         self.client: Optional[paramiko.SSHClient] = None
+        
+        # Incremental telemetry sync state: filename -> ((size, mtime), event)
+        self._telemetry_cache: Optional[Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]] = None
+        
+        # None until the first compressed pull tells us whether tar/gzip work
+        self._archive_supported: Optional[bool] = None
     
     def set_ip(self, ip: str) -> None:
         """Update the target IP address. Disconnects if connected."""
         if ip != self.ip:
             self.disconnect()
+            self.reset_telemetry_cache()
+            self._archive_supported = None
             self.ip = ip
     
     @property
     def is_connected(self) -> bool:
         """Check if SSH connection is active."""
-        return self.client is not None and self.client.get_transport() is not None
+        if self.client is None:
+            return False
+        transport = self.client.get_transport()
+        if self.pooled:
+            return transport is not None and transport.is_active()
+        return transport is not None
     
     def connect(self) -> None:
         """
@@ -72,6 +355,12 @@ class SSHService:
             return
         
         try:
+            if self.pooled:
+                self.client = get_ssh_pool().acquire(
+                    self.ip, self.username, self.password, timeout=self.DEFAULT_TIMEOUT
+                )
+                return
+            
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             self.client.connect(
@@ -88,7 +377,11 @@ class SSHService:
             raise SSHServiceError(f"Failed to connect: {str(e)}")
     
     def disconnect(self) -> None:
-        """Close SSH connection."""
+        """Close SSH connection (pooled: release it, the transport stays open)."""
+        if self.pooled:
+            self.client = None
+            return
+        
         if self.client:
             try:
                 self.client.close()
@@ -110,26 +403,147 @@ class SSHService:
         Raises:
             SSHServiceError: If not connected or command fails
         """
+        if self.pooled and not self.is_connected:
+            # The shared transport may have been dropped since we borrowed it
+            self.connect()
+        
         if not self.is_connected:
             raise SSHServiceError("Not connected to device")
         
+        try:
+            channel = self._open_channel(timeout)
+        except Exception as e:
+            if not self.pooled or self.is_connected:
+                raise SSHServiceError(f"Command execution failed: {str(e)}")
+            
+            # The pooled transport was already dead, so the command was never
+            # sent: reconnect once and open the channel again
+            get_ssh_pool().invalidate(self.ip, self.client)
+            self.client = None
+            self.connect()
+            try:
+                channel = self._open_channel(timeout)
+            except Exception as e:
+                raise SSHServiceError(f"Command execution failed: {str(e)}")
+        
+        # From here on the command may have run on the printer, so it is
+        # never retried
+        try:
+            return self._run(channel, command)
+        except Exception as e:
+            raise SSHServiceError(f"Command execution failed: {str(e)}")
+    
+    def exec_command_stream(
+        self,
+        command: str,
+        timeout: int = 30,
+        chunk_size: int = 32768
+    ) -> Generator[bytes, None, int]:
+        """
+        Execute a command and yield stdout chunks as they arrive.
+        
+        Unlike exec_command, nothing waits for the command to finish and
+        output is never accumulated, so callers can process huge outputs
+        incrementally. The generator's return value (visible through
+        ``yield from`` or StopIteration.value) is the exit code.
+        
+        Args:
+            command: The command to execute
+            timeout: Seconds to wait for each chunk
+            chunk_size: Max bytes per chunk
+            
+        Yields:
+            Raw stdout bytes
+            
+        Raises:
+            SSHServiceError: If not connected or the command fails
+        """
+        stdout, wait = self._open_command(command, timeout)
+        
+        # Read straight from the channel so chunks are yielded as soon as
+        # they arrive instead of when chunk_size bytes have accumulated
+        channel = getattr(stdout, 'channel', None)
+        read = channel.recv if channel is not None else stdout.read
+        
+        try:
+            while True:
+                chunk = read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except Exception as e:
+            raise SSHServiceError(f"Command execution failed: {str(e)}")
+        
+        return wait()
+    
+    def _open_command(self, command: str, timeout: int = 30) -> Tuple[Any, Callable[[], int]]:
+        """
+        Start a command without waiting for it and return its stdout stream.
+        
+        Returns:
+            Tuple of (binary stdout file object, function returning the exit code)
+            
+        Raises:
+            SSHServiceError: If not connected or the command cannot be started
+        """
+        if not self.is_connected:
+            self.connect()
+        
         try:
             stdin, stdout, stderr = self.client.exec_command(command, timeout=timeout)
-            exit_code = stdout.channel.recv_exit_status()
-            stdout_text = stdout.read().decode('utf-8')
-            stderr_text = stderr.read().decode('utf-8')
-            return stdout_text, stderr_text, exit_code
         except Exception as e:
             raise SSHServiceError(f"Command execution failed: {str(e)}")
+        return stdout, stdout.channel.recv_exit_status
+    
+    def _open_channel(self, timeout: int):
+        """Open a session channel for one command (nothing is sent to the printer yet)."""
+        channel = self.client.get_transport().open_session(timeout=timeout)
+        channel.settimeout(timeout)
+        return channel
+    
+    @staticmethod
+    def _abandon_command(stdout, grace: float = ARCHIVE_EXIT_GRACE) -> Optional[int]:
+        """
+        Stop reading a command's output and close its channel.
+        
+        A remote writer blocked on a full window never exits, so the exit
+        code is only waited for up to grace seconds; the channel is closed
+        either way so nothing is left hanging.
+        
+        Returns:
+            The exit code, or None if the command had not exited
+        """
+        channel = stdout.channel
+        deadline = time.monotonic() + grace
+        while not channel.exit_status_ready() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        exit_code = channel.recv_exit_status() if channel.exit_status_ready() else None
+        channel.close()
+        return exit_code
+    
+    @staticmethod
+    def _run(channel, command: str) -> tuple:
+        """Run a command on an open channel and collect its output."""
+        channel.exec_command(command)
+        stdout = channel.makefile('rb')
+        stderr = channel.makefile_stderr('rb')
+        exit_code = channel.recv_exit_status()
+        stdout_text = stdout.read().decode('utf-8')
+        stderr_text = stderr.read().decode('utf-8')
+        return stdout_text, stderr_text, exit_code
     
     # -------------------------------------------------------------------------
     # Telemetry Operations
     # -------------------------------------------------------------------------
     
-    def fetch_telemetry(self) -> List[Dict[str, Any]]:
+    def fetch_telemetry(self, on_event: Optional[EventCallback] = None) -> List[Dict[str, Any]]:
         """
         Fetch and parse telemetry data from the device.
         
+        Args:
+            on_event: Optional callback called with each event as soon as it
+                has been received, before the whole fetch completes
+        
         Returns:
             List of telemetry event dictionaries
             
@@ -139,69 +553,137 @@ class SSHService:
         if not self.is_connected:
             self.connect()
         
-        # Single command to get all file contents with markers
-        bulk_command = (
-            f"cd {self.TELEMETRY_PATH} && "
-            f"for f in {self.TELEMETRY_PATTERN}; do "
-            "echo '===FILE_START==='; "
-            "echo \"$f\"; "
-            "cat \"$f\"; "
-            "echo '===FILE_END==='; "
-            "done"
-        )
+        return self._pull_telemetry(self.TELEMETRY_PATTERN, on_event)
+    
+    def _pull_telemetry(self, pattern: str, on_event: Optional[EventCallback] = None) -> List[Dict[str, Any]]:
+        """
+        Download and parse the telemetry files matching a shell pattern.
         
-        stdout, stderr, exit_code = self.exec_command(bulk_command)
+        Uses the compressed tar transfer when available and falls back to
+        the marker-delimited cat output otherwise. Both paths parse files as
+        they arrive.
+        """
+        # Files already passed to on_event, so a fallback after a broken
+        # archive does not report them twice
+        delivered = set()
         
-        # Handle empty response
-        if not stdout.strip():
-            return []
+        def deliver(event: Dict[str, Any]) -> None:
+            name = event.get('filename', '')
+            if on_event and name not in delivered:
+                delivered.add(name)
+                on_event(event)
         
-        # Parse output into individual files
-        file_blocks = re.split(
-            r'===FILE_START===\n(.*?)\n(.*?)===FILE_END===',
-            stdout,
-            flags=re.DOTALL
-        )
+        if self.COMPRESSED_TRANSFER and self._archive_supported is not False:
+            events = self._pull_telemetry_archive(pattern, deliver)
+            if events is not None:
+                return events
         
+        parser = TelemetryStreamParser()
         telemetry_data = []
-        for i in range(0, len(file_blocks) - 1, 3):
-            if i + 2 >= len(file_blocks):
-                continue
-            
-            filename = file_blocks[i + 1].strip()
-            content = file_blocks[i + 2].strip()
-            
-            if not content:
-                continue
+        for chunk in self.exec_command_stream(build_telemetry_command(self.TELEMETRY_PATH, pattern)):
+            for event in parser.feed(chunk):
+                telemetry_data.append(event)
+                deliver(event)
+        for event in parser.close():
+            telemetry_data.append(event)
+            deliver(event)
+        
+        telemetry_data.sort(key=_sequence_key, reverse=True)
+        return telemetry_data
+    
+    def _pull_telemetry_archive(
+        self,
+        pattern: str,
+        on_event: Optional[EventCallback] = None,
+        timeout: int = 30
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pull telemetry files as a tar.gz stream, unpacking it as it arrives.
+        
+        Returns:
+            Parsed events, or None if the archive could not be read (the
+            caller then uses the marker path). Only a printer without
+            tar/gzip stops later pulls from trying the archive again.
+        """
+        stdout, wait = self._open_command(
+            build_telemetry_archive_command(self.TELEMETRY_PATH, pattern), timeout
+        )
+        
+        try:
+            events = parse_telemetry_archive(stdout, on_event)
+        except (tarfile.TarError, zlib.error, EOFError, OSError):
+            # Also covers socket timeouts, which say nothing about tar support
+            exit_code = self._abandon_command(stdout)
+            if exit_code == ARCHIVE_NO_FILES_EXIT:
+                return []
+            if exit_code == ARCHIVE_NO_TOOLS_EXIT:
+                self._archive_supported = False
+            return None
+        
+        wait()
+        self._archive_supported = True
+        return events
+    
+    def sync_telemetry(self, on_event: Optional[EventCallback] = None) -> TelemetryDelta:
+        """
+        Incrementally sync telemetry with the device.
+        
+        Lists file sizes/mtimes first and only downloads files that are new
+        or changed since the previous call, so refresh cost tracks the
+        number of new events rather than the total number of files.
+        
+        Args:
+            on_event: Optional callback called with each new/changed event as
+                soon as it has been received
+        
+        Returns:
+            TelemetryDelta with the new/changed events, removed filenames and
+            the full merged view
             
-            try:
-                data = json.loads(content)
-                telemetry_data.append({
-                    'filename': filename,
-                    'sequenceNumber': data.get('sequenceNumber', ''),
-                    'color': data.get('eventDetail', {}).get('identityInfo', {}).get('supplyColorCode', ''),
-                    'reasons': data.get('eventDetail', {}).get('stateInfo', {}).get('stateReasons', []),
-                    'trigger': data.get('eventDetail', {}).get('notificationTrigger', 'Unknown'),
-                    'raw_data': data
-                })
-            except json.JSONDecodeError as e:
-                telemetry_data.append({
-                    'filename': filename,
-                    'error': f"Invalid JSON: {str(e)}"
-                })
-            except Exception as e:
-                telemetry_data.append({
-                    'filename': filename,
-                    'error': str(e)
-                })
-        
-        # Sort by sequence number (descending)
-        telemetry_data.sort(
-            key=lambda x: int(x.get('sequenceNumber', 0)) if x.get('sequenceNumber') else 0,
-            reverse=True
+        Raises:
+            SSHServiceError: If not connected or fetch fails
+        """
+        if not self.is_connected:
+            self.connect()
+        
+        full_resync = self._telemetry_cache is None
+        cache = self._telemetry_cache if self._telemetry_cache is not None else {}
+        
+        stdout, stderr, exit_code = self.exec_command(
+            build_telemetry_stat_command(self.TELEMETRY_PATH, self.TELEMETRY_PATTERN)
         )
+        listing = parse_telemetry_stat_output(stdout)
         
-        return telemetry_data
+        removed = [name for name in cache if name not in listing]
+        for name in removed:
+            del cache[name]
+        
+        stale = [name for name, stamp in listing.items()
+                 if name not in cache or cache[name][0] != stamp]
+        
+        added = []
+        for start in range(0, len(stale), self.SYNC_BATCH_SIZE):
+            batch = stale[start:start + self.SYNC_BATCH_SIZE]
+            for event in self._pull_telemetry(' '.join(shlex.quote(n) for n in batch), on_event):
+                name = event.get('filename', '')
+                if name in listing:
+                    cache[name] = (listing[name], event)
+                    added.append(event)
+        
+        self._telemetry_cache = cache
+        events = sorted((event for _, event in cache.values()), key=_sequence_key, reverse=True)
+        added.sort(key=_sequence_key, reverse=True)
+        
+        return TelemetryDelta(added=added, removed=removed, events=events, full_resync=full_resync)
+    
+    @property
+    def telemetry_synced(self) -> bool:
+        """True if the next sync_telemetry is incremental (not a full resync)."""
+        return self._telemetry_cache is not None
+    
+    def reset_telemetry_cache(self) -> None:
+        """Forget synced telemetry so the next sync_telemetry starts from scratch."""
+        self._telemetry_cache = None
     
     def delete_telemetry_file(self, filename: str) -> None:
         """
@@ -273,7 +755,7 @@ class SSHService:
     
     def stop_vnc_server(self) -> None:
         """Stop the VNC server on the remote device."""
-        if self.is_connected:
+        if self.is_connected or self.pooled:
             self.exec_command("pkill remoteControlPanel")
     
     def __enter__(self):
@@ -0,0 +1,390 @@
+"""
+Stream Recorder - Always-on ring buffer of the recent printer UI stream.
+
+Keeps the last few seconds of a stream in memory so that when a test fails
+the screen history leading up to it can be saved. VNC updates are stored
+as zlib-compressed keyframes plus the dirty rectangles between them, Sirius
+frames as the PNG/JPEG bytes they arrived as. Old history is dropped a
+whole keyframe segment at a time once it falls out of the retention window
+or the buffer grows past its memory cap.
+
+export_apng() replays the buffer into an animated PNG, writing one frame at
+a time (each frame is only the region that changed), so exporting holds a
+couple of decoded frames at most, however long the recording.
+No Qt or UI dependencies.
+"""
+import io
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PIL import Image, ImageChops
+
+DEFAULT_RETENTION_SECONDS = 30.0
+DEFAULT_MEMORY_CAP_MB = 64
+KEYFRAME_INTERVAL_SECONDS = 10.0
+
+_COMPRESS_LEVEL = 1         # Fast; UI frames compress well even at level 1
+_ENTRY_OVERHEAD = 128       # Rough per-entry Python object cost in bytes
+
+_settings_lock = threading.Lock()
+_retention_seconds = DEFAULT_RETENTION_SECONDS
+_memory_cap_bytes = DEFAULT_MEMORY_CAP_MB * 1024 * 1024
+
+
+def configure_recording(retention_seconds: Optional[float] = None,
+                        memory_cap_mb: Optional[float] = None) -> None:
+    """
+    Set the defaults for recorders created afterwards.
+
+    Args:
+        retention_seconds: Seconds of history to keep (None leaves it as is)
+        memory_cap_mb: Upper bound for one recorder's buffer (None leaves it as is)
+    """
+    global _retention_seconds, _memory_cap_bytes
+    with _settings_lock:
+        if retention_seconds is not None:
+            _retention_seconds = max(1.0, float(retention_seconds))
+        if memory_cap_mb is not None:
+            _memory_cap_bytes = max(1, int(float(memory_cap_mb) * 1024 * 1024))
+
+
+class _Entry:
+    """One recorded frame: a keyframe or the rects that changed."""
+
+    __slots__ = ("timestamp", "kind", "width", "height", "payload", "nbytes")
+
+    KEY = "key"             # payload: zlib(RGB888 of the whole frame)
+    DELTA = "delta"         # payload: [(x, y, w, h, zlib(RGB888))]
+    ENCODED = "encoded"     # payload: PNG/JPEG bytes of the whole frame
+
+    def __init__(self, timestamp: float, kind: str, width: int, height: int, payload, nbytes: int):
+        self.timestamp = timestamp
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.payload = payload
+        self.nbytes = nbytes + _ENTRY_OVERHEAD
+
+
+class StreamRecorder:
+    """
+    Memory-bounded recording of one stream.
+
+    A segment is a keyframe followed by the deltas recorded after it; the
+    buffer is a deque of segments so the oldest can be dropped without
+    losing the ability to replay the rest. A new keyframe is taken every
+    KEYFRAME_INTERVAL_SECONDS, or sooner once a segment's deltas outweigh
+    its keyframe.
+
+    Thread safety: record_* are called from one capture thread; export and
+    stats can be called from any thread.
+    """
+
+    def __init__(self, retention_seconds: Optional[float] = None,
+                 memory_cap_bytes: Optional[int] = None,
+                 keyframe_interval: float = KEYFRAME_INTERVAL_SECONDS):
+        """
+        Initialize an empty recorder.
+
+        Args:
+            retention_seconds: History to keep (default from configure_recording)
+            memory_cap_bytes: Buffer size limit (default from configure_recording)
+            keyframe_interval: Max seconds between keyframes
+        """
+        with _settings_lock:
+            self.retention_seconds = float(retention_seconds or _retention_seconds)
+            self.memory_cap_bytes = int(memory_cap_bytes or _memory_cap_bytes)
+        self.keyframe_interval = float(keyframe_interval)
+        self.enabled = True
+
+        self._lock = threading.Lock()
+        self._segments: Deque[List[_Entry]] = deque()
+        self._nbytes = 0
+        # Current frame, kept so keyframes can be taken from delta streams
+        self._canvas: Optional[Image.Image] = None
+        self._segment_delta_bytes = 0
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record_update(self, update) -> None:
+        """
+        Record a VNC update.
+
+        Args:
+            update: VNCFrameUpdate (or anything with width, height, timestamp
+                and rects carrying x, y, width, height and RGB888 data)
+        """
+        if not self.enabled:
+            return
+        size = (update.width, update.height)
+
+        canvas = self._canvas
+        if canvas is None or canvas.size != size:
+            if not update.is_full:
+                return  # Cannot place deltas without a base frame
+            canvas = self._canvas = Image.new("RGB", size)
+            self.clear_history()
+
+        for rect in update.rects:
+            patch = Image.frombuffer("RGB", (rect.width, rect.height), rect.data, "raw", "RGB", 0, 1)
+            canvas.paste(patch, (rect.x, rect.y))
+
+        last_key = self._segments[-1][0] if self._segments else None
+        if (update.is_full or last_key is None
+                or update.timestamp - last_key.timestamp >= self.keyframe_interval
+                or self._segment_delta_bytes >= last_key.nbytes):
+            data = zlib.compress(canvas.tobytes(), _COMPRESS_LEVEL)
+            entry = _Entry(update.timestamp, _Entry.KEY, *size, data, len(data))
+        else:
+            rects = [
+                (rect.x, rect.y, rect.width, rect.height, zlib.compress(rect.data, _COMPRESS_LEVEL))
+                for rect in update.rects
+            ]
+            entry = _Entry(update.timestamp, _Entry.DELTA, *size, rects,
+                           sum(len(r[4]) for r in rects))
+        self._append(entry)
+
+    def record_encoded(self, data: bytes, timestamp: Optional[float] = None) -> None:
+        """
+        Record a whole frame that is already PNG/JPEG encoded (Sirius).
+
+        Args:
+            data: Encoded image bytes
+            timestamp: time.monotonic() of the capture (default: now)
+        """
+        if not self.enabled or not data:
+            return
+        entry = _Entry(timestamp or time.monotonic(), _Entry.ENCODED, 0, 0, data, len(data))
+        self._append(entry)
+
+    def _append(self, entry: _Entry) -> None:
+        with self._lock:
+            if entry.kind == _Entry.DELTA and self._segments:
+                self._segments[-1].append(entry)
+                self._segment_delta_bytes += entry.nbytes
+            else:
+                self._segments.append([entry])
+                self._segment_delta_bytes = 0
+            self._nbytes += entry.nbytes
+            self._trim(entry.timestamp)
+
+    def _trim(self, now: float) -> None:
+        """Drop the oldest segments outside the window or over the cap (lock held)."""
+        cutoff = now - self.retention_seconds
+        while len(self._segments) > 1:
+            # The oldest segment is still needed while the next one starts inside the window
+            expired = self._segments[1][0].timestamp <= cutoff
+            if not expired and self._nbytes <= self.memory_cap_bytes:
+                break
+            self._nbytes -= sum(entry.nbytes for entry in self._segments.popleft())
+
+    def clear_history(self) -> None:
+        """Drop everything recorded so far (the current frame is kept)."""
+        with self._lock:
+            self._segments.clear()
+            self._nbytes = 0
+            self._segment_delta_bytes = 0
+
+    def clear(self) -> None:
+        """Drop everything, including the current frame (e.g. on disconnect)."""
+        self.clear_history()
+        self._canvas = None
+
+    def stats(self) -> Dict[str, float]:
+        """Buffer size, frame counts and the span of time covered."""
+        with self._lock:
+            entries = [entry for segment in self._segments for entry in segment]
+            return {
+                "bytes": self._nbytes,
+                "frames": len(entries),
+                "keyframes": len(self._segments),
+                "seconds": entries[-1].timestamp - entries[0].timestamp if entries else 0.0,
+            }
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+
+    def export_apng(self, filepath: str, seconds: Optional[float] = None,
+                    end_time: Optional[float] = None) -> int:
+        """
+        Write the recorded history to an animated PNG.
+
+        Frames play back with their recorded timing; the last frame is
+        held until end_time, so a static screen at the end still shows.
+
+        Args:
+            filepath: Output .png path
+            seconds: How much history to export (default: retention_seconds)
+            end_time: time.monotonic() the recording ends at (default: now)
+
+        Returns:
+            Number of frames written (0 if nothing was recorded; no file is written)
+        """
+        end_time = end_time or time.monotonic()
+        start_time = end_time - (seconds or self.retention_seconds)
+        with self._lock:
+            entries = [entry for segment in self._segments for entry in segment]
+
+        frames = self._replay(entries, start_time)
+        pending = next(frames, None)
+        if pending is None:
+            return 0
+
+        count = 0
+        with open(filepath, "wb") as file:
+            writer = _APNGWriter(file)
+            # One frame of lookahead: a frame's delay is the gap to the next one
+            for following in frames:
+                self._write_frame(writer, pending, following[0])
+                pending = following
+                count += 1
+            self._write_frame(writer, pending, end_time)
+            writer.close()
+        return count + 1
+
+    @staticmethod
+    def _write_frame(writer: "_APNGWriter", frame, next_time: float) -> None:
+        timestamp, image, box = frame
+        writer.add_frame(image, box, max(10, round((next_time - timestamp) * 1000)))
+
+    def _replay(self, entries: List[_Entry], start_time: float
+                ) -> Iterator[Tuple[float, Image.Image, Optional[Tuple[int, int, int, int]]]]:
+        """
+        Rebuild frames from the entries.
+
+        Yields (timestamp, image, box): the first frame is the whole screen
+        as it was at start_time (box None); after that each image holds
+        just the pixels of box that changed. Whole-frame entries are diffed
+        against the previous frame, and ones that changed nothing are skipped.
+        """
+        canvas: Optional[Image.Image] = None
+        emitted = False
+        for index, entry in enumerate(entries):
+            if entry.kind == _Entry.DELTA:
+                if canvas is None:
+                    continue
+                for x, y, w, h, data in entry.payload:
+                    canvas.paste(Image.frombytes("RGB", (w, h), zlib.decompress(data)), (x, y))
+                box = _union(entry.payload)
+            else:
+                try:
+                    if entry.kind == _Entry.KEY:
+                        image = Image.frombytes("RGB", (entry.width, entry.height),
+                                                zlib.decompress(entry.payload))
+                    else:
+                        image = Image.open(io.BytesIO(entry.payload)).convert("RGB")
+                except Exception:
+                    continue
+                if canvas is None or not emitted:
+                    box = (0, 0, *image.size)
+                elif canvas.size != image.size:
+                    return  # An APNG cannot change size; export up to here
+                else:
+                    box = ImageChops.difference(canvas, image).getbbox()
+                canvas = image
+
+            if not emitted:
+                # Fast-forward through history older than the window
+                following = entries[index + 1].timestamp if index + 1 < len(entries) else None
+                if following is not None and following <= start_time:
+                    continue
+                emitted = True
+                yield max(entry.timestamp, start_time), canvas.copy(), None
+            elif box:
+                yield entry.timestamp, canvas.crop(box), box
+
+
+def _union(rects: Iterable[Tuple[int, int, int, int, bytes]]) -> Tuple[int, int, int, int]:
+    """Bounding (left, top, right, bottom) of (x, y, w, h, data) rects."""
+    rects = list(rects)
+    return (min(r[0] for r in rects), min(r[1] for r in rects),
+            max(r[0] + r[2] for r in rects), max(r[1] + r[3] for r in rects))
+
+
+class _APNGWriter:
+    """
+    Streams frames into an APNG file.
+
+    Each frame is encoded on its own by PIL, and its IDAT chunks are copied
+    out (as fdAT for all but the first frame) with an fcTL placing it at
+    its offset, so only the changed region of every frame is stored.
+    """
+
+    _SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+    def __init__(self, file):
+        self._file = file
+        self._sequence = 0
+        self._frames = 0
+        self._actl_offset = 0
+
+    def add_frame(self, image: Image.Image, box: Optional[Tuple[int, int, int, int]], delay_ms: int) -> None:
+        """
+        Append a frame.
+
+        Args:
+            image: Pixels of the frame (only the box region after the first)
+            box: (left, top, right, bottom) the pixels go to; None for the whole frame
+            delay_ms: How long the frame is shown
+        """
+        left, top = box[:2] if box else (0, 0)
+        chunks = self._encode(image)
+        first = self._frames == 0
+
+        if first:
+            self._file.write(self._SIGNATURE)
+            self._write_chunk(b"IHDR", chunks[b"IHDR"][0])
+            # Frame count is patched in by close()
+            self._actl_offset = self._file.tell()
+            self._write_chunk(b"acTL", struct.pack("!II", 0, 0))
+
+        # fcTL: sequence, size, offset, delay (ms/1000), dispose none, blend source
+        self._write_chunk(b"fcTL", struct.pack(
+            "!IIIIIHHBB", self._next_sequence(), image.width, image.height,
+            left, top, min(delay_ms, 65535), 1000, 0, 0))
+
+        # The first frame is also the default image; later frames go in fdAT
+        for data in chunks[b"IDAT"]:
+            if first:
+                self._write_chunk(b"IDAT", data)
+            else:
+                self._write_chunk(b"fdAT", struct.pack("!I", self._next_sequence()) + data)
+        self._frames += 1
+
+    def close(self) -> None:
+        """Finish the file (the caller closes it)."""
+        self._write_chunk(b"IEND", b"")
+        end = self._file.tell()
+        self._file.seek(self._actl_offset)
+        self._write_chunk(b"acTL", struct.pack("!II", self._frames, 0))
+        self._file.seek(end)
+
+    def _next_sequence(self) -> int:
+        sequence = self._sequence
+        self._sequence += 1
+        return sequence
+
+    def _write_chunk(self, kind: bytes, data: bytes) -> None:
+        self._file.write(struct.pack("!I", len(data)) + kind + data
+                         + struct.pack("!I", zlib.crc32(kind + data)))
+
+    @staticmethod
+    def _encode(image: Image.Image) -> Dict[bytes, List[bytes]]:
+        """PNG-encode an image with PIL and return its chunks by type."""
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", compress_level=6)
+        data = buffer.getvalue()
+        chunks: Dict[bytes, List[bytes]] = {}
+        offset = 8
+        while offset < len(data):
+            length, kind = struct.unpack("!I4s", data[offset:offset + 8])
+            chunks.setdefault(kind, []).append(data[offset + 8:offset + 8 + length])
+            offset += 12 + length
+        return chunks
@@ -0,0 +1,204 @@
+"""
+VNC Input Queue - Non-blocking, coalescing pointer input for VNCService.
+
+Pointer calls from the UI only append to a queue and return. A sender
+thread drains it and hands each batch to the Twisted reactor in a single
+call, where the RFB PointerEvents are written back to back - RFB does not
+acknowledge input, so nothing waits on the round trip.
+
+While events wait to be sent, consecutive moves collapse into the latest
+position and consecutive scroll clicks of the same kind add up, so a fast
+drag costs one event per batch instead of one per mouse move. Presses,
+releases and pauses are never merged or reordered.
+No Qt or UI dependencies.
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from twisted.internet import reactor
+    TWISTED_AVAILABLE = True
+except ImportError:
+    TWISTED_AVAILABLE = False
+
+# Event kinds: (kind, *args)
+MOVE = "move"           # (MOVE, x, y)
+DOWN = "down"           # (DOWN, button)
+UP = "up"               # (UP, button)
+SCROLL = "scroll"       # (SCROLL, button, steps) - press/release pairs at the current position
+PAUSE = "pause"         # (PAUSE, seconds) - hold before sending what follows
+
+
+class VNCInputQueue:
+    """
+    Ordered pointer event queue with its own sender thread.
+
+    Counters:
+        queued: Events put on the queue
+        coalesced: Events folded into an earlier pending one
+        sent: RFB PointerEvents written
+
+    Thread safety: put()/move()/... may be called from any thread.
+    """
+
+    def __init__(self, protocol):
+        """
+        Start the sender thread for a connected vncdotool protocol.
+
+        Args:
+            protocol: The live VNCDoToolClient (client.protocol)
+        """
+        self._protocol = protocol
+        self._cond = threading.Condition()
+        self._pending: List[Tuple] = []
+        self._position: Optional[Tuple[int, int]] = None  # Where the last queued move goes
+        self._running = True
+        self.queued = 0
+        self.coalesced = 0
+        self.sent = 0
+
+        self._thread = threading.Thread(target=self._send_loop, name="VNCInput", daemon=True)
+        self._thread.start()
+
+    # -------------------------------------------------------------------------
+    # Producers
+    # -------------------------------------------------------------------------
+
+    def move(self, x: int, y: int) -> None:
+        """Move the pointer (replaces a move still waiting to be sent, dropped if already there)."""
+        self.put((MOVE, int(x), int(y)))
+
+    def press(self, button: int) -> None:
+        """Press a button at the current position."""
+        self.put((DOWN, button))
+
+    def release(self, button: int) -> None:
+        """Release a button at the current position."""
+        self.put((UP, button))
+
+    def scroll(self, button: int, steps: int) -> None:
+        """Click a wheel button steps times (adds to a pending scroll the same way)."""
+        if steps > 0:
+            self.put((SCROLL, button, int(steps)))
+
+    def pause(self, seconds: float) -> None:
+        """Delay the events queued after this one (e.g. touch hold before a drag)."""
+        self.put((PAUSE, float(seconds)))
+
+    def put(self, event: Tuple) -> None:
+        """Queue an event, folding it into the last pending one where that is safe."""
+        with self._cond:
+            if not self._running:
+                return
+            self.queued += 1
+            last = self._pending[-1] if self._pending else None
+            if event[0] == MOVE and event[1:] == self._position:
+                # Already there (e.g. one move per wheel event); keeps scrolls adjacent
+                self.coalesced += 1
+                return
+            if event[0] == MOVE:
+                self._position = event[1:]
+            if last and last[0] == MOVE and event[0] == MOVE:
+                self._pending[-1] = event
+                self.coalesced += 1
+            elif last and last[0] == SCROLL and event[0] == SCROLL and last[1] == event[1]:
+                self._pending[-1] = (SCROLL, event[1], last[2] + event[2])
+                self.coalesced += 1
+            else:
+                self._pending.append(event)
+            self._cond.notify()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until everything queued so far has been handed to the reactor."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending and self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._pending
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the sender thread.
+
+        Args:
+            flush: Send what is still queued first (so no button stays pressed)
+        """
+        if flush:
+            self.flush()
+        with self._cond:
+            self._running = False
+            self._pending.clear()
+            self._cond.notify_all()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the counters."""
+        with self._cond:
+            return {"queued": self.queued, "coalesced": self.coalesced, "sent": self.sent}
+
+    # -------------------------------------------------------------------------
+    # Sender
+    # -------------------------------------------------------------------------
+
+    def _send_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                batch = self._take_batch()
+
+            if batch and batch[0][0] == PAUSE:
+                time.sleep(batch[0][1])
+            elif batch:
+                reactor.callFromThread(self._write, batch)
+
+            with self._cond:
+                # Wake flush() once the queue is drained
+                self._cond.notify_all()
+
+    def _take_batch(self) -> List[Tuple]:
+        """Pop a lone pause, or everything up to the next pause (lock held)."""
+        if self._pending[0][0] == PAUSE:
+            return [self._pending.pop(0)]
+        end = next((i for i, event in enumerate(self._pending) if event[0] == PAUSE), len(self._pending))
+        batch, self._pending = self._pending[:end], self._pending[end:]
+        return batch
+
+    def _write(self, batch: List[Tuple]) -> None:
+        """Write a batch as PointerEvents (reactor thread)."""
+        protocol = self._protocol
+        count = 0
+        for event in batch:
+            kind = event[0]
+            try:
+                if kind == MOVE:
+                    protocol.mouseMove(event[1], event[2])
+                    count += 1
+                elif kind == DOWN:
+                    protocol.mouseDown(event[1])
+                    count += 1
+                elif kind == UP:
+                    protocol.mouseUp(event[1])
+                    count += 1
+                elif kind == SCROLL:
+                    for _ in range(event[2]):
+                        protocol.mouseDown(event[1])
+                        protocol.mouseUp(event[1])
+                        count += 2
+            except Exception:
+                # A bad event (or a dropped connection, which disconnect()
+                # cleans up) must not take the rest of the batch with it
+                continue
+        with self._cond:
+            self.sent += count
@@ -6,16 +6,22 @@ No Qt or UI dependencies - pure VNC operations.
 """
 import os
 import io
-import tempfile
 import threading
 import time
-import hashlib
-from typing import Optional, Tuple, Callable
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from PIL import Image
 
+from src.services.frame_change import TileChangeDetector
+from src.services.frame_rate import AdaptiveRateController
+from src.services.frame_mailbox import FrameMailbox
+from src.services.stream_recorder import StreamRecorder
+from src.services.vnc_input import VNCInputQueue
+
 # VNC library imported at runtime
 try:
     from vncdotool import api as vnc_api
+    from twisted.internet import reactor
     VNC_AVAILABLE = True
 except ImportError:
     VNC_AVAILABLE = False
@@ -26,21 +32,161 @@ class VNCServiceError(Exception):
     pass
 
 
+@dataclass
+class VNCFrame:
+    """
+    One framebuffer snapshot as raw pixels.
+    
+    Attributes:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        data: Packed RGB888 pixels, row-major (width * 3 bytes per row)
+        timestamp: time.monotonic() when the frame was captured
+    """
+    width: int
+    height: int
+    data: bytes
+    timestamp: float = field(default_factory=time.monotonic)
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(width, height) of the frame."""
+        return (self.width, self.height)
+    
+    @property
+    def bytes_per_line(self) -> int:
+        """Row stride of data in bytes."""
+        return self.width * 3
+    
+    def to_image(self) -> Image.Image:
+        """Build a PIL image from the frame (for saving screenshots)."""
+        return Image.frombytes("RGB", self.size, self.data)
+
+
+@dataclass
+class VNCRect:
+    """
+    One changed region of the framebuffer.
+    
+    Attributes:
+        x, y: Top-left corner in framebuffer coordinates
+        width, height: Region size in pixels
+        data: Packed RGB888 pixels of just this region
+    """
+    x: int
+    y: int
+    width: int
+    height: int
+    data: bytes
+    
+    @property
+    def bytes_per_line(self) -> int:
+        """Row stride of data in bytes."""
+        return self.width * 3
+
+
+@dataclass
+class VNCFrameUpdate:
+    """
+    The regions that changed since the previous update.
+    
+    The first update after streaming starts (and after a resize) is a
+    single rect covering the whole screen.
+    
+    Attributes:
+        width: Framebuffer width in pixels
+        height: Framebuffer height in pixels
+        rects: Changed regions with their new pixels
+        tiles: (column, row) of every tile whose pixels changed
+        timestamp: time.monotonic() when the update was applied
+    """
+    width: int
+    height: int
+    rects: List[VNCRect]
+    tiles: List[Tuple[int, int]] = field(default_factory=list)
+    timestamp: float = field(default_factory=time.monotonic)
+    
+    @property
+    def is_full(self) -> bool:
+        """True if the update replaces the whole frame."""
+        return (len(self.rects) == 1 and self.rects[0].x == 0 and self.rects[0].y == 0
+                and self.rects[0].width == self.width and self.rects[0].height == self.height)
+
+
+class _DamageTracker:
+    """
+    Collects the rectangles of each RFB framebuffer update.
+    
+    Wraps the vncdotool protocol's commitUpdate (which runs on the Twisted
+    reactor thread and receives the update's rectangle list) and lets the
+    capture thread request updates without going through the blocking
+    client proxy, whose single result queue is shared with mouse calls.
+    """
+    
+    def __init__(self, protocol):
+        self._protocol = protocol
+        self._lock = threading.Lock()
+        self._rects: List[Tuple[int, int, int, int]] = []
+        self._committed = threading.Event()
+        self._pending = False
+        
+        commit_update = protocol.commitUpdate
+        
+        def _commit_update(rectangles=None):
+            commit_update(rectangles)
+            with self._lock:
+                self._rects.extend(rectangles or [])
+            self._committed.set()
+        
+        protocol.commitUpdate = _commit_update
+    
+    def request(self, incremental: bool) -> None:
+        """Ask the server for an update unless one is already outstanding."""
+        if self._pending:
+            return
+        self._pending = True
+        self._committed.clear()
+        reactor.callFromThread(self._protocol.framebufferUpdateRequest, incremental=incremental)
+    
+    def wait(self, timeout: float) -> bool:
+        """Wait for the outstanding update to be applied to the framebuffer."""
+        if not self._committed.wait(timeout):
+            return False
+        self._pending = False
+        return True
+    
+    def take(self) -> List[Tuple[int, int, int, int]]:
+        """Return and clear the rectangles applied since the last call."""
+        with self._lock:
+            rects, self._rects = self._rects, []
+        return rects
+
+
 class VNCService:
     """
     Service for VNC connections and printer UI interaction.
     
     Handles screen capture, mouse interaction, and continuous streaming.
+    Frames are read straight from vncdotool's in-memory framebuffer as raw
+    RGB (VNCFrame) - no temp files, no PNG round trip. While streaming, only
+    the rectangles the server reports as changed are published
+    (VNCFrameUpdate) into self.mailbox, which the UI drains at its own pace,
+    and into self.recorder, which keeps the last few seconds for export.
+    Mouse calls only queue events (self.input) and return immediately.
     Requires vncdotool library and SSH service for VNC server management.
     """
     
     # VNC settings
     VNC_PORT = 5900
-    DEFAULT_FPS = 30
+    DEFAULT_FPS = 30                # Rate while the screen changes or the user interacts
+    IDLE_FPS = 2                    # Rate a static screen decays to
+    UPDATE_WAIT_SECONDS = 0.5       # Max wait for an update before re-checking stop
+    FULL_UPDATE_RATIO = 0.5         # Dirty area share above which a full frame is sent
     
     # Mouse/Display settings
     COORDINATE_SCALE_FACTOR = 0.8
     DRAG_THRESHOLD_PIXELS = 5
+    DRAG_HOLD_SECONDS = 0.1         # Touch hold before a drag starts moving
     SMALL_SCREEN_WIDTH_THRESHOLD = 400
     
     # Scroll button mappings (VNC protocol)
@@ -68,14 +214,18 @@ class VNCService:
         
         # Streaming state
         self.viewing = False
-        self.frame_buffer: Optional[bytes] = None
         self.frame_lock = threading.Lock()
         self.capture_thread: Optional[threading.Thread] = None
-        self.last_frame_hash: Optional[str] = None
-        self.update_fps = self.DEFAULT_FPS
+        self.rate = AdaptiveRateController(self.DEFAULT_FPS, self.IDLE_FPS)
+        self._damage: Optional[_DamageTracker] = None
+        self.input: Optional[VNCInputQueue] = None
+        self.change_detector = TileChangeDetector()
         
-        # Callbacks
-        self.on_frame_update: Optional[Callable[[Image.Image, bytes], None]] = None
+        # Latest update for the UI; unconsumed updates are merged, not queued
+        self.mailbox: FrameMailbox[VNCFrameUpdate] = FrameMailbox(merge=self._merge_updates)
+        
+        # Recent history (keyframes + dirty rects) for export_recording()
+        self.recorder = StreamRecorder()
     
     def set_ip(self, ip: str) -> None:
         """Update the target IP address. Disconnects if connected."""
@@ -105,6 +255,9 @@ class VNCService:
             self.client = vnc_api.connect(self.ip, self.VNC_PORT)
             self._connected = True
             self._get_screen_resolution()
+            # The first capture waited for the handshake, so the protocol exists
+            self._damage = _DamageTracker(self.client.protocol)
+            self.input = VNCInputQueue(self.client.protocol)
         except Exception as e:
             self._connected = False
             self.client = None
@@ -115,8 +268,14 @@ class VNCService:
         if self.viewing:
             self.stop_viewing()
         
+        if self.input:
+            # Send what is queued first so no button is left pressed
+            self.input.stop()
+            self.input = None
+        
         self._connected = False
         self.screen_resolution = None
+        self._damage = None
         
         if self.client:
             try:
@@ -126,68 +285,59 @@ class VNCService:
             self.client = None
     
     def _get_screen_resolution(self) -> Optional[Tuple[int, int]]:
-        """Get VNC screen resolution by capturing a frame."""
+        """Get VNC screen resolution from the in-memory framebuffer."""
         if not self.is_connected:
             return None
         
-        temp_path = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            self.client.captureScreen(temp_path)
-            
-            with Image.open(temp_path) as img:
-                self.screen_resolution = img.size
-            
-            return self.screen_resolution
-            
-        except Exception:
-            self.screen_resolution = (800, 480)  # Fallback
-            return self.screen_resolution
-        finally:
-            if temp_path:
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
+        frame = self.capture_frame()
+        self.screen_resolution = frame.size if frame else (800, 480)  # Fallback
+        return self.screen_resolution
     
     # -------------------------------------------------------------------------
     # Screen Capture
     # -------------------------------------------------------------------------
     
-    def capture_screen(self) -> Optional[bytes]:
+    def capture_frame(self) -> Optional[VNCFrame]:
         """
-        Capture current screen as PNG bytes.
+        Refresh the framebuffer and return it as raw RGB pixels.
         
         Returns:
-            PNG image bytes, or None if failed
+            VNCFrame, or None if failed
         """
         if not self.is_connected:
             return None
         
-        temp_path = None
         try:
-            temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            self.client.captureScreen(temp_path)
-            
-            with open(temp_path, 'rb') as f:
-                data = f.read()
-            
-            return data
-            
+            # Blocks until the server's framebuffer update has been applied
+            self.client.refreshScreen()
+            return self._snapshot()
         except Exception:
             return None
-        finally:
-            if temp_path:
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
+    
+    def _snapshot(self) -> Optional[VNCFrame]:
+        """Copy the in-memory framebuffer as it is, without asking the server."""
+        # Non-callable attributes are read off the live protocol
+        screen = self.client.screen
+        if screen is None:
+            return None
+        if screen.mode != 'RGB':
+            screen = screen.convert('RGB')
+        return VNCFrame(screen.width, screen.height, screen.tobytes())
+    
+    def capture_screen(self) -> Optional[bytes]:
+        """
+        Capture current screen as PNG bytes (encoded in memory).
+        
+        Returns:
+            PNG image bytes, or None if failed
+        """
+        image = self.capture_screen_image()
+        if image is None:
+            return None
+        
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        return buffer.getvalue()
     
     def capture_screen_image(self) -> Optional[Image.Image]:
         """
@@ -196,13 +346,8 @@ class VNCService:
         Returns:
             PIL Image, or None if failed
         """
-        data = self.capture_screen()
-        if data:
-            try:
-                return Image.open(io.BytesIO(data))
-            except Exception:
-                pass
-        return None
+        frame = self.capture_frame()
+        return frame.to_image() if frame else None
     
     def save_screen(self, filepath: str) -> bool:
         """
@@ -214,35 +359,46 @@ class VNCService:
         Returns:
             True if successful
         """
-        if not self.is_connected:
+        image = self.capture_screen_image()
+        if image is None:
             return False
         
         try:
-            self.client.captureScreen(filepath)
+            image.save(filepath)
             return os.path.exists(filepath)
         except Exception:
             return False
     
+    def export_recording(self, filepath: str, seconds: Optional[float] = None) -> int:
+        """
+        Save the recently streamed screen history as an animated PNG.
+        
+        Args:
+            filepath: Path to save the recording (.png)
+            seconds: How much history to save (default: the recorder's retention)
+            
+        Returns:
+            Number of frames written (0 if nothing has been streamed yet)
+        """
+        return self.recorder.export_apng(filepath, seconds)
+    
     # -------------------------------------------------------------------------
     # Continuous Streaming
     # -------------------------------------------------------------------------
     
-    def start_viewing(self, on_frame: Optional[Callable[[Image.Image, bytes], None]] = None) -> bool:
+    def start_viewing(self) -> bool:
         """
-        Start continuous screen capture.
+        Start continuous screen capture into self.mailbox.
         
-        Args:
-            on_frame: Optional callback called with (image, bytes) on each new frame
-            
         Returns:
             True if streaming started successfully
         """
         if not self.is_connected or self.viewing:
             return False
         
-        # Only overwrite callback if a new one is provided
-        if on_frame is not None:
-            self.on_frame_update = on_frame
+        self.mailbox.clear()
+        self.mailbox.reset_counters()
+        self.change_detector.reset_counters()
         self.viewing = True
         
         if self.capture_thread and self.capture_thread.is_alive():
@@ -259,57 +415,127 @@ class VNCService:
                 return
             
             self.viewing = False
-            
-            if self.capture_thread and self.capture_thread.is_alive():
-                self.capture_thread.join(timeout=2.0)
+        
+        self.rate.wake()
+        if self.capture_thread and self.capture_thread.is_alive():
+            self.capture_thread.join(timeout=2.0)
     
     def _capture_loop(self) -> None:
-        """Background thread for continuous capture."""
-        while self.viewing and self.is_connected:
+        """
+        Background thread for continuous capture.
+        
+        Starts with a full update, then keeps one incremental update request
+        outstanding: the server answers it only when something changed, with
+        just the changed rectangles. The pause between requests comes from
+        self.rate (fast while changing or interacting, slow when static,
+        stopped while paused).
+        """
+        incremental = False
+        while self.viewing and self.is_connected and self._damage:
             try:
                 start_time = time.time()
                 
-                image_data = self.capture_screen()
-                if image_data:
-                    # Check if frame changed
-                    frame_hash = hashlib.md5(image_data[:1024]).hexdigest()
+                if self.rate.paused:
+                    self.rate.sleep()
+                    continue
+                
+                self._damage.request(incremental)
+                update = None
+                if self._damage.wait(self.UPDATE_WAIT_SECONDS):
+                    update = self._collect_update(full=not incremental)
+                    incremental = True
                     
-                    if frame_hash != self.last_frame_hash:
-                        self.last_frame_hash = frame_hash
-                        
-                        with self.frame_lock:
-                            self.frame_buffer = image_data
-                        
-                        # Call callback if provided
-                        if self.on_frame_update:
-                            try:
-                                image = Image.open(io.BytesIO(image_data))
-                                self.on_frame_update(image, image_data)
-                            except Exception:
-                                pass
+                    if update:
+                        self.recorder.record_update(update)
+                        # Never waits for the UI
+                        self.mailbox.publish(update)
+                self.rate.note_frame(update is not None)
                 
                 # Control capture rate
-                elapsed = time.time() - start_time
-                sleep_time = max(0, (1.0 / self.update_fps) - elapsed)
-                time.sleep(sleep_time)
+                self.rate.sleep(time.time() - start_time)
                 
             except Exception:
-                time.sleep(0.1)
+                self.rate.note_error()
+                self.rate.sleep()
+    
+    def _collect_update(self, full: bool = False) -> Optional[VNCFrameUpdate]:
+        """
+        Build an update from the rectangles applied since the last one.
+        
+        Args:
+            full: Send the whole screen regardless of what changed
+            
+        Returns:
+            VNCFrameUpdate, or None if no pixels actually changed
+        """
+        screen = self.client.screen
+        if screen is None:
+            return None
+        if screen.mode != 'RGB':
+            screen = screen.convert('RGB')
+        width, height = screen.size
+        
+        if full:
+            self._damage.take()
+            self.change_detector.reset()
+            boxes = [(0, 0, width, height)]
+        else:
+            boxes = [(x, y, x + w, y + h) for x, y, w, h in dict.fromkeys(self._damage.take())]
+            if not boxes:
+                return None
+        
+        # Servers often resend regions that did not change; keep only tiles
+        # whose pixels differ from what was last delivered
+        tiles = self.change_detector.diff(screen, boxes)
+        if not tiles:
+            return None
+        boxes = self.change_detector.tiles_to_boxes(tiles)
+        
+        # Once most of the screen changed, one full rect is cheaper than many
+        area = sum((r - l) * (b - t) for l, t, r, b in boxes)
+        if full or area >= self.FULL_UPDATE_RATIO * width * height:
+            boxes = [(0, 0, width, height)]
+        
+        rects = [
+            VNCRect(l, t, r - l, b - t, screen.crop((l, t, r, b)).tobytes())
+            for l, t, r, b in boxes
+        ]
+        return VNCFrameUpdate(width, height, rects, tiles)
+    
+    def _merge_updates(self, pending: VNCFrameUpdate, update: VNCFrameUpdate) -> VNCFrameUpdate:
+        """
+        Fold a new update into one the UI has not taken yet.
+        
+        Rects are kept in order (later ones paint over earlier ones). Once
+        they add up to most of the screen they are replaced by one full
+        rect of the current framebuffer, so the slot stays bounded however
+        long the UI falls behind.
+        """
+        if update.is_full or (pending.width, pending.height) != (update.width, update.height):
+            return update
+        
+        rects = pending.rects + update.rects
+        tiles = list(dict.fromkeys(pending.tiles + update.tiles))
+        area = sum(rect.width * rect.height for rect in rects)
+        if area >= self.FULL_UPDATE_RATIO * update.width * update.height:
+            frame = self._snapshot()
+            if frame and frame.size == (update.width, update.height):
+                rects = [VNCRect(0, 0, frame.width, frame.height, frame.data)]
+        return VNCFrameUpdate(update.width, update.height, rects, tiles)
     
     def get_current_frame(self) -> Optional[Image.Image]:
-        """Get the current buffered frame as PIL Image."""
-        with self.frame_lock:
-            if self.frame_buffer:
-                try:
-                    return Image.open(io.BytesIO(self.frame_buffer))
-                except Exception:
-                    pass
-        return None
+        """Get the current framebuffer contents as PIL Image."""
+        if not self.is_connected:
+            return None
+        frame = self._snapshot()
+        return frame.to_image() if frame else None
     
     def get_current_frame_bytes(self) -> Optional[bytes]:
-        """Get the current buffered frame as raw bytes."""
-        with self.frame_lock:
-            return self.frame_buffer.copy() if self.frame_buffer else None
+        """Get the current framebuffer contents as raw RGB888 bytes."""
+        if not self.is_connected:
+            return None
+        frame = self._snapshot()
+        return frame.data if frame else None
     
     # -------------------------------------------------------------------------
     # Mouse Interaction
@@ -325,73 +551,60 @@ class VNCService:
             button: Mouse button (1=left, 2=middle, 3=right)
             
         Returns:
-            True if successful
+            True if the click was queued
         """
-        if not self.is_connected:
-            return False
-        
-        try:
-            self.client.mouseMove(x, y)
-            self.client.mousePress(button)
-            return True
-        except Exception:
+        if not self._can_send():
             return False
+        self.input.move(x, y)
+        self.input.press(button)
+        self.input.release(button)
+        return True
     
     def drag(self, start_x: int, start_y: int, end_x: int, end_y: int) -> bool:
         """
         Drag from one point to another.
         
+        The hold after pressing is applied by the sender thread, so this
+        returns without waiting for it.
+        
         Args:
             start_x, start_y: Starting coordinates
             end_x, end_y: Ending coordinates
             
         Returns:
-            True if successful
+            True if the drag was queued
         """
-        if not self.is_connected:
-            return False
-        
-        try:
-            self.client.mouseMove(start_x, start_y)
-            self.client.mouseDown(1)
-            time.sleep(0.1)
-            self.client.mouseMove(end_x, end_y)
-            self.client.mouseUp(1)
-            return True
-        except Exception:
+        if not self._can_send():
             return False
+        self.input.move(start_x, start_y)
+        self.input.press(1)
+        self.input.pause(self.DRAG_HOLD_SECONDS)
+        self.input.move(end_x, end_y)
+        self.input.release(1)
+        return True
     
     def mouse_down(self, x: int, y: int) -> bool:
         """Press mouse button at coordinates."""
-        if not self.is_connected:
-            return False
-        try:
-            self.client.mouseMove(x, y)
-            self.client.mouseDown(1)
-            return True
-        except Exception:
+        if not self._can_send():
             return False
+        self.input.move(x, y)
+        self.input.press(1)
+        return True
     
     def mouse_move(self, x: int, y: int) -> bool:
-        """Move mouse to coordinates."""
-        if not self.is_connected:
-            return False
-        try:
-            self.client.mouseMove(x, y)
-            return True
-        except Exception:
+        """Move mouse to coordinates (coalesced with moves not yet sent)."""
+        if not self._can_send():
             return False
+        self.input.move(x, y)
+        return True
     
     def mouse_up(self, x: int, y: int) -> bool:
         """Release mouse button at coordinates."""
-        if not self.is_connected:
-            return False
-        try:
-            self.client.mouseMove(x, y)
-            self.client.mouseUp(1)
-            return True
-        except Exception:
+        if not self._can_send():
             return False
+        self.input.move(x, y)
+        self.input.release(1)
+        return True
     
     def scroll(self, delta: int, x: Optional[int] = None, y: Optional[int] = None, axis: str = "vertical") -> bool:
         """
@@ -403,9 +616,9 @@ class VNCService:
             axis: "vertical" or "horizontal"
             
         Returns:
-            True if successful
+            True if the scroll was queued
         """
-        if not self.is_connected or delta is None:
+        if delta is None or not self._can_send():
             return False
         
         steps = self._normalize_scroll_steps(delta)
@@ -424,17 +637,20 @@ class VNCService:
         if not button:
             return False
         
-        try:
-            if x is not None and y is not None:
-                self.client.mouseMove(x, y)
-            
-            for _ in range(steps):
-                self.client.mouseDown(button)
-                self.client.mouseUp(button)
-            
-            return True
-        except Exception:
+        if x is not None and y is not None:
+            self.input.move(x, y)
+        # SCROLL_BUTTONS holds RFB button-mask bits; vncdotool takes button
+        # numbers (mask 8 -> button 4). Wheel events in the same direction
+        # add up while queued.
+        self.input.scroll(button.bit_length(), steps)
+        return True
+    
+    def _can_send(self) -> bool:
+        """Check the input queue is up and note the interaction for frame pacing."""
+        if not self.is_connected or self.input is None:
             return False
+        self.rate.note_interaction()
+        return True
     
     @staticmethod
     def _normalize_scroll_steps(delta: float) -> int:
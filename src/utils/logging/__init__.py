@@ -4,6 +4,8 @@ from .app_logger import (
     get_log_signaler,
     get_recent_logs,
     clear_recent_logs,
+    set_log_capacity,
+    get_log_capacity,
     log_debug,
     log_error,
     log_info,
@@ -15,6 +17,8 @@ __all__ = [
     "get_log_signaler",
     "get_recent_logs",
     "clear_recent_logs",
+    "set_log_capacity",
+    "get_log_capacity",
     "log_debug",
     "log_error",
     "log_info",
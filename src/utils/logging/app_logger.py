@@ -1,3 +1,5 @@
+import itertools
+import json
 import logging
 from logging.handlers import RotatingFileHandler
 from collections import deque
@@ -6,7 +8,12 @@ from datetime import datetime
 from pathlib import Path
 from threading import Lock
 from typing import Deque, Dict, List, Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QCoreApplication, QObject, Qt, QTimer, Signal
+
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BATCH = 500         # Entries delivered per logs_added signal at most
+DEFAULT_MAX_DELAY_MS = 100      # How long an entry may wait for its batch
+
 
 @dataclass
 class LogEntry:
@@ -16,11 +23,92 @@ class LogEntry:
     status: str
     message: str
     details: Optional[Dict]
+    seq: int = 0            # Increases by one per entry logged
+    search_text: str = ""   # Lowercase message, action, status and details, for filtering
+
+
+def _search_text(message: str, action: str, status: str, details: Optional[Dict]) -> str:
+    """The lowercase text a log search matches against (built once per entry)."""
+    return " ".join(
+        [
+            message.lower(),
+            action.lower(),
+            status.lower(),
+            json.dumps(details, default=str).lower() if details else "",
+        ]
+    )
 
 
 class LogSignaler(QObject):
-    """Bridge class to emit Qt signals from Python logging thread."""
-    log_added = Signal(LogEntry)
+    """
+    Bridge class to emit Qt signals from Python logging thread.
+
+    Entries logged from any thread are appended to a deque (no lock) and
+    delivered on the GUI thread as logs_added(list), oldest first: at most
+    max_batch entries per signal, at most max_delay_ms after the first one
+    was queued, and immediately once a full batch is waiting. Only the
+    first entry of a batch (or one completing a batch) posts a queued
+    wake-up to the GUI thread, so a hot logging loop costs one Qt event
+    per batch instead of one per line. Entries posted by different
+    threads may be queued slightly out of order; each batch is sorted by
+    seq before delivery. capacity_changed(int) follows set_log_capacity().
+    """
+    logs_added = Signal(list)
+    capacity_changed = Signal(int)
+    _wakeup = Signal()
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, max_delay_ms: int = DEFAULT_MAX_DELAY_MS):
+        super().__init__()
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay_ms = max(0, int(max_delay_ms))
+        self._pending: Deque[LogEntry] = deque()
+        self._scheduled = False
+        self._timer: Optional[QTimer] = None
+        # Always queued, so logging never runs the slots from inside the caller
+        self._wakeup.connect(self._on_wakeup, Qt.ConnectionType.QueuedConnection)
+
+    def configure(self, max_batch: Optional[int] = None, max_delay_ms: Optional[int] = None) -> None:
+        """Update the batch size and delay limits."""
+        if max_batch is not None:
+            self.max_batch = max(1, int(max_batch))
+        if max_delay_ms is not None:
+            self.max_delay_ms = max(0, int(max_delay_ms))
+
+    def post(self, entry: LogEntry) -> None:
+        """Queue an entry for delivery (any thread)."""
+        self._pending.append(entry)
+        if not self._scheduled or len(self._pending) == self.max_batch:
+            self._scheduled = True
+            self._wakeup.emit()
+
+    def flush(self) -> None:
+        """Deliver everything queued now (GUI thread)."""
+        self._scheduled = False  # Cleared before draining, so no entry is left behind
+        pending = self._pending
+        while pending:
+            batch = []
+            try:
+                while len(batch) < self.max_batch:
+                    batch.append(pending.popleft())
+            except IndexError:
+                pass
+            batch.sort(key=lambda entry: entry.seq)
+            self.logs_added.emit(batch)
+
+    def _on_wakeup(self) -> None:
+        if QCoreApplication.instance() is None:
+            # No event loop yet: keep the entries until one is running
+            self._scheduled = False
+            return
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if len(self._pending) >= self.max_batch:
+            self._timer.stop()
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start(self.max_delay_ms)
 
 _log_signaler = LogSignaler()
 
@@ -30,35 +118,48 @@ def get_log_signaler() -> LogSignaler:
 class _InMemoryHandler(logging.Handler):
     """Keeps a bounded list of the most recent log records."""
 
-    def __init__(self, max_entries: int = 200):
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
         super().__init__()
         self.buffer: Deque[LogEntry] = deque(maxlen=max_entries)
         self._lock = Lock()
+        self._seq = itertools.count(1)
 
     def emit(self, record: logging.LogRecord) -> None:
+        action = getattr(record, "action", "")
+        status = getattr(record, "status", "")
+        message = self.format(record)
+        details = getattr(record, "details", None)
         entry = LogEntry(
             timestamp=datetime.fromtimestamp(record.created),
             level=record.levelname,
-            action=getattr(record, "action", ""),
-            status=getattr(record, "status", ""),
-            message=self.format(record),
-            details=getattr(record, "details", None),
+            action=action,
+            status=status,
+            message=message,
+            details=details,
+            search_text=_search_text(message, action, status, details),
         )
         with self._lock:
+            entry.seq = next(self._seq)
             self.buffer.appendleft(entry)
         
-        # Emit signal safely
-        _log_signaler.log_added.emit(entry)
+        # Delivered to the GUI thread in batches
+        _log_signaler.post(entry)
 
     def snapshot(self) -> List[LogEntry]:
         with self._lock:
             return list(self.buffer)
 
+    def set_max_entries(self, max_entries: int) -> None:
+        """Resize the buffer, keeping the newest entries."""
+        with self._lock:
+            self.buffer = deque(self.buffer, maxlen=max(1, int(max_entries)))
+
 
 _LOGGER_NAME = "fwtool.ui"
 _logger: Optional[logging.Logger] = None
 _memory_handler: Optional[_InMemoryHandler] = None
 _file_handler: Optional[RotatingFileHandler] = None
+_max_entries = DEFAULT_MAX_ENTRIES
 
 
 def get_logger() -> logging.Logger:
@@ -67,7 +168,7 @@ def get_logger() -> logging.Logger:
         _logger = logging.getLogger(_LOGGER_NAME)
         _logger.setLevel(logging.INFO)
         _logger.propagate = False
-        _memory_handler = _InMemoryHandler()
+        _memory_handler = _InMemoryHandler(_max_entries)
         formatter = logging.Formatter(
             "%(asctime)s | %(levelname)s | %(action)s | %(status)s | %(message)s"
         )
@@ -108,6 +209,20 @@ def configure_file_logging(output_directory: str, filename: str = "fwtool.log")
     _file_handler = handler
 
 
+def set_log_capacity(max_entries: int) -> None:
+    """Set how many recent entries are kept in memory (and shown in the log screen)."""
+    global _max_entries
+    _max_entries = max(1, int(max_entries))
+    if _memory_handler is not None:
+        _memory_handler.set_max_entries(_max_entries)
+    _log_signaler.capacity_changed.emit(_max_entries)
+
+
+def get_log_capacity() -> int:
+    """How many recent entries are kept in memory."""
+    return _max_entries
+
+
 def _log(level: int, action: str, status: str, message: str, details: Optional[Dict] = None):
     logger = get_logger()
     logger.log(
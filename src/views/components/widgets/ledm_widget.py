@@ -34,6 +34,8 @@ class LEDMWidget(QWidget):
         
         self.checkboxes = {}
         self.rows = {}
+        self._pending = set()       # Endpoints of the current save not reported yet
+        self._pending_total = 0
         
         self._init_ui()
 
@@ -192,8 +194,49 @@ class LEDMWidget(QWidget):
         if not selected:
             self.error_occurred.emit("No endpoints selected")
             return
+        self._start_save_progress(selected)
         self.save_requested.emit(selected, variant)
 
+    # --- Per-endpoint progress ---
+
+    def _start_save_progress(self, endpoints):
+        """Track which endpoints of a save are still outstanding."""
+        self._pending = set(endpoints)
+        self._pending_total = len(endpoints)
+        for endpoint in endpoints:
+            self._set_row_result(endpoint, "pending", "")
+        self.save_btn.setText(f"Saving 0/{self._pending_total}...")
+
+    def show_endpoint_result(self, endpoint, content):
+        """Mark one endpoint as done as soon as its data arrives."""
+        failed = content.startswith("Error:")
+        self._set_row_result(endpoint, "error" if failed else "ok", content if failed else "")
+        pending = self._pending
+        if endpoint not in pending:
+            return
+        pending.discard(endpoint)
+        if pending:
+            done = self._pending_total - len(pending)
+            self.save_btn.setText(f"Saving {done}/{self._pending_total}...")
+        else:
+            self._update_selection_state()
+
+    def end_save_progress(self, *args):
+        """Stop showing save progress (e.g. after the fetch failed)."""
+        for endpoint in self._pending:
+            self._set_row_result(endpoint, "", "")
+        self._pending = set()
+        self._update_selection_state()
+
+    def _set_row_result(self, endpoint, result, tooltip):
+        row = self.rows.get(endpoint)
+        if not row:
+            return
+        row.path_lbl.setProperty("result", result)
+        row.path_lbl.setToolTip(tooltip)
+        row.path_lbl.style().unpolish(row.path_lbl)
+        row.path_lbl.style().polish(row.path_lbl)
+
     def _show_save_context_menu(self, pos):
         menu = QMenu(self)
         for variant in ["A", "B", "C", "D", "E", "F"]:
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QLineEdit, QFrame, QMenu
 )
-from PySide6.QtCore import Qt, Signal, QMetaObject, Q_ARG, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QSize
 from PySide6.QtGui import QPixmap, QImage, QAction
 from src.views.components.widgets.copy_button import CopyButton
 
@@ -25,6 +25,8 @@ class SiriusStreamWidget(QWidget):
         capture_requested(str): Capture type requested
         status_message(str): Status update
         error_occurred(str): Error message
+        visibility_changed(bool): Widget shown (True) or hidden (False)
+        display_resized(QSize): Image area resized (frames are pre-scaled to it)
     """
     
     view_toggled = Signal()
@@ -32,6 +34,8 @@ class SiriusStreamWidget(QWidget):
     capture_requested = Signal(str)
     status_message = Signal(str)
     error_occurred = Signal(str)
+    visibility_changed = Signal(bool)
+    display_resized = Signal(QSize)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -98,6 +102,7 @@ class SiriusStreamWidget(QWidget):
         self.image_label = QLabel("Remote UI Disconnected")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setObjectName("PlaceholderText")
+        self.image_label.installEventFilter(self)
         img_layout.addWidget(self.image_label)
         
         layout.addWidget(self.image_frame, 1)
@@ -145,32 +150,17 @@ class SiriusStreamWidget(QWidget):
         """Get the current password value."""
         return self.pwd_input.text()
     
-    def set_frame(self, image_data: bytes) -> None:
-        """Update display with new image data (thread-safe)."""
-        try:
-            image = QImage.fromData(image_data)
-            pixmap = QPixmap.fromImage(image)
-            
-            # Scale to fit
-            scaled = pixmap.scaled(
-                self.image_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            # Thread-safe update
-            QMetaObject.invokeMethod(
-                self.image_label, "setPixmap",
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(QPixmap, scaled)
-            )
-            QMetaObject.invokeMethod(
-                self.image_label, "setText",
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(str, "")
-            )
-        except Exception as e:
-            print(f"Image update error: {e}")
+    def set_frame(self, image: QImage) -> None:
+        """Show a frame (already decoded and scaled off the GUI thread)."""
+        if image.isNull():
+            return
+        self.image_label.setPixmap(QPixmap.fromImage(image))
+        self.image_label.setText("")
+    
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self.image_label and event.type() == QEvent.Type.Resize:
+            self.display_resized.emit(event.size())
+        return super().eventFilter(obj, event)
     
     def set_status(self, connected: bool, message: str = "") -> None:
         """Update connection status display."""
@@ -195,6 +185,14 @@ class SiriusStreamWidget(QWidget):
         self.connect_btn.setEnabled(False)
         self.connect_btn.setText("Connecting...")
     
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+    
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+    
     def cleanup(self) -> None:
         """Called when widget is being destroyed."""
         pass
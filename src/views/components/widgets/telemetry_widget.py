@@ -104,16 +104,7 @@ class TelemetryWidget(QWidget):
             is_dune_format (bool): Different extraction logic for Dune vs Trillium.
         """
         # 1. Clear existing cards
-        while self.cards_layout.count() > 1: # Keep stretch
-            item = self.cards_layout.takeAt(0)
-            widget = item.widget()
-            if not widget:
-                continue
-            if widget is self.empty_lbl:
-                widget.hide()
-                widget.setParent(None)
-            else:
-                widget.deleteLater()
+        self._clear_cards()
         
         if not events_data:
             self.cards_layout.insertWidget(0, self.empty_lbl)
@@ -124,20 +115,72 @@ class TelemetryWidget(QWidget):
         self.cards_layout.removeWidget(self.empty_lbl)
 
         # 2. Sort Data (Newest First) for all formats
-        def _seq_num(event):
-            try:
-                return int(event.get('sequenceNumber', 0) or 0)
-            except Exception:
-                return 0
-
         sorted_events = sorted(events_data, key=_seq_num, reverse=True)
 
         # 3. Create Cards
         for event in sorted_events:
-            card = TelemetryCard(event, is_dune_format)
-            
-            # Connect card signals to widget signals
-            card.view_details_requested.connect(self.view_details_requested.emit)
-            card.save_requested.connect(self.save_requested.emit)
-            
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
+            self.cards_layout.insertWidget(self.cards_layout.count() - 1, self._make_card(event, is_dune_format))
+
+    def add_event(self, event, is_dune_format=False):
+        """
+        Shows one event while a fetch is still running.
+        
+        The event is inserted into the cards shown, in newest-first order,
+        replacing the card of the same file if there is one. The final
+        populate_telemetry() call rebuilds the list from the complete result.
+        
+        Args:
+            event (dict): Telemetry event.
+            is_dune_format (bool): Different extraction logic for Dune vs Trillium.
+        """
+        if self.cards_layout.indexOf(self.empty_lbl) >= 0:
+            self.empty_lbl.hide()
+            self.cards_layout.removeWidget(self.empty_lbl)
+            self.empty_lbl.setParent(None)
+        
+        # A changed file replaces its old card
+        filename = event.get('filename')
+        if filename:
+            for index in range(self.cards_layout.count() - 1):
+                card = self.cards_layout.itemAt(index).widget()
+                if card.event_data.get('filename') == filename:
+                    self.cards_layout.removeWidget(card)
+                    card.deleteLater()
+                    break
+        
+        # Cards are newest first; insert before the first older one
+        seq = _seq_num(event)
+        index = 0
+        while index < self.cards_layout.count() - 1:
+            card = self.cards_layout.itemAt(index).widget()
+            if _seq_num(card.event_data) < seq:
+                break
+            index += 1
+        self.cards_layout.insertWidget(index, self._make_card(event, is_dune_format))
+
+    def _make_card(self, event, is_dune_format):
+        card = TelemetryCard(event, is_dune_format)
+        
+        # Connect card signals to widget signals
+        card.view_details_requested.connect(self.view_details_requested.emit)
+        card.save_requested.connect(self.save_requested.emit)
+        return card
+
+    def _clear_cards(self):
+        while self.cards_layout.count() > 1: # Keep stretch
+            item = self.cards_layout.takeAt(0)
+            widget = item.widget()
+            if not widget:
+                continue
+            if widget is self.empty_lbl:
+                widget.hide()
+                widget.setParent(None)
+            else:
+                widget.deleteLater()
+
+
+def _seq_num(event):
+    try:
+        return int(event.get('sequenceNumber', 0) or 0)
+    except Exception:
+        return 0
@@ -7,14 +7,20 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFrame, QSizePolicy, QToolButton, QMenu
 )
-from PySide6.QtCore import Qt, Signal, QSize, QPoint
-from PySide6.QtGui import QPixmap, QAction
+from typing import Optional
+
+from PySide6.QtCore import Qt, Signal, QSize, QPoint, QRect, QRectF
+from PySide6.QtGui import QAction, QImage, QPainter
 
 
 class InteractiveDisplay(QLabel):
     """
     Label that emits mouse events for VNC interaction.
     Handles scaling coordinates from display size to source size.
+    
+    Keeps the stream as one persistent QImage at source resolution and
+    paints it scaled to fit (never scaled up). Region updates patch the
+    image in place and repaint only the matching part of the widget.
     """
     
     mouse_event = Signal(str, int, int)  # type, x, y
@@ -27,40 +33,102 @@ class InteractiveDisplay(QLabel):
         self.source_size = QSize(800, 480)  # Default, updated when frame received
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMinimumSize(320, 240)
+        self._frame: Optional[QImage] = None
     
-    def set_pixmap(self, pixmap: QPixmap) -> None:
-        """Set the pixmap and update source size."""
-        self.setPixmap(pixmap)
-        if pixmap:
-            self.source_size = pixmap.size()
+    def set_image(self, image: QImage) -> None:
+        """Replace the whole frame and update source size."""
+        if image.isNull():
+            return
+        self._frame = image
+        self.source_size = image.size()
+        self.update()
     
-    def _map_to_source(self, pos) -> tuple:
-        """Map widget coordinates to source image coordinates."""
-        if not self.pixmap():
-            return 0, 0
+    def update_region(self, image: QImage, rect: QRect, frame_size: QSize) -> None:
+        """
+        Patch part of the frame and repaint just that area.
         
-        w_widget = self.width()
-        h_widget = self.height()
+        Args:
+            image: New pixels for the region
+            rect: Where the region sits in the frame
+            frame_size: Size of the whole frame
+        """
+        repaint_all = self._frame is None or self._frame.size() != frame_size
+        if image.size() == frame_size:
+            # Full update (first frame or resize): adopt it as the frame
+            self._frame = image
+        else:
+            if repaint_all:
+                self._frame = QImage(frame_size, QImage.Format.Format_RGB888)
+                self._frame.fill(Qt.GlobalColor.black)
+            painter = QPainter(self._frame)
+            painter.drawImage(rect.topLeft(), image)
+            painter.end()
+        
+        self.source_size = frame_size
+        if repaint_all:
+            self.update()
+        else:
+            # Smooth scaling blends neighbours, so grow the area by a pixel
+            self.update(self._map_from_source(rect).adjusted(-1, -1, 1, 1))
+    
+    def clear(self) -> None:
+        """Drop the frame."""
+        self._frame = None
+        super().clear()
+        self.update()
+    
+    def _display_rect(self) -> QRectF:
+        """Where the frame is drawn: fit to the widget, centred, never enlarged."""
         w_pix = self.source_size.width()
         h_pix = self.source_size.height()
+        scale = min(1.0, self.width() / w_pix, self.height() / h_pix)
+        actual_w = w_pix * scale
+        actual_h = h_pix * scale
+        return QRectF((self.width() - actual_w) / 2, (self.height() - actual_h) / 2,
+                      actual_w, actual_h)
+    
+    def _map_from_source(self, rect: QRect) -> QRect:
+        """Map a frame rectangle to widget coordinates."""
+        target = self._display_rect()
+        scale = target.width() / self.source_size.width()
+        return QRectF(target.x() + rect.x() * scale, target.y() + rect.y() * scale,
+                      rect.width() * scale, rect.height() * scale).toAlignedRect()
+    
+    def paintEvent(self, event) -> None:
+        if self._frame is None:
+            super().paintEvent(event)
+            return
+        
+        target = self._display_rect()
+        exposed = QRectF(event.rect()).intersected(target)
+        if exposed.isEmpty():
+            return
         
-        # Calculate scale (KeepAspectRatio behavior)
-        scale = min(w_widget / w_pix, h_widget / h_pix)
+        # Only scale the part of the frame behind the exposed area
+        scale = target.width() / self._frame.width()
+        source = QRectF((exposed.x() - target.x()) / scale, (exposed.y() - target.y()) / scale,
+                        exposed.width() / scale, exposed.height() / scale)
         
-        actual_w = int(w_pix * scale)
-        actual_h = int(h_pix * scale)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawImage(exposed, self._frame, source)
+        painter.end()
+    
+    def _map_to_source(self, pos) -> tuple:
+        """Map widget coordinates to source image coordinates."""
+        if self._frame is None:
+            return 0, 0
         
-        # Calculate offsets (centering)
-        x_off = (w_widget - actual_w) // 2
-        y_off = (h_widget - actual_h) // 2
+        target = self._display_rect()
+        scale = target.width() / self.source_size.width()
         
         # Map coordinates
-        x = int((pos.x() - x_off) / scale)
-        y = int((pos.y() - y_off) / scale)
+        x = int((pos.x() - target.x()) / scale)
+        y = int((pos.y() - target.y()) / scale)
         
         # Clamp to bounds
-        x = max(0, min(x, w_pix - 1))
-        y = max(0, min(y, h_pix - 1))
+        x = max(0, min(x, self.source_size.width() - 1))
+        y = max(0, min(y, self.source_size.height() - 1))
         
         return x, y
     
@@ -105,16 +173,17 @@ class VNCStreamWidget(QWidget):
         capture_requested(str): Capture type requested
         mouse_event(str, int, int): Mouse interaction (type, x, y)
         scroll_event(int): Scroll delta
+        visibility_changed(bool): Widget shown (True) or hidden (False)
     """
     
     view_toggled = Signal()
     rotation_changed = Signal(int)
     capture_requested = Signal(str)
+    visibility_changed = Signal(bool)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_rotation = 0
-        self.current_pixmap = None
         self._init_ui()
     
     def _init_ui(self) -> None:
@@ -224,32 +293,13 @@ class VNCStreamWidget(QWidget):
         
         self.btn_capture.setMenu(menu)
     
-    def set_frame(self, pixmap: QPixmap) -> None:
+    def set_frame(self, image: QImage) -> None:
         """Update the display with a new frame."""
-        self.current_pixmap = pixmap
-        self._update_display(pixmap)
+        self.display.set_image(image)
     
-    def _update_display(self, pixmap: QPixmap) -> None:
-        """Scale and display the pixmap."""
-        if not pixmap or pixmap.isNull():
-            return
-        
-        avail_size = self.display.size()
-        orig_size = pixmap.size()
-        
-        # Scale down if needed, but don't scale up
-        if (orig_size.width() > avail_size.width() or 
-            orig_size.height() > avail_size.height()):
-            scaled = pixmap.scaled(
-                avail_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        else:
-            scaled = pixmap
-        
-        self.display.setPixmap(scaled)
-        self.display.source_size = orig_size
+    def update_region(self, image: QImage, rect: QRect, frame_size: QSize) -> None:
+        """Patch the changed region of the current frame."""
+        self.display.update_region(image, rect, frame_size)
     
     def set_status(self, connected: bool, message: str = "") -> None:
         """Update connection status display."""
@@ -266,7 +316,6 @@ class VNCStreamWidget(QWidget):
             self.btn_view.setEnabled(True)
             self.btn_view.setChecked(True)
         else:
-            self.current_pixmap = None
             self.display.clear()
             self.lbl_status.setText(" ● Offline")
             self.lbl_status.setProperty("type", "default")
@@ -297,10 +346,14 @@ class VNCStreamWidget(QWidget):
         for btn in [self.btn_rot_left, self.btn_rot_right]:
             btn.setMinimumWidth(min_width)
             btn.setStyleSheet(f"font-size: {font_size};")
-        
-        # Re-scale pixmap
-        if self.current_pixmap:
-            self._update_display(self.current_pixmap)
+    
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+    
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
     
     # Expose display signals
     @property
@@ -39,8 +39,18 @@ from src.controllers.screens import (
 from src.controllers.strategies import DuneIICStrategy, DuneIPHStrategy
 
 # Utilities
-from src.services.config_service import ConfigManager
-from src.utils.logging.app_logger import configure_file_logging
+from src.services.config_service import ConfigManager, DEFAULT_WRITE_DELAY
+from src.services.http_pool import get_http_pool, DEFAULT_POOL_SIZE, DEFAULT_IDLE_TIMEOUT
+from src.services.fetch_engine import set_max_concurrency
+from src.services.stream_recorder import configure_recording
+from src.services.browser_pool import get_browser_pool
+from src.utils.logging.app_logger import (
+    configure_file_logging,
+    get_log_capacity,
+    get_log_signaler,
+    log_error,
+    set_log_capacity,
+)
 from src.version import VERSION
 
 
@@ -77,8 +87,9 @@ class MainWindow(QMainWindow):
         # Core Infrastructure
         # ---------------------------------------------------------------------
         
-        # Configuration Manager (file persistence)
+        # Configuration Manager (file persistence, saved in the background)
         self.config_manager = ConfigManager()
+        self._init_config_writes()
         
         # Application State (reactive model with signals)
         self.app_state = AppState()
@@ -86,6 +97,11 @@ class MainWindow(QMainWindow):
         # Thread Pool (shared across controllers)
         self.thread_pool = QThreadPool()
         
+        # Keep-alive HTTP sessions (shared by CDM/LEDM/Sirius services)
+        self._init_http_pool()
+        self._init_browser_pool()
+        self._init_stream_recording()
+        
         # ---------------------------------------------------------------------
         # Controllers (new architecture)
         # Each controller handles a specific domain of business logic
@@ -269,11 +285,72 @@ class MainWindow(QMainWindow):
             index = self.MENU_TAB_MAP[item]
             self.content_stack.setCurrentIndex(index)
         
+    def _init_http_pool(self):
+        """Apply configured pool size / idle timeout / fetch concurrency to the HTTP layer."""
+        try:
+            get_http_pool().configure(
+                pool_size=int(self.config_manager.get("http_pool_size", DEFAULT_POOL_SIZE)),
+                idle_timeout=float(self.config_manager.get("http_idle_timeout", DEFAULT_IDLE_TIMEOUT)),
+            )
+            # Unset: parallel endpoint fetches follow the pool size
+            set_max_concurrency(self.config_manager.get("fetch_max_concurrency"))
+        except (TypeError, ValueError):
+            pass
+    
+    def _init_browser_pool(self):
+        """Apply configured idle timeout / tab limit to the EWS capture browser."""
+        try:
+            # Headless browser for EWS captures closes after this much idle time,
+            # and loads at most ews_max_tabs pages at once
+            get_browser_pool().configure(
+                idle_timeout=self.config_manager.get("ews_browser_idle_timeout"),
+                max_tabs=self.config_manager.get("ews_max_tabs"),
+            )
+        except (TypeError, ValueError):
+            pass
+    
+    def _init_config_writes(self):
+        """Save settings write-behind so step clicks and IP typing don't block on disk."""
+        try:
+            delay = float(self.config_manager.get("config_write_delay", DEFAULT_WRITE_DELAY))
+        except (TypeError, ValueError):
+            delay = DEFAULT_WRITE_DELAY
+        self.config_manager.enable_write_behind(delay)
+    
+    def _init_stream_recording(self):
+        """Apply configured history length / memory cap to stream recorders."""
+        try:
+            configure_recording(
+                retention_seconds=self.config_manager.get("stream_recording_seconds"),
+                memory_cap_mb=self.config_manager.get("stream_recording_memory_mb"),
+            )
+        except (TypeError, ValueError):
+            pass
+    
     def _init_logging(self):
         """Ensure file logging targets the application root directory."""
         # Always save logs to where the program is located (current working directory)
         log_dir = os.getcwd()
         configure_file_logging(log_dir)
+        # Entries kept in memory for the log screen
+        try:
+            set_log_capacity(int(self.config_manager.get("log_max_entries", get_log_capacity())))
+            # New entries reach the log screen in batches of at most
+            # log_batch_size, at most log_batch_delay_ms after being logged
+            get_log_signaler().configure(
+                max_batch=self.config_manager.get("log_batch_size"),
+                max_delay_ms=self.config_manager.get("log_batch_delay_ms"),
+            )
+        except (TypeError, ValueError):
+            pass
+
+    def closeEvent(self, event):
+        """Save pending settings before the window goes away."""
+        try:
+            self.config_manager.flush()
+        except Exception as e:
+            log_error("config.save", "failed", str(e))
+        super().closeEvent(event)
 
     def resizeEvent(self, event):
         """Reposition toast when window resizes"""
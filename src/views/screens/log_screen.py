@@ -13,14 +13,22 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
+    QHeaderView,
     QVBoxLayout,
 )
-from PySide6.QtCore import Qt, Signal
-from src.utils.logging.app_logger import clear_recent_logs, get_recent_logs, get_log_signaler
+from PySide6.QtCore import QTimer, Signal
+from src.models.log_model import LogFilterModel, LogTableModel
+from src.utils.logging.app_logger import (
+    clear_recent_logs,
+    get_log_capacity,
+    get_recent_logs,
+    get_log_signaler,
+)
 import json
 
+SEARCH_DEBOUNCE_MS = 200  # Wait for typing to pause before filtering
+
 
 class LogScreen(QWidget):
     """
@@ -36,15 +44,22 @@ class LogScreen(QWidget):
         
         self.is_visible = False
         
+        # Log store and its filtered view
+        self.log_model = LogTableModel(get_log_capacity(), self)
+        self.filter_model = LogFilterModel(self.log_model, self)
+        
         # Build the layout
         self._init_layout()
         
         # Connect signals
         self._connect_signals()
         
-        # Connect to Logger Bridge
+        # Connect to Logger Bridge, then load what was logged before
+        # (entries seen twice are skipped by the model)
         self.log_signaler = get_log_signaler()
-        self.log_signaler.log_added.connect(self._on_new_log_entry)
+        self.log_signaler.logs_added.connect(self._on_new_log_entries)
+        self.log_signaler.capacity_changed.connect(self.log_model.set_max_entries)
+        self._populate_initial_logs()
     
     def _init_layout(self):
         """Initialize the log viewer layout."""
@@ -80,13 +95,19 @@ class LogScreen(QWidget):
         
         card_layout.addLayout(controls)
         
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(4)
-        self.tree.setHeaderLabels(["Time", "Level", "Action", "Message"])
+        self.tree = QTreeView()
+        self.tree.setModel(self.filter_model)
         self.tree.setRootIsDecorated(False)
         self.tree.setAlternatingRowColors(True)
+        self.tree.setUniformRowHeights(True)
+        self.tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.tree.header().setStretchLastSection(True)
         card_layout.addWidget(self.tree, 2)
         
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        
         self.detail_box = QTextEdit()
         self.detail_box.setReadOnly(True)
         self.detail_box.setFixedHeight(160)
@@ -98,87 +119,37 @@ class LogScreen(QWidget):
     def _connect_signals(self):
         """Connect internal signals."""
         self.clear_btn.clicked.connect(self._clear_log)
-        self.level_filter.currentIndexChanged.connect(self._populate_initial_logs)
-        self.search_box.textChanged.connect(self._populate_initial_logs)
-        self.tree.itemSelectionChanged.connect(self._update_detail_panel)
+        self.level_filter.currentIndexChanged.connect(self._apply_filter)
+        self.search_box.textChanged.connect(self.search_timer.start)
+        self.search_timer.timeout.connect(self._apply_filter)
+        self.tree.selectionModel().currentRowChanged.connect(self._update_detail_panel)
     
     def _populate_initial_logs(self):
-        """Rebuilds the whole list (e.g. on filter change or show)."""
-        self.tree.setUpdatesEnabled(False)
-        self.tree.clear()
-        self.detail_box.clear()
-        
-        entries = get_recent_logs()
-        
-        for entry in entries:
-            if self._should_show(entry):
-                self._add_tree_item(entry)
-        
-        self._resize_columns()
-        self.tree.setUpdatesEnabled(True)
-    
-    def _on_new_log_entry(self, entry):
-        """Called incrementally when a log occurs."""
-        if not self._should_show(entry):
-            return
-        
-        # Add to top
-        self._add_tree_item(entry, index=0)
+        """Load the entries logged so far (newest first in the buffer)."""
+        self.log_model.reset_entries(get_recent_logs()[::-1])
         self._resize_columns()
     
-    def _add_tree_item(self, entry, index=None):
-        """Add a log entry to the tree widget."""
-        item = QTreeWidgetItem(
-            [
-                entry.timestamp.strftime("%H:%M:%S"),
-                entry.level,
-                entry.action or entry.status,
-                entry.message,
-            ]
-        )
-        item.setData(0, Qt.ItemDataRole.UserRole, entry)
-        
-        if index is not None:
-            self.tree.insertTopLevelItem(index, item)
-        else:
-            self.tree.addTopLevelItem(item)
+    def _on_new_log_entries(self, entries):
+        """Called with each batch of new log entries (oldest first)."""
+        self.log_model.append_entries(entries)
     
-    def _should_show(self, entry):
-        """Determine if an entry should be displayed based on filters."""
-        level_filter = self.level_filter.currentText().lower()
-        query = self.search_box.text().lower().strip()
-        
-        if level_filter != "all" and entry.level.lower() != level_filter:
-            return False
-        
-        if query:
-            text_blob = " ".join(
-                [
-                    entry.message.lower(),
-                    entry.action.lower(),
-                    entry.status.lower(),
-                    json.dumps(entry.details, default=str).lower() if entry.details else "",
-                ]
-            )
-            if query not in text_blob:
-                return False
-        
-        return True
+    def _apply_filter(self):
+        """Filter by the selected level and search text."""
+        self.search_timer.stop()
+        self.filter_model.set_filter(self.level_filter.currentText(), self.search_box.text())
+        self.detail_box.clear()
+        self._resize_columns()
     
     def _resize_columns(self):
-        """Resize tree columns to fit content."""
+        """Resize tree columns to fit content (visible rows only)."""
         self.tree.resizeColumnToContents(0)
         self.tree.resizeColumnToContents(1)
         self.tree.resizeColumnToContents(2)
     
-    def _update_detail_panel(self):
+    def _update_detail_panel(self, current=None, previous=None):
         """Update the detail panel when a log entry is selected."""
-        selected = self.tree.selectedItems()
-        if not selected:
-            self.detail_box.clear()
-            return
-        
-        entry = selected[0].data(0, Qt.ItemDataRole.UserRole)
+        index = self.tree.currentIndex()
+        entry = self.filter_model.entry(index.row()) if index.isValid() else None
         if not entry:
             self.detail_box.clear()
             return
@@ -206,7 +177,7 @@ class LogScreen(QWidget):
     def _clear_log(self):
         """Clear all log entries."""
         clear_recent_logs()
-        self.tree.clear()
+        self.log_model.clear()
         self.detail_box.clear()
     
     # === Lifecycle Methods ===
@@ -225,8 +196,9 @@ class LogScreen(QWidget):
     
     def on_show(self):
         """Called when the screen becomes visible."""
-        # Refresh logs when shown to ensure we have the latest
-        self._populate_initial_logs()
+        # The model follows the log signal while hidden; only column widths
+        # may need catching up
+        self._resize_columns()
     
     def on_hide(self):
         """Called when the screen is hidden."""
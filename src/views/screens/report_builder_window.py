@@ -6,7 +6,7 @@ from PySide6.QtGui import QPixmap, QPainter, QColor, QIcon, QAction, QTextFormat
 from PySide6.QtWidgets import QSizePolicy
 import os
 from src.services.config_service import ConfigManager
-from src.controllers.report_controller import ReportBuilder
+from src.controllers.report_controller import ReportBuilder, REPORT_CATEGORIES
 
 # Custom FlowLayout for Alerts (No longer used for alert items, but kept if needed for other layouts or future)
 class FlowLayout(QLayout):
@@ -522,17 +522,7 @@ class ReportBuilderWindow(QMainWindow):
         controls_layout.addWidget(lbl_cats)
         
         # Defined Categories
-        self.cat_map = {
-            "UI": "UI", 
-            "EWS": "EWS", 
-            "Alerts": "alerts", 
-            "Supplies Public": "suppliesPublic", 
-            "Supplies Private": "suppliesPrivate", 
-            "Supply Assessment": "supplyAssessment", 
-            "Telemetry": "Telemetry", 
-            "Reports": "Reports", 
-            "DSR Packet": "DSR Packet",
-        }
+        self.cat_map = dict(REPORT_CATEGORIES)
         
         # Add dynamic Tap category based on strategy
         tap_label = "63-Tap" # Default
@@ -994,19 +984,7 @@ class ReportBuilderWindow(QMainWindow):
                     active_cats_display_names.append("Telemetry")
 
             # 4. Build Header String
-            header_str = ""
-            if active_cats_display_names:
-                if len(active_cats_display_names) == 1:
-                    header_str = f"{active_cats_display_names[0]} was correct and to spec."
-                elif len(active_cats_display_names) == 2:
-                    header_str = (
-                        f"{active_cats_display_names[0]} and {active_cats_display_names[1]} were correct and to spec."
-                    )
-                else:
-                    last = active_cats_display_names.pop()
-                    header_str = f"{', '.join(active_cats_display_names)}, and {last} were correct and to spec."
-            else:
-                header_str = "Nothing selected."
+            header_str = ReportBuilder.summary_sentence(active_cats_display_names)
 
             # 5. Generate Body
             body = builder.generate_report(selected_categories, colors, selected_alerts=None)